@@ -0,0 +1,57 @@
+"""
+JSON renderer backed by orjson when it is installed.
+
+Falls back to DRF's stdlib-based JSONRenderer when orjson is missing or when
+the client asks for output orjson cannot produce (e.g. custom indentation).
+"""
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_encoder = JSONEncoder()
+
+
+def _default(obj):
+    """Encode types orjson does not handle natively the same way DRF does"""
+    return _encoder.default(obj)
+
+
+def json_dumps(data):
+    """
+    Serialize data to compact UTF-8 JSON bytes
+
+    Args:
+        data: Python object to serialize
+
+    Returns:
+        bytes: Encoded JSON document
+    """
+    if orjson is not None:
+        # Let DRF's encoder format datetimes so output matches JSONRenderer
+        return orjson.dumps(
+            data,
+            default=_default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        )
+    return JSONRenderer().render(data)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer that uses orjson for compact output when available"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render data into JSON, returning a bytestring"""
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # orjson only supports compact output, so indented requests go to DRF
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return json_dumps(data)
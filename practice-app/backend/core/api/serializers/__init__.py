@@ -6,4 +6,6 @@ from .review_serializers import *
 from .bookmark_serializers import *
 from .notification_serializers import *
 from .photo_serializers import *
-from .comment_serializers import *
\ No newline at end of file
+from .comment_serializers import *
+from .tag_serializers import *
+from .report_serializers import *
\ No newline at end of file
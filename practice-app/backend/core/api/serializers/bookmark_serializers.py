@@ -1,7 +1,8 @@
 from rest_framework import serializers
-from core.models import Bookmark, BookmarkTag, Tag
+from core.models import Bookmark, BookmarkTag
 from .task_serializers import TaskSerializer
 from .user_serializers import UserSerializer
+from .mixins import TaskReferenceMixin
 
 
 class BookmarkSerializer(serializers.ModelSerializer):
@@ -16,7 +17,7 @@ class BookmarkSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'user', 'task', 'timestamp', 'tags']
 
 
-class BookmarkCreateSerializer(serializers.ModelSerializer):
+class BookmarkCreateSerializer(TaskReferenceMixin, serializers.ModelSerializer):
     """Serializer for creating a new bookmark"""
     task_id = serializers.IntegerField(write_only=True)
     tag_names = serializers.ListField(
@@ -29,34 +30,20 @@ class BookmarkCreateSerializer(serializers.ModelSerializer):
         model = Bookmark
         fields = ['task_id', 'tag_names']
     
-    def validate_task_id(self, value):
-        """Validate task exists"""
-        from core.models import Task
-        
-        try:
-            Task.objects.get(id=value)
-            return value
-        except Task.DoesNotExist:
-            raise serializers.ValidationError("Task not found.")
-    
     def create(self, validated_data):
         """Create a new bookmark using the model method"""
-        from core.models import Task
-        
         # Get the user from the context
         user = self.context['request'].user
         
-        # Get the task
-        task = Task.objects.get(id=validated_data.pop('task_id'))
+        # Get the task resolved during validation
+        task = validated_data.pop('task_id')
         
         # Create the bookmark
         bookmark = Bookmark.add_bookmark(user=user, task=task)
         
         # Add tags if provided
-        if 'tag_names' in validated_data and validated_data['tag_names']:
-            for tag_name in validated_data['tag_names']:
-                tag = Tag.create_tag(tag_name)
-                bookmark.add_tag(tag)
+        if validated_data.get('tag_names'):
+            bookmark.add_tags(validated_data['tag_names'])
         
         return bookmark
 
@@ -85,18 +72,11 @@ class BookmarkUpdateSerializer(serializers.Serializer):
     def update(self, instance, validated_data):
         """Update bookmark tags"""
         # Add tags
-        if 'add_tags' in validated_data and validated_data['add_tags']:
-            for tag_name in validated_data['add_tags']:
-                tag = Tag.create_tag(tag_name)
-                instance.add_tag(tag)
+        if validated_data.get('add_tags'):
+            instance.add_tags(validated_data['add_tags'])
         
-        # Remove tags
-        if 'remove_tags' in validated_data and validated_data['remove_tags']:
-            for tag_name in validated_data['remove_tags']:
-                try:
-                    tag = Tag.objects.get(name=tag_name.lower())
-                    instance.tags.remove(tag)
-                except Tag.DoesNotExist:
-                    pass  # Ignore if tag doesn't exist
+        # Remove tags, ignoring the ones that don't exist
+        if validated_data.get('remove_tags'):
+            instance.remove_tags(validated_data['remove_tags'])
         
         return instance
\ No newline at end of file
@@ -1,53 +1,92 @@
 from rest_framework import serializers
 from core.models import Comment
+from core.models.comment import MAX_COMMENT_DEPTH
 from .user_serializers import UserSerializer
-from .task_serializers import TaskSerializer
+from .task_serializers import TaskSerializer, build_included
+from .mixins import TaskReferenceMixin
 
 
 class CommentSerializer(serializers.ModelSerializer):
     """Serializer for Comment model"""
     user = UserSerializer(read_only=True)
     task = TaskSerializer(read_only=True)
+    parent_id = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = Comment
-        fields = ['id', 'content', 'timestamp', 'user', 'task']
-        read_only_fields = ['id', 'timestamp', 'user', 'task']
+        fields = ['id', 'content', 'timestamp', 'user', 'task', 'parent_id', 'depth', 'reply_count']
+        read_only_fields = ['id', 'timestamp', 'user', 'task', 'parent_id', 'depth', 'reply_count']
 
 
-class CommentCreateSerializer(serializers.ModelSerializer):
-    """Serializer for creating a new comment"""
+class CommentReferenceSerializer(CommentSerializer):
+    """Serializer for Comment model referring to its user and task by id"""
+    user_id = serializers.IntegerField(read_only=True)
+    task_id = serializers.IntegerField(read_only=True)
+    user = None
+    task = None
+    
+    class Meta(CommentSerializer.Meta):
+        fields = ['id', 'content', 'timestamp', 'user_id', 'task_id', 'parent_id', 'depth', 'reply_count']
+        read_only_fields = ['id', 'timestamp', 'user_id', 'task_id', 'parent_id', 'depth', 'reply_count']
+
+
+def serialize_comments(comments, normalize=False):
+    """
+    Serialize a page of comments
+    
+    Args:
+        comments: Comments to serialize
+        normalize: Refer to users and tasks by id and side-load them once
+        
+    Returns:
+        tuple: (serialized comments, included map or None)
+    """
+    if not normalize:
+        return CommentSerializer(comments, many=True).data, None
+    comments = list(comments)
+    included = build_included(
+        task_ids=[comment.task_id for comment in comments],
+        user_ids=[comment.user_id for comment in comments]
+    )
+    return CommentReferenceSerializer(comments, many=True).data, included
+
+
+class CommentCreateSerializer(TaskReferenceMixin, serializers.ModelSerializer):
+    """Serializer for creating a new comment or a reply to one"""
     task_id = serializers.IntegerField(write_only=True)
+    parent_id = serializers.IntegerField(write_only=True, required=False, allow_null=True)
     
     class Meta:
         model = Comment
-        fields = ['content', 'task_id']
+        fields = ['content', 'task_id', 'parent_id']
     
-    def validate_task_id(self, value):
-        """Validate task exists"""
-        from core.models import Task
-        
-        try:
-            Task.objects.get(id=value)
-            return value
-        except Task.DoesNotExist:
-            raise serializers.ValidationError("Task not found.")
+    def validate(self, attrs):
+        """Resolve the parent comment, which must belong to the same task"""
+        parent_id = attrs.get('parent_id')
+        if parent_id is None:
+            return attrs
+        parent = Comment.objects.filter(id=parent_id).first()
+        if parent is None or parent.task_id != attrs['task_id'].id:
+            raise serializers.ValidationError({'parent_id': 'Comment not found on this task.'})
+        if parent.depth + 1 >= MAX_COMMENT_DEPTH:
+            raise serializers.ValidationError({'parent_id': 'Replies are nested too deeply.'})
+        attrs['parent_id'] = parent
+        return attrs
     
     def create(self, validated_data):
         """Create a new comment using the model method"""
-        from core.models import Task
-        
         # Get the user from the context
         user = self.context['request'].user
         
-        # Get the task
-        task = Task.objects.get(id=validated_data.pop('task_id'))
+        # Get the task resolved during validation
+        task = validated_data.pop('task_id')
         
         # Use the model method to add a comment
         comment = Comment.add_comment(
             user=user,
             task=task,
-            content=validated_data['content']
+            content=validated_data['content'],
+            parent=validated_data.get('parent_id')
         )
         
         return comment
@@ -0,0 +1,36 @@
+from rest_framework import serializers
+from core.models import Task
+
+
+class TaskReferenceMixin:
+    """
+    Resolve a write serializer's task_id to its Task once
+    
+    A view that has already loaded the task passes it in the serializer
+    context as 'task'; otherwise it is loaded here with the relations in
+    task_select_related. validate_task_id returns the Task itself, so
+    validation and create() work on the same instance without fetching it again.
+    """
+    task_select_related = ('creator', 'assignee')
+    
+    def resolve_task(self, task_id):
+        """
+        Get the referenced task
+        
+        Args:
+            task_id: ID of the task
+            
+        Returns:
+            Task: The task from the context or the database
+        """
+        task = self.context.get('task')
+        if task is not None and task.id == task_id:
+            return task
+        task = Task.objects.select_related(*self.task_select_related).filter(id=task_id).first()
+        if task is None:
+            raise serializers.ValidationError("Task not found.")
+        return task
+    
+    def validate_task_id(self, value):
+        """Validate task exists"""
+        return self.resolve_task(value)
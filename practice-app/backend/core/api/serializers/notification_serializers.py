@@ -1,7 +1,7 @@
 from rest_framework import serializers
 from core.models import Notification, NotificationType
 from .user_serializers import UserSerializer
-from .task_serializers import TaskSerializer
+from .task_serializers import TaskSerializer, build_included
 
 
 class NotificationSerializer(serializers.ModelSerializer):
@@ -13,15 +13,50 @@ class NotificationSerializer(serializers.ModelSerializer):
     class Meta:
         model = Notification
         fields = ['id', 'content', 'timestamp', 'type', 'type_display', 
-                 'is_read', 'user', 'related_task']
+                 'is_read', 'count', 'user', 'related_task']
         read_only_fields = ['id', 'content', 'timestamp', 'type', 
-                           'type_display', 'user', 'related_task']
+                           'type_display', 'count', 'user', 'related_task']
     
     def get_type_display(self, obj):
         """Get the display name for the notification type"""
         return dict(NotificationType.choices)[obj.type]
 
 
+class NotificationReferenceSerializer(NotificationSerializer):
+    """Serializer for Notification model referring to its user and task by id"""
+    user_id = serializers.IntegerField(read_only=True)
+    related_task_id = serializers.IntegerField(read_only=True)
+    user = None
+    related_task = None
+    
+    class Meta(NotificationSerializer.Meta):
+        fields = ['id', 'content', 'timestamp', 'type', 'type_display', 
+                 'is_read', 'count', 'user_id', 'related_task_id']
+        read_only_fields = ['id', 'content', 'timestamp', 'type', 
+                           'type_display', 'count', 'user_id', 'related_task_id']
+
+
+def serialize_notifications(notifications, normalize=False):
+    """
+    Serialize a page of notifications
+    
+    Args:
+        notifications: Notifications to serialize
+        normalize: Refer to users and tasks by id and side-load them once
+        
+    Returns:
+        tuple: (serialized notifications, included map or None)
+    """
+    if not normalize:
+        return NotificationSerializer(notifications, many=True).data, None
+    notifications = list(notifications)
+    included = build_included(
+        task_ids=[notification.related_task_id for notification in notifications],
+        user_ids=[notification.user_id for notification in notifications]
+    )
+    return NotificationReferenceSerializer(notifications, many=True).data, included
+
+
 class NotificationCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating a new notification"""
     user_id = serializers.IntegerField(write_only=True)
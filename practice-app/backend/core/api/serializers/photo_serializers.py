@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from core.models import Photo
 from .task_serializers import TaskSerializer
+from .mixins import TaskReferenceMixin
 
 
 class PhotoSerializer(serializers.ModelSerializer):
@@ -13,7 +14,7 @@ class PhotoSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'uploaded_at', 'task']
 
 
-class PhotoCreateSerializer(serializers.ModelSerializer):
+class PhotoCreateSerializer(TaskReferenceMixin, serializers.ModelSerializer):
     """Serializer for creating a new photo"""
     task_id = serializers.IntegerField(write_only=True)
     
@@ -23,26 +24,19 @@ class PhotoCreateSerializer(serializers.ModelSerializer):
     
     def validate_task_id(self, value):
         """Validate task exists"""
-        from core.models import Task
+        task = self.resolve_task(value)
         
-        try:
-            task = Task.objects.get(id=value)
+        # Check if user is the task creator
+        request = self.context.get('request')
+        if request and request.user.id != task.creator_id:
+            raise serializers.ValidationError("You can only add photos to your own tasks.")
             
-            # Check if user is the task creator
-            request = self.context.get('request')
-            if request and request.user != task.creator:
-                raise serializers.ValidationError("You can only add photos to your own tasks.")
-                
-            return value
-        except Task.DoesNotExist:
-            raise serializers.ValidationError("Task not found.")
+        return task
     
     def create(self, validated_data):
         """Create a new photo using the model method"""
-        from core.models import Task
-        
-        # Get the task
-        task = Task.objects.get(id=validated_data.pop('task_id'))
+        # Get the task resolved during validation
+        task = validated_data.pop('task_id')
         
         # Use the model method to upload the photo
         photo = Photo.upload_photo(
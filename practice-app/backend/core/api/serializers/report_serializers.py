@@ -0,0 +1,48 @@
+from rest_framework import serializers
+from core.models import Report, ReportTarget, ReportTargetType
+
+
+class ReportSerializer(serializers.ModelSerializer):
+    """Serializer for Report model"""
+    reporter_id = serializers.IntegerField(read_only=True)
+    
+    class Meta:
+        model = Report
+        fields = ['id', 'reporter_id', 'target_type', 'target_id', 'reason', 'created_at']
+        read_only_fields = ['id', 'reporter_id', 'target_type', 'target_id', 'reason', 'created_at']
+
+
+class ReportCreateSerializer(serializers.Serializer):
+    """Serializer for reporting a user, task, comment or review"""
+    target_type = serializers.ChoiceField(choices=ReportTargetType.choices)
+    target_id = serializers.IntegerField(min_value=1)
+    reason = serializers.CharField(max_length=1000)
+    
+    def validate(self, attrs):
+        """Resolve the reported object, which must exist and not be the reporter's own"""
+        target = Report.get_target(attrs['target_type'], attrs['target_id'])
+        if target is None:
+            raise serializers.ValidationError({'target_id': 'Reported object not found.'})
+        if Report.responsible_user_id(target) == self.context['request'].user.id:
+            raise serializers.ValidationError({'target_id': 'You cannot report yourself or your own content.'})
+        attrs['target'] = target
+        return attrs
+    
+    def create(self, validated_data):
+        """File the report, noting whether it is new"""
+        report, self.created = Report.file_report(
+            reporter=self.context['request'].user,
+            target=validated_data['target'],
+            reason=validated_data['reason']
+        )
+        return report
+
+
+class ReportTargetSerializer(serializers.ModelSerializer):
+    """Serializer for the report aggregates of a reported object"""
+    user_id = serializers.IntegerField(read_only=True)
+    
+    class Meta:
+        model = ReportTarget
+        fields = ['target_type', 'target_id', 'user_id', 'report_count', 'last_reported_at', 'last_reason']
+        read_only_fields = fields
@@ -1,6 +1,7 @@
 from rest_framework import serializers
-from core.models import Review, Task
+from core.models import Review
 from .user_serializers import UserSerializer
+from .mixins import TaskReferenceMixin
 
 
 class ReviewSerializer(serializers.ModelSerializer):
@@ -14,7 +15,7 @@ class ReviewSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'timestamp', 'reviewer', 'reviewee', 'task']
 
 
-class ReviewCreateSerializer(serializers.ModelSerializer):
+class ReviewCreateSerializer(TaskReferenceMixin, serializers.ModelSerializer):
     """Serializer for creating a new review"""
     reviewee_id = serializers.IntegerField(write_only=True)
     task_id = serializers.IntegerField(write_only=True)
@@ -28,20 +29,18 @@ class ReviewCreateSerializer(serializers.ModelSerializer):
         # Get the user from the context
         reviewer = self.context['request'].user
         
-        # Get the reviewee
+        # Get the reviewee, unless the view already loaded it
         reviewee_id = data.pop('reviewee_id')
-        from core.models import RegisteredUser
-        try:
-            reviewee = RegisteredUser.objects.get(id=reviewee_id)
-        except RegisteredUser.DoesNotExist:
-            raise serializers.ValidationError({"reviewee_id": "Reviewee not found."})
+        reviewee = self.context.get('reviewee')
+        if reviewee is None or reviewee.id != reviewee_id:
+            from core.models import RegisteredUser
+            try:
+                reviewee = RegisteredUser.objects.get(id=reviewee_id)
+            except RegisteredUser.DoesNotExist:
+                raise serializers.ValidationError({"reviewee_id": "Reviewee not found."})
         
-        # Get the task
-        task_id = data.pop('task_id')
-        try:
-            task = Task.objects.get(id=task_id)
-        except Task.DoesNotExist:
-            raise serializers.ValidationError({"task_id": "Task not found."})
+        # Get the task resolved by validate_task_id
+        task = data.pop('task_id')
         
         # Store these for use in create method
         data['reviewee'] = reviewee
@@ -0,0 +1,11 @@
+from rest_framework import serializers
+from core.models import Tag
+
+
+class TagSerializer(serializers.ModelSerializer):
+    """Serializer for Tag model"""
+    
+    class Meta:
+        model = Tag
+        fields = ['id', 'name', 'usage_count']
+        read_only_fields = ['id', 'name', 'usage_count']
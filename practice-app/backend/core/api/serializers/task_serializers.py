@@ -1,5 +1,6 @@
 from rest_framework import serializers
-from core.models import Task, TaskCategory, TaskStatus
+from core.models import RegisteredUser, Task, TaskCategory, TaskStatus, RecurrenceRule
+from django.conf import settings
 from django.utils import timezone
 from .user_serializers import UserSerializer
 
@@ -16,9 +17,11 @@ class TaskSerializer(serializers.ModelSerializer):
         fields = ['id', 'title', 'description', 'category', 'category_display',
                   'location', 'deadline', 'requirements', 'urgency_level', 
                   'volunteer_number', 'status', 'status_display', 'is_recurring',
-                  'creator', 'assignee', 'created_at', 'updated_at']
+                  'parent_task', 'creator', 'assignee', 'comment_count', 'volunteer_count',
+                  'bookmark_count', 'photo_count', 'created_at', 'updated_at']
         read_only_fields = ['id', 'created_at', 'updated_at', 'status_display',
-                           'category_display', 'creator', 'assignee']
+                           'category_display', 'parent_task', 'creator', 'assignee',
+                           'comment_count', 'volunteer_count', 'bookmark_count', 'photo_count']
     
     def get_status_display(self, obj):
         """Get the display name for the status"""
@@ -29,6 +32,54 @@ class TaskSerializer(serializers.ModelSerializer):
         return dict(TaskCategory.choices)[obj.category]
 
 
+class TaskReferenceSerializer(TaskSerializer):
+    """Serializer for Task model referring to its users by id"""
+    creator_id = serializers.IntegerField(read_only=True)
+    assignee_id = serializers.IntegerField(read_only=True)
+    creator = None
+    assignee = None
+    
+    class Meta(TaskSerializer.Meta):
+        fields = ['id', 'title', 'description', 'category', 'category_display',
+                  'location', 'deadline', 'requirements', 'urgency_level', 
+                  'volunteer_number', 'status', 'status_display', 'is_recurring',
+                  'parent_task', 'creator_id', 'assignee_id', 'comment_count', 'volunteer_count',
+                  'bookmark_count', 'photo_count', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'created_at', 'updated_at', 'status_display',
+                           'category_display', 'parent_task', 'creator_id', 'assignee_id',
+                           'comment_count', 'volunteer_count', 'bookmark_count', 'photo_count']
+
+
+def build_included(task_ids=(), user_ids=()):
+    """
+    Side-load the tasks and users referenced by a normalized payload
+    
+    Each task and user is fetched and serialized once, however many items
+    refer to it. Users referenced by the included tasks are included too.
+    
+    Args:
+        task_ids: Referenced task ids (None entries are ignored)
+        user_ids: Referenced user ids (None entries are ignored)
+        
+    Returns:
+        dict: {'tasks': {id: task}, 'users': {id: user}}
+    """
+    task_ids = {task_id for task_id in task_ids if task_id is not None}
+    tasks = Task.objects.in_bulk(task_ids) if task_ids else {}
+    
+    user_ids = {user_id for user_id in user_ids if user_id is not None}
+    for task in tasks.values():
+        user_ids.add(task.creator_id)
+        if task.assignee_id is not None:
+            user_ids.add(task.assignee_id)
+    users = RegisteredUser.objects.in_bulk(user_ids) if user_ids else {}
+    
+    return {
+        'tasks': {task_id: TaskReferenceSerializer(task).data for task_id, task in tasks.items()},
+        'users': {user_id: UserSerializer(user).data for user_id, user in users.items()}
+    }
+
+
 class TaskCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating a new task"""
     class Meta:
@@ -58,6 +109,66 @@ class TaskCreateSerializer(serializers.ModelSerializer):
         return task
 
 
+class TaskImportRowSerializer(TaskCreateSerializer):
+    """Serializer for validating a single row of a bulk task import"""
+    tags = serializers.ListField(
+        child=serializers.CharField(max_length=50),
+        required=False,
+        default=list
+    )
+    
+    class Meta(TaskCreateSerializer.Meta):
+        fields = TaskCreateSerializer.Meta.fields + ['tags']
+
+
+class TaskBulkImportSerializer(serializers.Serializer):
+    """
+    Serializer for importing many tasks at once
+    
+    Each row is validated on its own, so invalid rows are reported in
+    'errors' while the valid rows are still imported.
+    """
+    tasks = serializers.ListField(child=serializers.DictField(), allow_empty=False)
+    
+    def validate_tasks(self, value):
+        """Validate the number of rows in the import"""
+        max_rows = settings.TASK_IMPORT_MAX_ROWS
+        if len(value) > max_rows:
+            raise serializers.ValidationError(f"Cannot import more than {max_rows} tasks at once.")
+        return value
+    
+    def create(self, validated_data):
+        """Validate each row and bulk insert the valid ones"""
+        creator = self.context['creator']
+        chunk_size = self.context.get('chunk_size', settings.TASK_IMPORT_CHUNK_SIZE)
+        
+        valid_rows = []
+        row_numbers = []
+        errors = []
+        for row_number, row in enumerate(validated_data['tasks'], start=1):
+            row_serializer = TaskImportRowSerializer(data=row)
+            if row_serializer.is_valid():
+                valid_rows.append(row_serializer.validated_data)
+                row_numbers.append(row_number)
+            else:
+                errors.append({'row': row_number, 'errors': row_serializer.errors})
+        
+        created, failed = Task.bulk_import(creator, valid_rows, chunk_size=chunk_size)
+        
+        errors.extend(
+            {'row': row_numbers[position], 'errors': {'non_field_errors': [message]}}
+            for position, message in failed
+        )
+        errors.sort(key=lambda error: error['row'])
+        
+        return {
+            'created': len(created),
+            'failed': len(errors),
+            'task_ids': [task.id for position, task in created],
+            'errors': errors
+        }
+
+
 class TaskUpdateSerializer(serializers.ModelSerializer):
     """Serializer for updating an existing task"""
     class Meta:
@@ -121,4 +232,31 @@ class TaskStatusUpdateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError(
                 f"Cannot transition from '{current_status}' to '{new_status}'")
         
-        return value
\ No newline at end of file
+        return value
+
+
+class RecurrenceRuleSerializer(serializers.ModelSerializer):
+    """Serializer for reading and setting a task's recurrence rule"""
+    class Meta:
+        model = RecurrenceRule
+        fields = ['frequency', 'interval', 'end_date', 'max_occurrences',
+                  'generated_count', 'next_occurrence_at', 'is_active']
+        read_only_fields = ['generated_count', 'next_occurrence_at', 'is_active']
+    
+    def validate(self, data):
+        """Validate the end conditions"""
+        task = self.context['task']
+        end_date = data.get('end_date')
+        if end_date and end_date <= task.deadline:
+            raise serializers.ValidationError({"end_date": "End date must be after the task deadline."})
+        return data
+    
+    def save(self, **kwargs):
+        """Create or update the rule using the model method"""
+        self.instance = self.context['task'].set_recurrence(
+            frequency=self.validated_data['frequency'],
+            interval=self.validated_data.get('interval', 1),
+            end_date=self.validated_data.get('end_date'),
+            max_occurrences=self.validated_data.get('max_occurrences')
+        )
+        return self.instance
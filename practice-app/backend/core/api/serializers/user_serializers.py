@@ -14,6 +14,12 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'rating', 'completed_task_count', 'is_active']
 
 
+class OwnUserSerializer(UserSerializer):
+    """Serializer for a user's own profile, with their private preferences"""
+    class Meta(UserSerializer.Meta):
+        fields = UserSerializer.Meta.fields + ['notification_digest']
+
+
 class UserCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating a new user"""
     confirm_password = serializers.CharField(write_only=True)
@@ -52,7 +58,7 @@ class UserUpdateSerializer(serializers.ModelSerializer):
     """Serializer for updating user information"""
     class Meta:
         model = RegisteredUser
-        fields = ['name', 'surname', 'username', 'phone_number', 'location']
+        fields = ['name', 'surname', 'username', 'phone_number', 'location', 'notification_digest']
     
     def validate_phone_number(self, value):
         """Validate phone number format"""
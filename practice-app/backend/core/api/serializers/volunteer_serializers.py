@@ -2,6 +2,7 @@ from rest_framework import serializers
 from core.models import Volunteer, VolunteerStatus
 from .user_serializers import UserSerializer
 from .task_serializers import TaskSerializer
+from .mixins import TaskReferenceMixin
 
 
 class VolunteerSerializer(serializers.ModelSerializer):
@@ -20,7 +21,7 @@ class VolunteerSerializer(serializers.ModelSerializer):
         return dict(VolunteerStatus.choices)[obj.status]
 
 
-class VolunteerCreateSerializer(serializers.ModelSerializer):
+class VolunteerCreateSerializer(TaskReferenceMixin, serializers.ModelSerializer):
     """Serializer for creating a new volunteer"""
     task_id = serializers.IntegerField(write_only=True)
     
@@ -30,12 +31,7 @@ class VolunteerCreateSerializer(serializers.ModelSerializer):
     
     def validate_task_id(self, value):
         """Validate task exists and is available for volunteers"""
-        from core.models import Task
-        
-        try:
-            task = Task.objects.get(id=value)
-        except Task.DoesNotExist:
-            raise serializers.ValidationError("Task not found.")
+        task = self.resolve_task(value)
         
         # Check if task is still accepting volunteers
         if task.status != 'POSTED':
@@ -48,17 +44,15 @@ class VolunteerCreateSerializer(serializers.ModelSerializer):
             task.check_expiry()
             raise serializers.ValidationError("This task has expired.")
         
-        return value
+        return task
     
     def create(self, validated_data):
         """Create a new volunteer instance"""
-        from core.models import Task
-        
         # Get the user from the context
         user = self.context['request'].user
         
-        # Get the task
-        task = Task.objects.get(id=validated_data.pop('task_id'))
+        # Get the task resolved during validation
+        task = validated_data.pop('task_id')
         
         # Create volunteer using the model method
         volunteer = Volunteer.volunteer_for_task(user=user, task=task)
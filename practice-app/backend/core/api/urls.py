@@ -3,7 +3,8 @@ from rest_framework.routers import DefaultRouter
 from core.api.views import (
     user_views, auth_views, task_views, volunteer_views, 
     review_views, bookmark_views, notification_views, 
-    photo_views, admin_views, comment_views
+    photo_views, admin_views, comment_views, export_views, async_views,
+    tag_views, report_views
 )
 
 router = DefaultRouter()
@@ -28,16 +29,34 @@ urlpatterns = [
     path('auth/check-availability/', auth_views.CheckAvailabilityView.as_view(), name='check-availability'),
     
     # Task-specific endpoints
+    path('tasks/<int:task_id>/comments/', comment_views.TaskCommentsView.as_view(), name='task-comments'),
     path('tasks/<int:task_id>/volunteers/', volunteer_views.TaskVolunteersView.as_view(), name='task-volunteers'),
     path('tasks/<int:task_id>/reviews/', review_views.TaskReviewsView.as_view(), name='task-reviews'),
     path('tasks/<int:task_id>/photo/', photo_views.TaskPhotoView.as_view(), name='task-photo'),
     path('tasks/<int:task_id>/complete/', task_views.CompleteTaskView.as_view(), name='complete-task'),
     
+    # Moderation reports
+    path('reports/', report_views.ReportCreateView.as_view(), name='report-create'),
+    
+    # Tag endpoints
+    path('tags/suggest/', tag_views.TagSuggestionView.as_view(), name='tag-suggestions'),
+    
     # User-specific endpoints
     path('users/<int:user_id>/tasks/', task_views.UserTasksView.as_view(), name='user-tasks'),
     path('users/<int:user_id>/reviews/', review_views.UserReviewsView.as_view(), name='user-reviews'),
     
+    # Export endpoints
+    path('export/tasks/', export_views.TaskExportView.as_view(), name='export-tasks'),
+    path('export/notifications/', export_views.NotificationExportView.as_view(), name='export-notifications'),
+    path('export/users/<int:user_id>/reviews/', export_views.UserReviewsExportView.as_view(), name='export-user-reviews'),
+    
+    # Async composite read endpoints
+    path('async/feed/', async_views.feed, name='async-feed'),
+    path('async/notifications/', async_views.notifications, name='async-notifications'),
+    path('async/tasks/<int:task_id>/', async_views.task_page, name='async-task-page'),
+    
     # Admin endpoints
+    path('admin/reports/', admin_views.ReportQueueView.as_view(), name='report-queue'),
     path('admin/reported-users/', admin_views.ReportedUsersView.as_view(), name='reported-users'),
     path('admin/users/<int:user_id>/', admin_views.AdminUserDetailView.as_view(), name='admin-user-detail'),
     path('admin/users/<int:user_id>/ban/', admin_views.BanUserView.as_view(), name='ban-user'),
@@ -8,4 +8,7 @@ from .bookmark_views import *
 from .notification_views import *
 from .photo_views import *
 from .comment_views import *
-from .admin_views import *
\ No newline at end of file
+from .admin_views import *
+from .export_views import *
+from .tag_views import *
+from .report_views import *
\ No newline at end of file
@@ -1,56 +1,119 @@
 from rest_framework import viewsets, permissions, status, views
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
-from django.db.models import Count
+from django.utils import timezone
 
-from core.models import RegisteredUser, Administrator
-from core.api.serializers.user_serializers import AdminUserSerializer
+from core.models import RegisteredUser, Administrator, ReportTarget, ReportTargetType
+from core.api.serializers.report_serializers import ReportTargetSerializer
 from core.permissions import IsAdministrator
-from core.utils import format_response, paginate_results
+from core.utils import format_response
 
 
-class ReportedUsersView(views.APIView):
-    """View for listing reported users"""
+# Largest page of the moderation queue
+MAX_QUEUE_PAGE_SIZE = 100
+
+
+def parse_queue_cursor(value):
+    """
+    Parse a moderation queue cursor ('<report_count>:<id>')
+    
+    Returns:
+        tuple: (report_count, id), or None if the value is not a cursor
+    """
+    report_count, _, target_id = value.partition(':')
+    if not (report_count.isdigit() and target_id.isdigit()):
+        return None
+    return int(report_count), int(target_id)
+
+
+class ReportQueueView(views.APIView):
+    """
+    View for the moderation queue of reported objects, most reported first
+    
+    The queue reads the per-object aggregates maintained as reports are
+    filed, so each page is one ordered range scan of the queue index. Pages
+    are cut with the 'cursor' returned as next_cursor by the previous page.
+    """
     permission_classes = [permissions.IsAuthenticated, IsAdministrator]
     
+    def get_target_type(self, request):
+        """The type of reported objects to list, None if invalid"""
+        target_type = request.query_params.get('type', ReportTargetType.USER).upper()
+        return target_type if target_type in ReportTargetType.values else None
+    
+    def get_queryset(self, target_type, cursor):
+        """Queue of reported objects after the cursor"""
+        return ReportTarget.get_queue(target_type, cursor)
+    
+    def serialize(self, targets):
+        """Serialize a page of the queue"""
+        return {'reports': ReportTargetSerializer(targets, many=True).data}
+    
+    def bad_request(self, message):
+        """Response for invalid query parameters"""
+        return Response(format_response(
+            status='error',
+            message=message
+        ), status=status.HTTP_400_BAD_REQUEST)
+    
     def get(self, request):
-        """Handle GET requests to retrieve reported users"""
-        # In a real implementation, there would be a ReportedUser model
-        # For this implementation, we'll simulate it by counting notifications
-        from core.models import Notification
-        
-        # Get users with reports
-        # Assuming reports are stored as notifications of a specific type
-        reported_users = RegisteredUser.objects.annotate(
-            reports=Count('notifications', filter=models.Q(notifications__type='USER_REPORT'))
-        ).filter(reports__gt=0).order_by('-reports')
-        
-        # Get page and limit parameters
-        page = int(request.query_params.get('page', 1))
-        limit = int(request.query_params.get('limit', 20))
+        """Handle GET requests to retrieve a page of the queue"""
+        target_type = self.get_target_type(request)
+        if target_type is None:
+            return self.bad_request(f'type must be one of {", ".join(ReportTargetType.values)}.')
+        try:
+            limit = int(request.query_params.get('limit', 20))
+        except ValueError:
+            limit = 0
+        if not 1 <= limit <= MAX_QUEUE_PAGE_SIZE:
+            return self.bad_request(f'limit must be an integer between 1 and {MAX_QUEUE_PAGE_SIZE}.')
+        cursor = None
+        if request.query_params.get('cursor'):
+            cursor = parse_queue_cursor(request.query_params['cursor'])
+            if cursor is None:
+                return self.bad_request('cursor must be a next_cursor returned by a previous page.')
         
-        # Paginate results
-        paginated = paginate_results(reported_users, page=page, items_per_page=limit)
-        
-        # Create response data
-        response_data = []
-        for user in paginated['data']:
-            response_data.append({
-                'user_id': user.id,
-                'username': user.username,
-                'reports': user.reports,
-                'last_reported_at': user.notifications.filter(type='USER_REPORT').latest('timestamp').timestamp
-            })
+        # One extra row tells whether there is a next page
+        targets = list(self.get_queryset(target_type, cursor)[:limit + 1])
+        has_more = len(targets) > limit
+        targets = targets[:limit]
         
+        data = self.serialize(targets)
+        data['pagination'] = {
+            'next_cursor': f'{targets[-1].report_count}:{targets[-1].id}' if has_more else None,
+            'limit': limit
+        }
         return Response(format_response(
             status='success',
-            data={
-                'users': response_data,
-                'pagination': paginated['pagination']
-            }
+            data=data
         ))
 
 
+class ReportedUsersView(ReportQueueView):
+    """View for listing reported users"""
+    
+    def get_target_type(self, request):
+        """Only users are listed"""
+        return ReportTargetType.USER
+    
+    def get_queryset(self, target_type, cursor):
+        """Queue of reported users with their usernames"""
+        return super().get_queryset(target_type, cursor).select_related('user')
+    
+    def serialize(self, targets):
+        """Serialize a page of reported users"""
+        return {'users': [
+            {
+                'user_id': target.user_id,
+                'username': target.user.username,
+                'reports': target.report_count,
+                'last_reported_at': target.last_reported_at,
+                'last_reason': target.last_reason
+            }
+            for target in targets
+        ]}
+
+
 class AdminUserDetailView(views.APIView):
     """View for retrieving detailed user information (admin view)"""
     permission_classes = [permissions.IsAuthenticated, IsAdministrator]
@@ -60,21 +123,20 @@ class AdminUserDetailView(views.APIView):
         # Get user
         user = get_object_or_404(RegisteredUser, id=user_id)
         
-        # Get reports
-        from core.models import Notification
-        reports_count = Notification.objects.filter(
-            type='USER_REPORT',
-            related_user=user
-        ).count()
-        
-        # Get flagged posts/tasks
-        from core.models import Task
-        flagged_tasks = []
-        for task in Task.objects.filter(creator=user, status='REPORTED'):
-            flagged_tasks.append({
-                'task_id': task.id,
-                'created_at': task.created_at,
-                'reason': 'Content reported by users'  # In a real implementation, this would come from the report
+        # Reports of the user and of their tasks, comments and reviews
+        targets = ReportTarget.objects.filter(user=user).order_by('-last_reported_at', '-id')
+        reports_count = 0
+        flagged_posts = []
+        for target in targets:
+            if target.target_type == ReportTargetType.USER:
+                reports_count = target.report_count
+                continue
+            flagged_posts.append({
+                'type': target.target_type,
+                'id': target.target_id,
+                'reports': target.report_count,
+                'last_reported_at': target.last_reported_at,
+                'reason': target.last_reason
             })
         
         # Create response data
@@ -84,7 +146,7 @@ class AdminUserDetailView(views.APIView):
             'email': user.email,
             'status': 'active' if user.is_active else 'banned',
             'reports': reports_count,
-            'flagged_posts': flagged_tasks
+            'flagged_posts': flagged_posts
         }
         
         return Response(format_response(
@@ -133,9 +195,11 @@ class BanUserView(views.APIView):
                 message='Could not ban user.'
             ), status=status.HTTP_400_BAD_REQUEST)
         
+        banned_at = timezone.now()
+        
         # Send notification to user
         from core.models import Notification, NotificationType
-        Notification.send_notification(
+        Notification.enqueue_notification(
             user=user,
             content=f"Your account has been banned for violating community guidelines: {reason}. You may appeal by emailing support@example.com.",
             notification_type=NotificationType.SYSTEM_NOTIFICATION
@@ -148,8 +212,6 @@ class BanUserView(views.APIView):
             data={
                 'user_id': user.id,
                 'new_status': 'banned',
-                'banned_at': user.notifications.filter(
-                    type=NotificationType.SYSTEM_NOTIFICATION
-                ).latest('timestamp').timestamp.isoformat()
+                'banned_at': banned_at.isoformat()
             }
         ))
\ No newline at end of file
@@ -0,0 +1,251 @@
+"""
+Async composite read endpoints
+
+Pages that combine several independent queries (the feed, the notification
+list with its counters, a task with its comments, photos and reviews) are
+served by async views that load the pieces concurrently instead of one
+after another. Each piece is a sync function that queries and serializes;
+with ASYNC_PARALLEL_QUERIES they run in separate worker threads, each on its
+own database connection, so a page takes as long as its slowest piece rather
+than the sum of all of them. Otherwise they run one by one on the request's
+thread, like Django's async ORM does.
+
+The views work under both WSGI and ASGI; under ASGI they also free the
+server's event loop while waiting for the database.
+"""
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from django.http import HttpResponse, HttpResponseNotAllowed
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from core.api.renderers import json_dumps
+from core.api.serializers.comment_serializers import serialize_comments
+from core.api.serializers.notification_serializers import serialize_notifications
+from core.api.serializers.photo_serializers import PhotoSerializer
+from core.api.serializers.review_serializers import ReviewSerializer
+from core.api.serializers.task_serializers import TaskSerializer
+from core.db import routers
+from core.models import Task, Comment, Photo, Review, Notification, Bookmark, Feed
+from core.utils import format_response, build_pagination
+
+
+def json_response(data, status_code=status.HTTP_200_OK):
+    """Render a response body the way the API renderer does"""
+    return HttpResponse(json_dumps(data), status=status_code, content_type='application/json')
+
+
+def authenticate(request):
+    """Authenticate a request with the API's authentication classes, None if anonymous"""
+    drf_request = Request(
+        request,
+        authenticators=[authenticator() for authenticator in api_settings.DEFAULT_AUTHENTICATION_CLASSES]
+    )
+    try:
+        user = drf_request.user
+    except APIException:
+        return None
+    return user if user.is_authenticated else None
+
+
+def get_page_params(request):
+    """Get the page and limit query parameters"""
+    try:
+        page = int(request.GET.get('page', 1))
+        limit = int(request.GET.get('limit', 20))
+    except ValueError:
+        return None
+    if limit < 1:
+        return None
+    return max(1, page), limit
+
+
+def _in_own_connection(function):
+    """Wrap a piece so its worker thread reuses only healthy, current connections"""
+    def run():
+        close_old_connections()
+        try:
+            return function()
+        finally:
+            close_old_connections()
+    return run
+
+
+async def gather(*functions):
+    """
+    Run independent sync functions concurrently
+
+    Args:
+        functions: Callables taking no arguments
+
+    Returns:
+        list: Their results, in order
+    """
+    if settings.ASYNC_PARALLEL_QUERIES:
+        return await asyncio.gather(*(
+            sync_to_async(_in_own_connection(function), thread_sensitive=False)()
+            for function in functions
+        ))
+    return [await sync_to_async(function)() for function in functions]
+
+
+async def prepare(request):
+    """
+    Check the method, authenticate the request and route its reads
+
+    Returns:
+        tuple: (user, error response or None)
+    """
+    # Django's method decorators don't support async views before 5.0
+    if request.method not in ('GET', 'HEAD'):
+        return None, HttpResponseNotAllowed(['GET', 'HEAD'])
+    user = await sync_to_async(authenticate)(request)
+    if user is None:
+        return None, json_response(format_response(
+            status='error',
+            message='Authentication credentials were not provided.'
+        ), status.HTTP_401_UNAUTHORIZED)
+    # Pieces run in copies of this context, so they read from the same database
+    await sync_to_async(routers.route_reads)(user)
+    return user, None
+
+
+def wants_normalized(request):
+    """Whether to refer to users and tasks by id and side-load them once"""
+    return request.GET.get('normalize', 'false').lower() == 'true'
+
+
+def bad_page_response():
+    """Response for invalid page or limit parameters"""
+    return json_response(format_response(
+        status='error',
+        message='page and limit must be positive integers.'
+    ), status.HTTP_400_BAD_REQUEST)
+
+
+async def feed(request):
+    """Feed page: open tasks for the user, their unread notification count and bookmarks"""
+    user, error = await prepare(request)
+    if error:
+        return error
+    params = get_page_params(request)
+    if params is None:
+        return bad_page_response()
+    page, limit = params
+
+    def tasks():
+        return TaskSerializer(Feed(user).load_feed(page=page, items_per_page=limit), many=True).data
+
+    def unread_count():
+        return Notification.objects.filter(user=user, is_read=False).count()
+
+    def bookmarked_task_ids():
+        return list(Bookmark.objects.filter(user=user).values_list('task_id', flat=True))
+
+    tasks, unread, bookmarked = await gather(tasks, unread_count, bookmarked_task_ids)
+    return json_response(format_response(
+        status='success',
+        data={
+            'tasks': tasks,
+            'unread_count': unread,
+            'bookmarked_task_ids': bookmarked,
+        }
+    ))
+
+
+async def notifications(request):
+    """Notification list page with its pagination and unread count"""
+    user, error = await prepare(request)
+    if error:
+        return error
+    params = get_page_params(request)
+    if params is None:
+        return bad_page_response()
+    page, limit = params
+
+    normalize = wants_normalized(request)
+    queryset = Notification.objects.filter(user=user)
+    if request.GET.get('unread', 'false').lower() == 'true':
+        queryset = queryset.filter(is_read=False)
+    start = (page - 1) * limit
+
+    def page_items():
+        items = queryset.order_by('-timestamp', '-id')
+        if not normalize:
+            items = items.select_related('user', 'related_task__creator', 'related_task__assignee')
+        return serialize_notifications(items[start:start + limit], normalize=normalize)
+
+    def total_count():
+        return queryset.count()
+
+    def unread_count():
+        return Notification.objects.filter(user=user, is_read=False).count()
+
+    (items, included), total, unread = await gather(page_items, total_count, unread_count)
+    data = {
+        'notifications': items,
+        'pagination': build_pagination(total, page, limit),
+        'unread_count': unread,
+    }
+    if normalize:
+        data['included'] = included
+    return json_response(format_response(status='success', data=data))
+
+
+async def task_page(request, task_id):
+    """Task detail page with the task's comments, photos and reviews"""
+    user, error = await prepare(request)
+    if error:
+        return error
+    params = get_page_params(request)
+    if params is None:
+        return bad_page_response()
+    page, limit = params
+    normalize = wants_normalized(request)
+    start = (page - 1) * limit
+
+    def task():
+        instance = Task.objects.select_related('creator', 'assignee').filter(id=task_id).first()
+        return TaskSerializer(instance).data if instance is not None else None
+
+    def comments():
+        items = Comment.objects.filter(task_id=task_id).order_by('timestamp', 'id')
+        if not normalize:
+            items = items.select_related('user', 'task__creator', 'task__assignee')
+        return serialize_comments(items[start:start + limit], normalize=normalize)
+
+    def comment_count():
+        return Comment.objects.filter(task_id=task_id).count()
+
+    def photos():
+        items = Photo.objects.filter(task_id=task_id).select_related('task__creator', 'task__assignee')
+        return PhotoSerializer(items, many=True).data
+
+    def reviews():
+        items = Review.objects.filter(task_id=task_id).select_related('reviewer', 'reviewee')
+        return ReviewSerializer(items, many=True).data
+
+    task, (comments, included), comment_total, photos, reviews = await gather(
+        task, comments, comment_count, photos, reviews
+    )
+    if task is None:
+        return json_response(format_response(
+            status='error',
+            message='Task not found.'
+        ), status.HTTP_404_NOT_FOUND)
+
+    data = {
+        'task': task,
+        'comments': comments,
+        'comments_pagination': build_pagination(comment_total, page, limit),
+        'photos': photos,
+        'reviews': reviews,
+    }
+    if normalize:
+        data['included'] = included
+    return json_response(format_response(status='success', data=data))
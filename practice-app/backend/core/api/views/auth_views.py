@@ -266,13 +266,13 @@ class CheckAvailabilityView(views.APIView):
             if email_exists:
                 return Response(format_response(
                     status='error',
-                    available=False,
+                    data={'available': False},
                     message='This email is already associated with an existing account.'
                 ))
             else:
                 return Response(format_response(
                     status='success',
-                    available=True,
+                    data={'available': True},
                     message='This email is available for registration.'
                 ))
         
@@ -282,12 +282,12 @@ class CheckAvailabilityView(views.APIView):
             if phone_exists:
                 return Response(format_response(
                     status='error',
-                    available=False,
+                    data={'available': False},
                     message='This phone number is already associated with an existing account.'
                 ))
             else:
                 return Response(format_response(
                     status='success',
-                    available=True,
+                    data={'available': True},
                     message='This phone number is available for registration.'
                 ))
\ No newline at end of file
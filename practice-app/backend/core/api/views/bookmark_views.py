@@ -3,15 +3,16 @@ from rest_framework.response import Response
 from rest_framework.decorators import action
 from django.shortcuts import get_object_or_404
 
-from core.models import Bookmark, Task
+from core.models import Bookmark, BookmarkTag, Task
 from core.api.serializers.bookmark_serializers import (
     BookmarkSerializer, BookmarkCreateSerializer, BookmarkUpdateSerializer
 )
 from core.permissions import IsOwner
 from core.utils import format_response, paginate_results
+from core.api.views.mixins import ReplicaReadMixin
 
 
-class BookmarkViewSet(viewsets.ModelViewSet):
+class BookmarkViewSet(ReplicaReadMixin, viewsets.ModelViewSet):
     """ViewSet for managing bookmarks"""
     queryset = Bookmark.objects.all()
     serializer_class = BookmarkSerializer
@@ -28,7 +29,9 @@ class BookmarkViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         """Return user's bookmarks"""
-        return Bookmark.objects.filter(user=self.request.user)
+        return Bookmark.objects.filter(user=self.request.user).select_related(
+            'user', 'task__creator', 'task__assignee'
+        ).prefetch_related('tags')
     
     def get_serializer_class(self):
         """Return appropriate serializer based on action"""
@@ -43,7 +46,10 @@ class BookmarkViewSet(viewsets.ModelViewSet):
         # Filter by tag if provided
         tag_param = request.query_params.get('tag')
         if tag_param:
-            bookmarks = self.get_queryset().filter(tags__name=tag_param)
+            # Range scan of the (user, tag) index of the tag links
+            bookmarks = self.get_queryset().filter(
+                id__in=BookmarkTag.bookmark_ids(request.user, tag_param)
+            )
         else:
             bookmarks = self.get_queryset()
         
@@ -3,16 +3,22 @@ from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
 
 from core.models import Comment, Task
+from core.models.comment import PATH_PATTERN
 from core.api.serializers.comment_serializers import (
-    CommentSerializer, CommentCreateSerializer, CommentUpdateSerializer
+    CommentSerializer, CommentCreateSerializer, CommentUpdateSerializer, serialize_comments
 )
 from core.permissions import IsOwner
-from core.utils import format_response, paginate_results
+from core.utils import format_response
+from core.api.views.mixins import ReplicaReadMixin
 
 
-class CommentViewSet(viewsets.ModelViewSet):
+# Largest page of a task's comments
+MAX_COMMENTS_PER_PAGE = 100
+
+
+class CommentViewSet(ReplicaReadMixin, viewsets.ModelViewSet):
     """ViewSet for managing comments"""
-    queryset = Comment.objects.all()
+    queryset = Comment.objects.select_related('user', 'task__creator', 'task__assignee')
     serializer_class = CommentSerializer
     
     def get_permissions(self):
@@ -33,6 +39,19 @@ class CommentViewSet(viewsets.ModelViewSet):
             return CommentUpdateSerializer
         return CommentSerializer
     
+    def list(self, request, *args, **kwargs):
+        """Handle GET requests to list comments"""
+        # Refer to users and tasks by id, side-loading each once
+        if request.query_params.get('normalize', 'false').lower() != 'true':
+            return super().list(request, *args, **kwargs)
+        
+        # Related objects are side-loaded, don't join them
+        page = self.paginate_queryset(self.filter_queryset(self.get_queryset().select_related(None)))
+        comment_data, included = serialize_comments(page, normalize=True)
+        response = self.get_paginated_response(comment_data)
+        response.data['included'] = included
+        return response
+    
     def create(self, request, *args, **kwargs):
         """Handle POST requests to create a comment"""
         serializer = self.get_serializer(data=request.data, context={'request': request})
@@ -77,47 +96,91 @@ class CommentViewSet(viewsets.ModelViewSet):
 
 
 class TaskCommentsView(views.APIView):
-    """View for listing and creating comments for a specific task"""
+    """
+    View for listing and creating comments for a specific task
+    
+    GET lists the task's top-level comments, or with 'thread' the replies
+    below one comment in depth first order. Pages are cut with a cursor (the
+    path of the last comment of the previous page), so each page is one
+    range scan however many comments the task has.
+    """
     permission_classes = [permissions.IsAuthenticated]
     
     def get(self, request, task_id):
         """Handle GET requests to retrieve task comments"""
-        # Get task
-        task = get_object_or_404(Task, id=task_id)
+        cursor = request.query_params.get('cursor')
+        thread_id = request.query_params.get('thread')
+        try:
+            limit = int(request.query_params.get('limit', 20))
+        except ValueError:
+            limit = 0
+        if not 1 <= limit <= MAX_COMMENTS_PER_PAGE:
+            return self.bad_request(f'limit must be an integer between 1 and {MAX_COMMENTS_PER_PAGE}.')
+        if cursor and not PATH_PATTERN.match(cursor):
+            return self.bad_request('cursor must be a next_cursor returned by a previous page.')
+        if thread_id and not thread_id.isdigit():
+            return self.bad_request('thread must be a comment id.')
         
-        # Get comments
-        comments = Comment.objects.filter(task=task).order_by('timestamp')
+        # Replies of one thread, or the top-level comments
+        if thread_id:
+            root = get_object_or_404(Comment, id=thread_id, task_id=task_id)
+            comments = root.get_subtree()
+        else:
+            comments = Comment.get_threads(task_id)
+        if cursor:
+            comments = comments.filter(path__gt=cursor)
         
-        # Get page and limit parameters
-        page = int(request.query_params.get('page', 1))
-        limit = int(request.query_params.get('limit', 20))
+        # Refer to users and tasks by id, side-loading each once
+        normalize = request.query_params.get('normalize', 'false').lower() == 'true'
+        if not normalize:
+            comments = comments.select_related('user', 'task__creator', 'task__assignee')
         
-        # Paginate results
-        paginated = paginate_results(comments, page=page, items_per_page=limit)
+        # One extra row tells whether there is a next page
+        page = list(comments[:limit + 1])
+        has_more = len(page) > limit
+        page = page[:limit]
+        if not page and not thread_id:
+            get_object_or_404(Task, id=task_id)
         
         # Serialize comments
-        serializer = CommentSerializer(paginated['data'], many=True)
+        comment_data, included = serialize_comments(page, normalize=normalize)
+        
+        data = {
+            'comments': comment_data,
+            'pagination': {
+                'next_cursor': page[-1].path if has_more else None,
+                'limit': limit
+            }
+        }
+        if normalize:
+            data['included'] = included
         
         return Response(format_response(
             status='success',
-            data={
-                'comments': serializer.data,
-                'pagination': paginated['pagination']
-            }
+            data=data
         ))
     
+    def bad_request(self, message):
+        """Response for invalid query parameters"""
+        return Response(format_response(
+            status='error',
+            message=message
+        ), status=status.HTTP_400_BAD_REQUEST)
+    
     def post(self, request, task_id):
         """Handle POST requests to create a comment for a task"""
-        # Get task
-        task = get_object_or_404(Task, id=task_id)
+        # Get task with the users the response serializes
+        task = get_object_or_404(Task.objects.select_related('creator', 'assignee'), id=task_id)
         
         # Create serializer with data
         data = {
             'content': request.data.get('content'),
-            'task_id': task.id
+            'task_id': task.id,
+            'parent_id': request.data.get('parent_id')
         }
         
-        serializer = CommentCreateSerializer(data=data, context={'request': request})
+        # Hand the task to the serializer so it isn't loaded again
+        serializer = CommentCreateSerializer(data=data, context={'request': request, 'task': task})
         serializer.is_valid(raise_exception=True)
         comment = serializer.save()
         
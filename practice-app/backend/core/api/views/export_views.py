@@ -0,0 +1,93 @@
+from rest_framework import permissions, status, views
+from rest_framework.response import Response
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.shortcuts import get_object_or_404
+
+from core.models import Task, Review, Notification, RegisteredUser
+from core.api.views.task_views import filter_tasks
+from core.permissions import IsAdministrator
+from core.utils import format_response, stream_export_response, EXPORT_FORMATS
+
+
+class ExportView(views.APIView):
+    """
+    Base view for streaming NDJSON/CSV exports
+
+    Subclasses set the exported fields and file name and define
+    get_export_queryset(request, **kwargs) returning the rows to export;
+    as_view() refuses subclasses missing either. The export format is chosen
+    with the 'file_format' query parameter ('format' is reserved by DRF for
+    renderer selection).
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    fields = []
+    filename = 'export'
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        """Check the export is fully defined when it is routed"""
+        if not cls.fields or not callable(getattr(cls, 'get_export_queryset', None)):
+            raise ImproperlyConfigured(
+                f'{cls.__name__} must set fields and define get_export_queryset().'
+            )
+        return super().as_view(**initkwargs)
+
+    def get(self, request, **kwargs):
+        """Handle GET requests to stream an export file"""
+        file_format = request.query_params.get('file_format', 'ndjson').lower()
+        if file_format not in EXPORT_FORMATS:
+            return Response(format_response(
+                status='error',
+                message=f"Unsupported export format '{file_format}'. Use one of: {', '.join(EXPORT_FORMATS)}."
+            ), status=status.HTTP_400_BAD_REQUEST)
+
+        queryset = self.get_export_queryset(request, **kwargs)
+
+        return stream_export_response(
+            queryset,
+            fields=self.fields,
+            file_format=file_format,
+            filename=self.filename,
+            chunk_size=settings.EXPORT_CHUNK_SIZE
+        )
+
+
+class TaskExportView(ExportView):
+    """View for exporting tasks with the same filters as the task list"""
+    permission_classes = [permissions.IsAuthenticated, IsAdministrator]
+    fields = ['id', 'title', 'description', 'category', 'location', 'deadline',
+              'requirements', 'urgency_level', 'volunteer_number', 'status',
+              'is_recurring', 'creator_id', 'assignee_id', 'created_at', 'updated_at']
+    filename = 'tasks'
+
+    def get_export_queryset(self, request, **kwargs):
+        """Return filtered tasks ordered by id"""
+        return filter_tasks(Task.objects.all(), request.query_params).order_by('id')
+
+
+class UserReviewsExportView(ExportView):
+    """View for exporting reviews received by a specific user"""
+    fields = ['id', 'score', 'comment', 'timestamp', 'reviewer_id', 'reviewee_id', 'task_id']
+    filename = 'reviews'
+
+    def get_export_queryset(self, request, user_id=None):
+        """Return reviews received by the user, newest first"""
+        user = get_object_or_404(RegisteredUser, id=user_id)
+        return Review.objects.filter(reviewee=user).order_by('-timestamp')
+
+
+class NotificationExportView(ExportView):
+    """View for exporting the requesting user's notifications"""
+    fields = ['id', 'content', 'timestamp', 'type', 'is_read', 'related_task_id']
+    filename = 'notifications'
+
+    def get_export_queryset(self, request, **kwargs):
+        """Return the user's notifications, newest first"""
+        notifications = Notification.objects.filter(user=request.user)
+
+        unread_only = request.query_params.get('unread', 'false').lower() == 'true'
+        if unread_only:
+            notifications = notifications.filter(is_read=False)
+
+        return notifications.order_by('-timestamp')
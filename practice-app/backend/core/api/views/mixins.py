@@ -0,0 +1,12 @@
+from core.db import routers
+
+
+class ReplicaReadMixin:
+    """Serve a ViewSet's read-only actions from a read replica when it is safe"""
+    replica_actions = ('list', 'retrieve')
+    
+    def initial(self, request, *args, **kwargs):
+        """Route the reads of replica actions once the user is authenticated"""
+        super().initial(request, *args, **kwargs)
+        if self.action in self.replica_actions:
+            routers.route_reads(request.user)
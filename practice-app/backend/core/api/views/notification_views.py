@@ -2,16 +2,20 @@ from rest_framework import viewsets, permissions, status, views
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from django.shortcuts import get_object_or_404
+from django.db.models import prefetch_related_objects
+from django.utils.dateparse import parse_datetime
 
 from core.models import Notification
 from core.api.serializers.notification_serializers import (
-    NotificationSerializer, NotificationCreateSerializer, NotificationUpdateSerializer
+    NotificationSerializer, NotificationCreateSerializer, NotificationUpdateSerializer,
+    serialize_notifications
 )
-from core.permissions import IsOwner
+from core.permissions import IsOwner, is_administrator
 from core.utils import format_response, paginate_results
+from core.api.views.mixins import ReplicaReadMixin
 
 
-class NotificationViewSet(viewsets.ModelViewSet):
+class NotificationViewSet(ReplicaReadMixin, viewsets.ModelViewSet):
     """ViewSet for managing notifications"""
     queryset = Notification.objects.all()
     serializer_class = NotificationSerializer
@@ -21,14 +25,16 @@ class NotificationViewSet(viewsets.ModelViewSet):
         Return appropriate permissions based on action.
         - Only owners can view, update, or delete their notifications
         """
-        if self.action in ['list', 'retrieve', 'update', 'partial_update', 'destroy', 'mark_as_read', 'mark_all_as_read']:
+        if self.action in ['list', 'retrieve', 'update', 'partial_update', 'destroy', 'mark_as_read', 'mark_all_as_read', 'digest']:
             return [permissions.IsAuthenticated(), IsOwner()]
         else:
             return [permissions.IsAuthenticated()]
     
     def get_queryset(self):
         """Return user's notifications"""
-        return Notification.objects.filter(user=self.request.user)
+        return Notification.objects.filter(user=self.request.user).select_related(
+            'user', 'related_task__creator', 'related_task__assignee'
+        )
     
     def get_serializer_class(self):
         """Return appropriate serializer based on action"""
@@ -41,7 +47,7 @@ class NotificationViewSet(viewsets.ModelViewSet):
     def create(self, request, *args, **kwargs):
         """Handle POST requests to create a notification"""
         # Check if user has admin permission
-        if not hasattr(request.user, 'administrator'):
+        if not is_administrator(request.user):
             return Response(format_response(
                 status='error',
                 message='Only administrators can create notifications.'
@@ -64,9 +70,13 @@ class NotificationViewSet(viewsets.ModelViewSet):
         # Get unread parameter
         unread_only = request.query_params.get('unread', 'false').lower() == 'true'
         
-        # Filter notifications
+        include_archived = request.query_params.get('include_archived', 'false').lower() == 'true'
+        
+        # Filter notifications; archived notifications are all read
         if unread_only:
             notifications = self.get_queryset().filter(is_read=False)
+        elif include_archived:
+            notifications = Notification.with_archive(request.user)
         else:
             notifications = self.get_queryset()
         
@@ -74,19 +84,33 @@ class NotificationViewSet(viewsets.ModelViewSet):
         page = int(request.query_params.get('page', 1))
         limit = int(request.query_params.get('limit', 20))
         
+        # Refer to users and tasks by id, side-loading each once
+        normalize = request.query_params.get('normalize', 'false').lower() == 'true'
+        
         # Paginate results
-        paginated = paginate_results(notifications.order_by('-timestamp'), page=page, items_per_page=limit)
+        paginated = paginate_results(notifications.order_by('-timestamp', '-id'), page=page, items_per_page=limit)
+        
+        # Related objects can't be joined on the union, load them for the page only
+        page_notifications = list(paginated['data'])
+        if not normalize:
+            prefetch_related_objects(
+                page_notifications, 'user', 'related_task__creator', 'related_task__assignee'
+            )
         
         # Serialize notifications
-        serializer = self.get_serializer(paginated['data'], many=True)
+        notification_data, included = serialize_notifications(page_notifications, normalize=normalize)
+        
+        data = {
+            'notifications': notification_data,
+            'pagination': paginated['pagination'],
+            'unread_count': self.get_queryset().filter(is_read=False).count()
+        }
+        if normalize:
+            data['included'] = included
         
         return Response(format_response(
             status='success',
-            data={
-                'notifications': serializer.data,
-                'pagination': paginated['pagination'],
-                'unread_count': self.get_queryset().filter(is_read=False).count()
-            }
+            data=data
         ))
     
     def update(self, request, *args, **kwargs):
@@ -132,4 +156,26 @@ class NotificationViewSet(viewsets.ModelViewSet):
         return Response(format_response(
             status='success',
             message=f'{unread_notifications.count()} notifications marked as read.'
+        ))
+    
+    @action(detail=False, methods=['get'])
+    def digest(self, request):
+        """Custom action to summarize unread notifications per task and type"""
+        since = None
+        if 'since' in request.query_params:
+            since = parse_datetime(request.query_params['since'])
+            if since is None:
+                return Response(format_response(
+                    status='error',
+                    message='Invalid since parameter. Use an ISO 8601 datetime.'
+                ), status=status.HTTP_400_BAD_REQUEST)
+        
+        digest = Notification.get_digest(request.user, since=since)
+        
+        return Response(format_response(
+            status='success',
+            data={
+                'digest': digest,
+                'unread_total': sum(entry['total'] for entry in digest)
+            }
         ))
\ No newline at end of file
@@ -11,7 +11,7 @@ from core.utils import format_response
 
 class PhotoViewSet(viewsets.ModelViewSet):
     """ViewSet for managing photos"""
-    queryset = Photo.objects.all()
+    queryset = Photo.objects.select_related('task__creator', 'task__assignee')
     serializer_class = PhotoSerializer
     parser_classes = (MultiPartParser, FormParser)
     
@@ -63,7 +63,7 @@ class TaskPhotoView(views.APIView):
         task = get_object_or_404(Task, id=task_id)
         
         # Get photos
-        photos = Photo.objects.filter(task=task)
+        photos = Photo.objects.filter(task=task).select_related('task__creator', 'task__assignee')
         
         # Serialize photos
         serializer = PhotoSerializer(photos, many=True)
@@ -79,7 +79,7 @@ class TaskPhotoView(views.APIView):
         task = get_object_or_404(Task, id=task_id)
         
         # Check if user is the creator
-        if request.user != task.creator:
+        if request.user.id != task.creator_id:
             return Response(format_response(
                 status='error',
                 message='Only the task creator can upload photos.'
@@ -123,7 +123,7 @@ class TaskPhotoView(views.APIView):
         task = get_object_or_404(Task, id=task_id)
         
         # Check if user is the creator
-        if request.user != task.creator:
+        if request.user.id != task.creator_id:
             return Response(format_response(
                 status='error',
                 message='Only the task creator can delete photos.'
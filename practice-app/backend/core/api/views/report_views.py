@@ -0,0 +1,30 @@
+from rest_framework import permissions, status, views
+from rest_framework.response import Response
+
+from core.api.serializers.report_serializers import ReportSerializer, ReportCreateSerializer
+from core.utils import format_response
+
+
+class ReportCreateView(views.APIView):
+    """View for reporting a user, task, comment or review to the moderators"""
+    permission_classes = [permissions.IsAuthenticated]
+    
+    def post(self, request):
+        """Handle POST requests to file a report"""
+        serializer = ReportCreateSerializer(data=request.data, context={'request': request})
+        serializer.is_valid(raise_exception=True)
+        report = serializer.save()
+        
+        # A repeated report of the same object is not counted again
+        if not serializer.created:
+            return Response(format_response(
+                status='success',
+                message='You have already reported this.',
+                data=ReportSerializer(report).data
+            ))
+        
+        return Response(format_response(
+            status='success',
+            message='Report submitted successfully.',
+            data=ReportSerializer(report).data
+        ), status=status.HTTP_201_CREATED)
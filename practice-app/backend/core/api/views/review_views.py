@@ -8,11 +8,12 @@ from core.api.serializers.review_serializers import (
 )
 from core.permissions import IsOwner
 from core.utils import format_response, paginate_results
+from core.api.views.mixins import ReplicaReadMixin
 
 
-class ReviewViewSet(viewsets.ModelViewSet):
+class ReviewViewSet(ReplicaReadMixin, viewsets.ModelViewSet):
     """ViewSet for managing reviews"""
-    queryset = Review.objects.all()
+    queryset = Review.objects.select_related('reviewer', 'reviewee')
     serializer_class = ReviewSerializer
     
     def get_permissions(self):
@@ -91,7 +92,7 @@ class TaskReviewsView(views.APIView):
         task = get_object_or_404(Task, id=task_id)
         
         # Get reviews
-        reviews = Review.objects.filter(task=task)
+        reviews = Review.objects.filter(task=task).select_related('reviewer', 'reviewee')
         
         # Get page and limit parameters
         page = int(request.query_params.get('page', 1))
@@ -113,8 +114,8 @@ class TaskReviewsView(views.APIView):
     
     def post(self, request, task_id):
         """Handle POST requests to create a review for a task"""
-        # Get task
-        task = get_object_or_404(Task, id=task_id)
+        # Get task with both participants
+        task = get_object_or_404(Task.objects.select_related('creator', 'assignee'), id=task_id)
         
         # Check if task is completed
         if task.status != 'COMPLETED':
@@ -124,14 +125,14 @@ class TaskReviewsView(views.APIView):
             ), status=status.HTTP_400_BAD_REQUEST)
         
         # Check if user is the task creator or assignee
-        if request.user != task.creator and request.user != task.assignee:
+        if request.user.id not in (task.creator_id, task.assignee_id):
             return Response(format_response(
                 status='error',
                 message='Only task participants can submit reviews.'
             ), status=status.HTTP_403_FORBIDDEN)
         
         # Determine reviewee (the other participant)
-        if request.user == task.creator:
+        if request.user.id == task.creator_id:
             reviewee = task.assignee
         else:
             reviewee = task.creator
@@ -144,7 +145,10 @@ class TaskReviewsView(views.APIView):
             'task_id': task.id
         }
         
-        serializer = ReviewCreateSerializer(data=data, context={'request': request})
+        # Hand the loaded objects to the serializer so they aren't loaded again
+        serializer = ReviewCreateSerializer(
+            data=data, context={'request': request, 'task': task, 'reviewee': reviewee}
+        )
         serializer.is_valid(raise_exception=True)
         
         try:
@@ -174,7 +178,7 @@ class UserReviewsView(views.APIView):
         user = get_object_or_404(RegisteredUser, id=user_id)
         
         # Get reviews received by the user
-        reviews = Review.objects.filter(reviewee=user)
+        reviews = Review.objects.filter(reviewee=user).select_related('reviewer', 'reviewee')
         
         # Get page and limit parameters
         page = int(request.query_params.get('page', 1))
@@ -0,0 +1,48 @@
+from urllib.parse import quote
+
+from django.conf import settings
+from rest_framework import permissions, status, views
+from rest_framework.response import Response
+
+from core import metrics
+from core.models import Tag
+from core.api.serializers.tag_serializers import TagSerializer
+from core.utils import format_response
+
+
+# Largest number of suggestions returned for one prefix
+MAX_SUGGESTIONS = 50
+
+
+class TagSuggestionView(views.APIView):
+    """
+    View for autocompleting tag names
+
+    Tags starting with the 'q' prefix are returned most used first. Results
+    are cached per prefix and limit for TAG_SUGGESTION_CACHE_SECONDS.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        """Handle GET requests to suggest tags for a prefix"""
+        prefix = request.query_params.get('q', '').strip().lower()
+        try:
+            limit = int(request.query_params.get('limit', 10))
+        except ValueError:
+            limit = 0
+        if not 1 <= limit <= MAX_SUGGESTIONS:
+            return Response(format_response(
+                status='error',
+                message=f'limit must be an integer between 1 and {MAX_SUGGESTIONS}.'
+            ), status=status.HTTP_400_BAD_REQUEST)
+
+        tags = metrics.cache_get_or_set(
+            'tag_suggestions', f'tag_suggestions:{limit}:{quote(prefix)}',
+            lambda: TagSerializer(Tag.suggest(prefix, limit), many=True).data,
+            timeout=settings.TAG_SUGGESTION_CACHE_SECONDS
+        )
+
+        return Response(format_response(
+            status='success',
+            data={'tags': tags}
+        ))
@@ -1,19 +1,83 @@
 from rest_framework import viewsets, permissions, status, views
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from django.conf import settings
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django.db.models import Q
 
-from core.models import Task, TaskStatus
+from core.models import Task, TaskStatus, RecurrenceRule
 from core.api.serializers.task_serializers import (
-    TaskSerializer, TaskCreateSerializer, TaskUpdateSerializer, TaskStatusUpdateSerializer
+    TaskSerializer, TaskCreateSerializer, TaskUpdateSerializer, TaskStatusUpdateSerializer,
+    TaskBulkImportSerializer, RecurrenceRuleSerializer
 )
 from core.permissions import IsTaskCreator, IsTaskParticipant
-from core.utils import format_response, paginate_results
+from core.utils import format_response, paginate_results, stream_format_response
+from core.api.views.mixins import ReplicaReadMixin
 
 
-class TaskViewSet(viewsets.ModelViewSet):
+def filter_tasks(queryset, query_params):
+    """
+    Apply the task list filters from the request query parameters
+    
+    Args:
+        queryset: Task queryset to filter
+        query_params: Request query parameters
+        
+    Returns:
+        QuerySet: Filtered Task queryset
+    """
+    # Filter by status
+    status_param = query_params.get('status')
+    if status_param:
+        queryset = queryset.filter(status=status_param)
+    
+    # Filter by category
+    category_param = query_params.get('category')
+    if category_param:
+        queryset = queryset.filter(category=category_param)
+    
+    # Filter by location
+    location_param = query_params.get('location')
+    if location_param:
+        queryset = queryset.filter(location__icontains=location_param)
+    
+    # Filter by urgency
+    urgency_param = query_params.get('urgency')
+    if urgency_param:
+        queryset = queryset.filter(urgency_level__gte=int(urgency_param))
+    
+    # Filter by tag
+    tag_param = query_params.get('tag')
+    if tag_param:
+        queryset = queryset.filter(tags__name=tag_param)
+    
+    # Filter by search term
+    search_param = query_params.get('search')
+    if search_param:
+        queryset = queryset.filter(
+            Q(title__icontains=search_param) | 
+            Q(description__icontains=search_param)
+        )
+    
+    # Exclude expired tasks by default, unless specifically requested
+    show_expired = query_params.get('show_expired', 'false').lower() == 'true'
+    if not show_expired:
+        # Check for and mark expired tasks
+        now = timezone.now()
+        expired_tasks = queryset.filter(status=TaskStatus.POSTED, deadline__lt=now)
+        for task in expired_tasks:
+            task.check_expiry()
+        
+        # Exclude expired tasks, including overdue ones a replica may not show as expired yet
+        queryset = queryset.exclude(status=TaskStatus.EXPIRED).exclude(
+            status=TaskStatus.POSTED, deadline__lt=timezone.now()
+        )
+    
+    return queryset
+
+
+class TaskViewSet(ReplicaReadMixin, viewsets.ModelViewSet):
     """ViewSet for managing tasks"""
     queryset = Task.objects.all()
     serializer_class = TaskSerializer
@@ -25,7 +89,7 @@ class TaskViewSet(viewsets.ModelViewSet):
         - Only authenticated users can create tasks
         - Only task creators can update, partial_update, or delete their tasks
         """
-        if self.action in ['update', 'partial_update', 'destroy']:
+        if self.action in ['update', 'partial_update', 'destroy', 'recurrence']:
             return [permissions.IsAuthenticated(), IsTaskCreator()]
         elif self.action in ['create']:
             return [permissions.IsAuthenticated()]
@@ -34,54 +98,7 @@ class TaskViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         """Return appropriate queryset based on filters"""
-        queryset = Task.objects.all()
-        
-        # Filter by status
-        status_param = self.request.query_params.get('status')
-        if status_param:
-            queryset = queryset.filter(status=status_param)
-        
-        # Filter by category
-        category_param = self.request.query_params.get('category')
-        if category_param:
-            queryset = queryset.filter(category=category_param)
-        
-        # Filter by location
-        location_param = self.request.query_params.get('location')
-        if location_param:
-            queryset = queryset.filter(location__icontains=location_param)
-        
-        # Filter by urgency
-        urgency_param = self.request.query_params.get('urgency')
-        if urgency_param:
-            queryset = queryset.filter(urgency_level__gte=int(urgency_param))
-        
-        # Filter by tag
-        tag_param = self.request.query_params.get('tag')
-        if tag_param:
-            queryset = queryset.filter(tags__name=tag_param)
-        
-        # Filter by search term
-        search_param = self.request.query_params.get('search')
-        if search_param:
-            queryset = queryset.filter(
-                Q(title__icontains=search_param) | 
-                Q(description__icontains=search_param)
-            )
-        
-        # Exclude expired tasks by default, unless specifically requested
-        show_expired = self.request.query_params.get('show_expired', 'false').lower() == 'true'
-        if not show_expired:
-            # Check for and mark expired tasks
-            now = timezone.now()
-            expired_tasks = queryset.filter(status=TaskStatus.POSTED, deadline__lt=now)
-            for task in expired_tasks:
-                task.check_expiry()
-            
-            # Exclude expired tasks
-            queryset = queryset.exclude(status=TaskStatus.EXPIRED)
-        
-        return queryset
+        return filter_tasks(Task.objects.select_related('creator', 'assignee'), self.request.query_params)
     
     def get_serializer_class(self):
         """Return appropriate serializer based on action"""
@@ -91,6 +108,10 @@ class TaskViewSet(viewsets.ModelViewSet):
             return TaskUpdateSerializer
         elif self.action == 'update_status':
             return TaskStatusUpdateSerializer
+        elif self.action == 'bulk_import':
+            return TaskBulkImportSerializer
+        elif self.action == 'recurrence':
+            return RecurrenceRuleSerializer
         return TaskSerializer
     
     def create(self, request, *args, **kwargs):
@@ -99,6 +120,10 @@ class TaskViewSet(viewsets.ModelViewSet):
         serializer.is_valid(raise_exception=True)
         task = serializer.save()
         
+        # Notify the best matching volunteers
+        from core.models import Notification
+        Notification.send_task_created_notification(task)
+        
         # Return response with the created task
         response_serializer = TaskSerializer(task)
         return Response(format_response(
@@ -133,7 +158,7 @@ class TaskViewSet(viewsets.ModelViewSet):
         # Send notification to assignee if one exists
         if instance.assignee:
             from core.models import Notification, NotificationType
-            Notification.send_notification(
+            Notification.enqueue_notification(
                 user=instance.assignee,
                 content=f"Task '{instance.title}' has been cancelled by the creator.",
                 notification_type=NotificationType.TASK_CANCELLED,
@@ -167,6 +192,67 @@ class TaskViewSet(viewsets.ModelViewSet):
             data=response_serializer.data
         ))
 
+    
+    @action(detail=True, methods=['get', 'put', 'delete'], url_path='recurrence')
+    def recurrence(self, request, pk=None):
+        """Custom action to view, set or stop a task's recurrence rule"""
+        task = self.get_object()
+        
+        if request.method == 'PUT':
+            if task.parent_task_id:
+                return Response(format_response(
+                    status='error',
+                    message='Occurrences of a recurring task cannot have their own recurrence.'
+                ), status=status.HTTP_400_BAD_REQUEST)
+            
+            serializer = RecurrenceRuleSerializer(data=request.data, context={'task': task})
+            serializer.is_valid(raise_exception=True)
+            rule = serializer.save()
+            return Response(format_response(
+                status='success',
+                message='Recurrence updated successfully.',
+                data=RecurrenceRuleSerializer(rule).data
+            ))
+        
+        if request.method == 'DELETE':
+            task.set_recurring(False)
+            return Response(format_response(
+                status='success',
+                message='Recurrence stopped.'
+            ))
+        
+        rule = RecurrenceRule.objects.filter(task=task).first()
+        if rule is None:
+            return Response(format_response(
+                status='error',
+                message='Task has no recurrence rule.'
+            ), status=status.HTTP_404_NOT_FOUND)
+        
+        return Response(format_response(
+            status='success',
+            data=RecurrenceRuleSerializer(rule).data
+        ))
+    
+    @action(detail=False, methods=['post'], url_path='import')
+    def bulk_import(self, request):
+        """Custom action to import many tasks at once"""
+        serializer = TaskBulkImportSerializer(data=request.data, context={'creator': request.user})
+        serializer.is_valid(raise_exception=True)
+        result = serializer.save()
+        
+        if not result['created']:
+            return Response(format_response(
+                status='error',
+                message='No tasks were imported.',
+                data=result
+            ), status=status.HTTP_400_BAD_REQUEST)
+        
+        return Response(format_response(
+            status='success',
+            message=f"{result['created']} tasks imported, {result['failed']} rows failed.",
+            data=result
+        ), status=status.HTTP_201_CREATED)
+
 
 class UserTasksView(views.APIView):
     """View for listing tasks created by a specific user"""
@@ -195,7 +281,20 @@ class UserTasksView(views.APIView):
         limit = int(request.query_params.get('limit', 20))
         
         # Paginate results
-        paginated = paginate_results(tasks, page=page, items_per_page=limit)
+        paginated = paginate_results(
+            tasks.select_related('creator', 'assignee').order_by('id'),
+            page=page, items_per_page=limit
+        )
+        
+        # Stream very large pages instead of building the whole payload in memory
+        if limit > settings.API_STREAMING_THRESHOLD:
+            return stream_format_response(
+                status='success',
+                key='tasks',
+                queryset=paginated['data'],
+                serializer_class=TaskSerializer,
+                extra={'pagination': paginated['pagination']}
+            )
         
         # Serialize tasks
         serializer = TaskSerializer(paginated['data'], many=True)
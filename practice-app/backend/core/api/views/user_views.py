@@ -3,13 +3,14 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from core.models import RegisteredUser
 from core.api.serializers.user_serializers import (
-    UserSerializer, UserUpdateSerializer, PasswordChangeSerializer
+    UserSerializer, OwnUserSerializer, UserUpdateSerializer, PasswordChangeSerializer
 )
 from core.permissions import IsOwner
 from core.utils import format_response
+from core.api.views.mixins import ReplicaReadMixin
 
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(ReplicaReadMixin, viewsets.ModelViewSet):
     """ViewSet for managing users"""
     queryset = RegisteredUser.objects.all()
     serializer_class = UserSerializer
@@ -31,6 +32,9 @@ class UserViewSet(viewsets.ModelViewSet):
             return UserUpdateSerializer
         if self.action == 'change_password':
             return PasswordChangeSerializer
+        # Preferences are only shown to the user themselves
+        if self.action == 'retrieve' and self.kwargs.get(self.lookup_field) == str(self.request.user.pk):
+            return OwnUserSerializer
         return UserSerializer
     
     def update(self, request, *args, **kwargs):
@@ -43,7 +47,7 @@ class UserViewSet(viewsets.ModelViewSet):
         
         # Get updated instance
         updated_instance = self.get_object()
-        updated_serializer = UserSerializer(updated_instance)
+        updated_serializer = OwnUserSerializer(updated_instance)
         
         return Response(format_response(
             status='success',
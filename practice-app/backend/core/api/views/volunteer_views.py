@@ -8,11 +8,12 @@ from core.api.serializers.volunteer_serializers import (
 )
 from core.permissions import IsOwner, IsTaskCreator
 from core.utils import format_response, paginate_results
+from core.api.views.mixins import ReplicaReadMixin
 
 
-class VolunteerViewSet(viewsets.ModelViewSet):
+class VolunteerViewSet(ReplicaReadMixin, viewsets.ModelViewSet):
     """ViewSet for managing volunteers"""
-    queryset = Volunteer.objects.all()
+    queryset = Volunteer.objects.select_related('user', 'task__creator', 'task__assignee')
     serializer_class = VolunteerSerializer
     
     def get_permissions(self):
@@ -63,7 +64,7 @@ class VolunteerViewSet(viewsets.ModelViewSet):
         instance = self.get_object()
         
         # Check if user is the task creator
-        if request.user != instance.task.creator:
+        if request.user.id != instance.task.creator_id:
             return Response(format_response(
                 status='error',
                 message='Only the task creator can update volunteer status.'
@@ -110,7 +111,7 @@ class TaskVolunteersView(views.APIView):
         task = get_object_or_404(Task, id=task_id)
         
         # Check if user is the creator
-        if request.user != task.creator:
+        if request.user.id != task.creator_id:
             return Response(format_response(
                 status='error',
                 message='Only the task creator can view volunteers.'
@@ -122,6 +123,7 @@ class TaskVolunteersView(views.APIView):
             volunteers = Volunteer.objects.filter(task=task, status=status_param)
         else:
             volunteers = Volunteer.objects.filter(task=task)
+        volunteers = volunteers.select_related('user', 'task__creator', 'task__assignee')
         
         # Get page and limit parameters
         page = int(request.query_params.get('page', 1))
@@ -147,7 +149,7 @@ class TaskVolunteersView(views.APIView):
         task = get_object_or_404(Task, id=task_id)
         
         # Check if user is the creator
-        if request.user != task.creator:
+        if request.user.id != task.creator_id:
             return Response(format_response(
                 status='error',
                 message='Only the task creator can update volunteer status.'
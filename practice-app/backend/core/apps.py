@@ -4,3 +4,15 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        """Keep the roles of loaded users in sync with role changes and instrument connections"""
+        from django.db.backends.signals import connection_created
+        from django.db.models.signals import post_save, post_delete
+        from core.middleware import instrument_connection
+        from core.models import Administrator
+        from core.permissions import administrator_changed
+
+        post_save.connect(administrator_changed, sender=Administrator, dispatch_uid='administrator_saved')
+        post_delete.connect(administrator_changed, sender=Administrator, dispatch_uid='administrator_deleted')
+        connection_created.connect(instrument_connection, dispatch_uid='instrument_connection')
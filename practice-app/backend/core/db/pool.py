@@ -0,0 +1,179 @@
+"""
+Per-process database connection pool
+
+Django keeps one connection per thread and, with CONN_MAX_AGE, reuses it
+across requests of that thread. The pool instead shares up to max_size
+connections between all threads of a worker process, so the number of
+server connections is bounded per worker regardless of its thread count,
+and threads that find every connection busy wait up to timeout seconds.
+"""
+import threading
+import time
+from collections import deque
+
+
+class PoolTimeout(Exception):
+    """Raised when no connection became free within the pool timeout"""
+
+
+class ConnectionPool:
+    """Bounded pool of reusable connections"""
+
+    def __init__(self, min_size=0, max_size=10, timeout=30.0, max_idle=300.0, is_usable=None):
+        """
+        Args:
+            min_size: Idle connections kept open however long they are unused
+            max_size: Maximum connections open at once
+            timeout: Seconds to wait for a free connection
+            max_idle: Seconds after which an idle connection above min_size is closed
+            is_usable: Optional callable health-checking an idle connection before reuse
+        """
+        if max_size < 1 or not 0 <= min_size <= max_size:
+            raise ValueError('Pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1.')
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.is_usable = is_usable
+        self._idle = deque()
+        self._size = 0
+        self._condition = threading.Condition()
+
+    @property
+    def size(self):
+        """Number of open connections, idle or in use"""
+        return self._size
+
+    @property
+    def idle(self):
+        """Number of idle connections"""
+        return len(self._idle)
+
+    def acquire(self, connect):
+        """
+        Get a connection, reusing an idle one or opening a new one
+
+        Args:
+            connect: Callable opening a new connection when none is idle
+
+        Raises:
+            PoolTimeout: If every connection stayed in use for the pool timeout
+        """
+        deadline = time.monotonic() + self.timeout
+        with self._condition:
+            while not self._idle and self._size >= self.max_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolTimeout(f'No connection became free within {self.timeout} seconds.')
+                self._condition.wait(remaining)
+            # The most recently used connection is the least likely to have gone stale
+            connection = self._idle.pop()[1] if self._idle else None
+            # Reserve the slot of a new connection before connecting outside the lock
+            if connection is None:
+                self._size += 1
+
+        if connection is not None and self.is_usable is not None and not self.is_usable(connection):
+            self._close(connection)
+            connection = None
+
+        if connection is None:
+            try:
+                connection = connect()
+            except BaseException:
+                self._free_slot()
+                raise
+        return connection
+
+    def release(self, connection, discard=False):
+        """Return a connection to the pool, closing it instead if discard is set"""
+        if discard:
+            self._free_slot()
+            self._close(connection)
+            return
+
+        now = time.monotonic()
+        expired = []
+        with self._condition:
+            self._idle.append((now, connection))
+            # The longest idle connections are at the left of the deque
+            while len(self._idle) > self.min_size and now - self._idle[0][0] > self.max_idle:
+                expired.append(self._idle.popleft()[1])
+            self._size -= len(expired)
+            self._condition.notify(1 + len(expired))
+        for stale in expired:
+            self._close(stale)
+
+    def close_all(self):
+        """Close every idle connection"""
+        with self._condition:
+            idle = [connection for _, connection in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._condition.notify_all()
+        for connection in idle:
+            self._close(connection)
+
+    def _free_slot(self):
+        """Give up the slot of a connection that is not coming back"""
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+    def _close(self, connection):
+        """Close a connection, ignoring errors of already broken ones"""
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+# Settings deciding which server and database a pool's connections go to
+CONNECTION_SETTINGS = ('NAME', 'HOST', 'PORT', 'USER')
+
+# alias: (connection settings, pool)
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(alias, settings_dict, is_usable=None):
+    """
+    Get the process-wide pool of a database, None if it is not pooled
+
+    A pool belongs to the connection settings it was created with. When they
+    change in-process, e.g. when the test runner switches NAME to the test
+    database, the old pool is drained and replaced, so its connections are
+    never handed out for the new database.
+
+    Args:
+        alias: Database alias
+        settings_dict: The database's settings, pooled if they contain a POOL dict
+        is_usable: Optional health check of idle connections for a new pool
+
+    Returns:
+        ConnectionPool: The pool, or None
+    """
+    options = settings_dict.get('POOL')
+    if not options:
+        return None
+    key = tuple(settings_dict.get(name) for name in CONNECTION_SETTINGS)
+    with _pools_lock:
+        current = _pools.get(alias)
+        if current is not None and current[0] == key:
+            return current[1]
+        pool = ConnectionPool(
+            min_size=options.get('MIN_SIZE', 0),
+            max_size=options.get('MAX_SIZE', 10),
+            timeout=options.get('TIMEOUT', 30.0),
+            max_idle=options.get('MAX_IDLE', 300.0),
+            is_usable=is_usable,
+        )
+        _pools[alias] = (key, pool)
+    if current is not None:
+        current[1].close_all()
+    return pool
+
+
+def is_current_pool(alias, pool):
+    """Check a pool still serves its database, connections of replaced pools are closed"""
+    current = _pools.get(alias)
+    return current is not None and current[1] is pool
@@ -0,0 +1,99 @@
+"""
+PostgreSQL backend with connection metrics and an optional connection pool
+
+Use it as the ENGINE 'core.db.postgresql'. It behaves like Django's
+PostgreSQL backend, and additionally:
+
+- counts opened connections and failed connection attempts, and times how
+  long each request waited for its connection (db_connection_* metrics)
+- when the database settings contain a POOL dict, takes connections from a
+  per-process core.db.pool.ConnectionPool and returns them to it on close,
+  instead of connecting and disconnecting. A pool is replaced when NAME,
+  HOST, PORT or USER change, and connections go back to the pool they came
+  from only while it is current. POOL accepts MIN_SIZE, MAX_SIZE,
+  TIMEOUT and MAX_IDLE; CONN_MAX_AGE should be 0 so connections go back to
+  the pool at the end of each request, and CONN_HEALTH_CHECKS checks idle
+  connections before they are reused.
+
+Pools are created on first use, so worker processes forked after startup
+each get their own.
+"""
+import time
+
+from django.db.backends.postgresql import base
+
+from core import metrics
+from core.db.pool import PoolTimeout, get_pool, is_current_pool
+
+
+def connection_is_usable(connection):
+    """Check an idle driver connection still answers queries"""
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+    except base.Database.Error:
+        return False
+    return True
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """PostgreSQL connection wrapper recording metrics and using an optional pool"""
+
+    # Pool the current connection was taken from, None if it isn't pooled
+    connection_pool = None
+
+    def get_pool(self):
+        """Get the pool for the current database settings, None if they aren't pooled"""
+        return get_pool(
+            self.alias,
+            self.settings_dict,
+            is_usable=connection_is_usable if self.settings_dict.get('CONN_HEALTH_CHECKS') else None
+        )
+
+    def get_new_connection(self, conn_params):
+        pool = self.connection_pool = self.get_pool()
+        start = time.monotonic()
+        try:
+            if pool is None:
+                connection = self.open_connection(conn_params)
+            else:
+                connection = pool.acquire(lambda: self.open_connection(conn_params))
+                # Reused connections skip the parent method, which sets this
+                self.isolation_level = base.IsolationLevel(
+                    self.settings_dict['OPTIONS'].get('isolation_level', base.IsolationLevel.READ_COMMITTED)
+                )
+        except PoolTimeout as e:
+            metrics.db_connection_errors.inc(database=self.alias, error='pool_timeout')
+            raise self.Database.OperationalError(str(e)) from e
+        metrics.db_connection_wait.observe(time.monotonic() - start, database=self.alias)
+        return connection
+
+    def open_connection(self, conn_params):
+        """Open a new driver connection"""
+        try:
+            connection = super().get_new_connection(conn_params)
+        except self.Database.Error:
+            metrics.db_connection_errors.inc(database=self.alias, error='connect')
+            raise
+        metrics.db_connections_opened.inc(database=self.alias)
+        return connection
+
+    def _close(self):
+        pool = self.connection_pool
+        if pool is None or self.connection is None:
+            return super()._close()
+
+        connection = self.connection
+        # A connection closed inside an atomic block stays referenced until the
+        # block exits, so it can't be handed to another thread yet. Connections
+        # of a replaced pool point at the old database
+        discard = (
+            self.in_atomic_block or self.errors_occurred or bool(connection.closed)
+            or not is_current_pool(self.alias, pool)
+        )
+        if not discard and not connection.autocommit:
+            try:
+                connection.rollback()
+            except self.Database.Error:
+                discard = True
+        pool.release(connection, discard=discard)
@@ -0,0 +1,209 @@
+"""
+Read-replica database router
+
+Reads go to the primary ('default') unless code opts in: ViewSets with
+ReplicaReadMixin send their list/retrieve actions to a replica, and Feed and
+Search send their queries through use_replica. Writes always go to the
+primary. Opted-in reads still use the primary when:
+
+- the same request already wrote, so it reads its own writes
+- the user made a write request within REPLICA_STICKY_SECONDS, so their
+  next requests see it even before the replicas catch up (mark_sticky); the
+  marker is kept in the 'shared' cache so every worker process sees it
+- the replica lags more than REPLICA_MAX_LAG_SECONDS or can't be reached;
+  lag is checked at most every REPLICA_LAG_CHECK_INTERVAL seconds per process
+
+Replica aliases are listed in the DATABASE_REPLICAS setting. Routing state
+lives in context variables, reset for each request by
+ReplicaRoutingMiddleware.
+"""
+import functools
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from django.db.models import QuerySet
+
+from core import metrics
+
+
+# Replica chosen for the reads of the current block, None for the primary
+_replica = ContextVar('replica', default=None)
+# Whether the current request wrote or belongs to a sticky user
+_pinned = ContextVar('pinned', default=False)
+
+# Cache holding sticky markers; must be shared by all worker processes
+STICKY_CACHE = 'shared'
+# App label of the model behind Django's database cache backend
+DATABASE_CACHE_APP_LABEL = 'django_cache'
+
+# alias: (checked at, healthy)
+_health = {}
+_health_lock = threading.Lock()
+
+# Seconds behind the primary, zero when the replica has replayed everything it received
+POSTGRES_LAG_SQL = (
+    'SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 '
+    'ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END'
+)
+
+
+def get_replicas():
+    """Get the configured replica aliases"""
+    return getattr(settings, 'DATABASE_REPLICAS', [])
+
+
+def reset():
+    """Forget the routing state of a previous request"""
+    _replica.set(None)
+    _pinned.set(False)
+
+
+def pin():
+    """Send the remaining reads of the current request to the primary"""
+    _pinned.set(True)
+
+
+def is_pinned():
+    """Check whether reads of the current request must use the primary"""
+    return _pinned.get()
+
+
+def sticky_key(user_id):
+    """Cache key marking a user's reads as pinned to the primary"""
+    return f'replica_sticky:{user_id}'
+
+
+def mark_sticky(user):
+    """Pin a user's reads to the primary for REPLICA_STICKY_SECONDS after a write"""
+    if get_replicas() and settings.REPLICA_STICKY_SECONDS > 0:
+        caches[STICKY_CACHE].set(sticky_key(user.pk), True, settings.REPLICA_STICKY_SECONDS)
+
+
+def is_sticky(user):
+    """Check whether a user wrote recently"""
+    if user is None or not user.is_authenticated or not get_replicas():
+        return False
+    return bool(caches[STICKY_CACHE].get(sticky_key(user.pk)))
+
+
+def get_lag(alias):
+    """Get how many seconds a replica is behind the primary"""
+    connection = connections[alias]
+    if connection.vendor != 'postgresql':
+        return 0.0
+    with connection.cursor() as cursor:
+        cursor.execute(POSTGRES_LAG_SQL)
+        return float(cursor.fetchone()[0] or 0)
+
+
+def is_healthy(alias):
+    """Check a replica is reachable and within the lag limit, caching the result"""
+    now = time.monotonic()
+    checked = _health.get(alias)
+    if checked is not None and now - checked[0] < settings.REPLICA_LAG_CHECK_INTERVAL:
+        return checked[1]
+
+    try:
+        lag = get_lag(alias)
+    except DatabaseError:
+        healthy, reason = False, 'error'
+    else:
+        healthy = lag <= settings.REPLICA_MAX_LAG_SECONDS
+        reason = 'lag'
+    if not healthy:
+        metrics.db_replica_fallbacks.inc(database=alias, reason=reason)
+    with _health_lock:
+        _health[alias] = (now, healthy)
+    return healthy
+
+
+def choose_replica():
+    """Get a healthy replica alias, None when reads must use the primary"""
+    if is_pinned():
+        return None
+    replicas = [alias for alias in get_replicas() if is_healthy(alias)]
+    return random.choice(replicas) if replicas else None
+
+
+def _choose_for(user):
+    """Choose the replica for a user's reads, pinning sticky users to the primary"""
+    if user is not None and is_sticky(user):
+        pin()
+    return choose_replica()
+
+
+def route_reads(user=None):
+    """
+    Send the remaining reads of the current request to a replica when it is safe
+
+    Args:
+        user: Optional user whose recent writes pin the reads to the primary
+
+    Returns:
+        str: Alias of the database reads go to
+    """
+    replica = _choose_for(user)
+    _replica.set(replica)
+    return replica or DEFAULT_DB_ALIAS
+
+
+@contextmanager
+def replica_reads(user=None):
+    """
+    Send reads inside the block to a replica when it is safe
+
+    Args:
+        user: Optional user whose recent writes pin the reads to the primary
+
+    Yields:
+        str: Alias of the database reads go to
+    """
+    replica = _choose_for(user)
+    token = _replica.set(replica)
+    try:
+        yield replica or DEFAULT_DB_ALIAS
+    finally:
+        _replica.reset(token)
+
+
+def use_replica(func):
+    """Decorator sending a function's reads, and the querysets it returns, to a replica"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with replica_reads() as alias:
+            result = func(*args, **kwargs)
+        # Querysets are evaluated later, outside the block
+        if alias != DEFAULT_DB_ALIAS and isinstance(result, QuerySet):
+            result = result.using(alias)
+        return result
+    return wrapper
+
+
+class ReplicaRouter:
+    """Route opted-in reads to replicas and everything else to the primary"""
+
+    def db_for_read(self, model, **hints):
+        # A database cache must not serve stale sticky markers from a replica
+        if is_pinned() or model._meta.app_label == DATABASE_CACHE_APP_LABEL:
+            return DEFAULT_DB_ALIAS
+        return _replica.get() or DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        # Later reads of this request must see the write; cache entries aren't data
+        if model._meta.app_label != DATABASE_CACHE_APP_LABEL:
+            pin()
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas receive the schema through replication
+        return db not in get_replicas()
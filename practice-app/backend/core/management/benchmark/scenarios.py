@@ -0,0 +1,296 @@
+"""
+API benchmark scenarios
+
+Each scenario runs one operation repeatedly against the current database and
+reports latency percentiles and query counts. Write scenarios run inside a
+transaction that is rolled back, so a generated dataset (see the
+generate_load_data command) can be benchmarked any number of times.
+Results are compared against a stored JSON baseline by the run_benchmarks
+command.
+"""
+import itertools
+import json
+import math
+import os
+import statistics
+import time
+from contextlib import ExitStack
+
+from django.db import connections, transaction
+from django.db.models import Count
+from django.test import override_settings
+from rest_framework.test import APIClient
+
+from core.middleware import QueryStats
+from core.models import (
+    RegisteredUser, Task, TaskStatus, Volunteer, VolunteerStatus, Notification, Comment, Feed, Search,
+    Tag
+)
+
+
+class ScenarioSkipped(Exception):
+    """Raised when the database has no data for a scenario"""
+
+
+def percentile(values, percent):
+    """Nearest-rank percentile of a list of numbers"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def measure(operation):
+    """
+    Run an operation once, measuring its latency and queries
+
+    Returns:
+        tuple: (milliseconds, query count)
+    """
+    stats = QueryStats()
+    with ExitStack() as stack:
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(stats))
+        start = time.perf_counter()
+        operation()
+        elapsed = time.perf_counter() - start
+    return elapsed * 1000, stats.count
+
+
+def client_for(user):
+    """API client authenticated as a user"""
+    client = APIClient(SERVER_NAME='localhost')
+    client.force_authenticate(user=user)
+    return client
+
+
+def check_response(response):
+    """Fail the scenario on an unexpected status code"""
+    if response.status_code >= 400:
+        raise AssertionError(f'Unexpected status {response.status_code}: {response.content[:200]!r}')
+
+
+def busiest_user():
+    """User with the most notifications, a worst case for per-user lists"""
+    row = Notification.objects.values('user_id').order_by().annotate(
+        total=Count('id')
+    ).order_by('-total').first()
+    if row is None:
+        user = RegisteredUser.objects.order_by('id').first()
+    else:
+        user = RegisteredUser.objects.get(id=row['user_id'])
+    if user is None:
+        raise ScenarioSkipped('no users')
+    return user
+
+
+def feed_scenario():
+    """Load the first page of a user's feed"""
+    user = busiest_user()
+    return lambda: list(Feed(user).load_feed(page=1, items_per_page=20))
+
+
+def search_scenario():
+    """Keyword and category search over open tasks"""
+    task = Task.objects.filter(status=TaskStatus.POSTED).order_by('id').first()
+    if task is None:
+        raise ScenarioSkipped('no posted tasks')
+    keyword = task.title.split()[0]
+    return lambda: list(Search.complex_search(keywords=keyword, category=task.category)[:20])
+
+
+def task_list_scenario():
+    """First page of the task list API"""
+    client = client_for(busiest_user())
+
+    def operation():
+        check_response(client.get('/api/tasks/', {'page': 1, 'limit': 20}))
+    return operation
+
+
+def notification_list_scenario():
+    """First page of the notification list API for the busiest user"""
+    client = client_for(busiest_user())
+
+    def operation():
+        check_response(client.get('/api/notifications/', {'page': 1, 'limit': 20}))
+    return operation
+
+
+def task_page_scenario(parallel=None):
+    """
+    Async task page: the task with its comments, photos and reviews
+
+    Args:
+        parallel: Override ASYNC_PARALLEL_QUERIES, None to use the setting
+    """
+    row = Comment.objects.values('task_id').order_by().annotate(
+        total=Count('id')
+    ).order_by('-total').first()
+    task_id = row['task_id'] if row else Task.objects.order_by('id').values_list('id', flat=True).first()
+    if task_id is None:
+        raise ScenarioSkipped('no tasks')
+    client = client_for(busiest_user())
+
+    # Queries made in worker threads by parallel pieces are not counted
+    def operation():
+        with ExitStack() as stack:
+            if parallel is not None:
+                stack.enter_context(override_settings(ASYNC_PARALLEL_QUERIES=parallel))
+            check_response(client.get(f'/api/async/tasks/{task_id}/', {'page': 1, 'limit': 20}))
+    return operation
+
+
+def task_page_serial_scenario():
+    """Async task page loading its pieces one after another, for comparison"""
+    return task_page_scenario(parallel=False)
+
+
+def tag_suggest_scenario():
+    """Tag autocomplete API for a two letter prefix, bypassing the suggestion cache"""
+    tag = Tag.objects.order_by('-usage_count', 'name').first()
+    if tag is None:
+        raise ScenarioSkipped('no tags')
+    client = client_for(busiest_user())
+
+    def operation():
+        with override_settings(TAG_SUGGESTION_CACHE_SECONDS=0):
+            check_response(client.get('/api/tags/suggest/', {'q': tag.name[:2]}))
+    return operation
+
+
+def volunteer_accept_scenario():
+    """Task creator accepts a pending volunteer (rolled back)"""
+    volunteers = list(
+        Volunteer.objects.filter(status=VolunteerStatus.PENDING, task__status=TaskStatus.POSTED)
+        .select_related('task__creator').order_by('id')[:50]
+    )
+    if not volunteers:
+        raise ScenarioSkipped('no pending volunteers')
+    cycle = itertools.cycle(volunteers)
+
+    def operation():
+        volunteer = next(cycle)
+        client = client_for(volunteer.task.creator)
+        check_response(client.patch(
+            f'/api/volunteers/{volunteer.id}/', {'status': VolunteerStatus.ACCEPTED}, format='json'
+        ))
+    return operation
+
+
+def review_submit_scenario():
+    """Task creator reviews the assignee of a completed task (rolled back)"""
+    tasks = list(
+        Task.objects.filter(status=TaskStatus.COMPLETED, assignee__isnull=False)
+        .select_related('creator').order_by('id')[:50]
+    )
+    if not tasks:
+        raise ScenarioSkipped('no completed tasks')
+    cycle = itertools.cycle(tasks)
+
+    def operation():
+        task = next(cycle)
+        client = client_for(task.creator)
+        check_response(client.post('/api/reviews/', {
+            'score': 5,
+            'comment': 'Benchmark review',
+            'reviewee_id': task.assignee_id,
+            'task_id': task.id,
+        }, format='json'))
+    return operation
+
+
+# name: (setup returning the operation, whether the operation writes)
+SCENARIOS = {
+    'feed': (feed_scenario, False),
+    'search': (search_scenario, False),
+    'task_list': (task_list_scenario, False),
+    'notification_list': (notification_list_scenario, False),
+    'task_page': (task_page_scenario, False),
+    'task_page_serial': (task_page_serial_scenario, False),
+    'tag_suggest': (tag_suggest_scenario, False),
+    'volunteer_accept': (volunteer_accept_scenario, True),
+    'review_submit': (review_submit_scenario, True),
+}
+
+
+def run_scenario(name, iterations=50, warmup=3):
+    """
+    Run a benchmark scenario
+
+    Args:
+        name: Scenario name from SCENARIOS
+        iterations: Number of measured runs
+        warmup: Number of unmeasured runs first
+
+    Returns:
+        dict: p50, p95 and mean latency in milliseconds and query counts
+    """
+    setup, writes = SCENARIOS[name]
+    operation = setup()
+
+    def run_once():
+        if not writes:
+            return measure(operation)
+        with transaction.atomic():
+            result = measure(operation)
+            transaction.set_rollback(True)
+        return result
+
+    for _ in range(warmup):
+        run_once()
+
+    latencies, queries = [], []
+    for _ in range(iterations):
+        elapsed, count = run_once()
+        latencies.append(elapsed)
+        queries.append(count)
+
+    return {
+        'iterations': iterations,
+        'p50_ms': round(percentile(latencies, 50), 2),
+        'p95_ms': round(percentile(latencies, 95), 2),
+        'mean_ms': round(statistics.mean(latencies), 2),
+        'queries': max(queries),
+    }
+
+
+def load_baseline(path):
+    """Load stored benchmark results, empty if there are none"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(path, results):
+    """Store benchmark results as the new baseline"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def compare(results, baseline, tolerance=0.2):
+    """
+    Compare benchmark results against a baseline
+
+    A scenario regresses when it issues more queries than its baseline, or
+    when its p95 latency exceeds the baseline by more than the tolerance.
+
+    Returns:
+        list: Regression messages
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        if result['queries'] > base['queries']:
+            regressions.append(f"{name}: {result['queries']} queries (baseline {base['queries']})")
+        limit = base['p95_ms'] * (1 + tolerance)
+        if result['p95_ms'] > limit:
+            regressions.append(
+                f"{name}: p95 {result['p95_ms']} ms (baseline {base['p95_ms']} ms, limit {limit:.2f} ms)"
+            )
+    return regressions
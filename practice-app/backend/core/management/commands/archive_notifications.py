@@ -0,0 +1,37 @@
+import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.models import Notification, ArchivedNotification
+
+
+class Command(BaseCommand):
+    """Apply the notification retention policy"""
+    help = (
+        'Move read notifications older than the retention period to the archive '
+        'table, and optionally purge old archived notifications. Run it daily.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.NOTIFICATION_RETENTION_DAYS,
+                            help='Archive read notifications older than this many days')
+        parser.add_argument('--purge-days', type=int,
+                            default=settings.NOTIFICATION_ARCHIVE_RETENTION_DAYS,
+                            help='Delete archived notifications older than this many days (0 keeps them)')
+        parser.add_argument('--batch-size', type=int, default=settings.NOTIFICATION_ARCHIVE_BATCH_SIZE,
+                            help='Number of notifications moved per transaction')
+
+    def handle(self, *args, **options):
+        archived = Notification.archive_read(
+            older_than=datetime.timedelta(days=options['days']),
+            batch_size=options['batch_size']
+        )
+        self.stdout.write(f'Archived {archived} notifications.')
+
+        if options['purge_days'] > 0:
+            purged = ArchivedNotification.purge(
+                older_than=datetime.timedelta(days=options['purge_days']),
+                batch_size=options['batch_size']
+            )
+            self.stdout.write(f'Purged {purged} archived notifications.')
@@ -0,0 +1,92 @@
+import datetime
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from io import BytesIO
+
+from core.api.parsers import FastJSONParser
+from core.api.renderers import FastJSONRenderer, orjson
+from core.api.serializers.task_serializers import TaskSerializer
+from core.models import RegisteredUser, Task, TaskCategory
+from core.utils import format_response
+
+
+class Command(BaseCommand):
+    """Compare JSON renderer/parser throughput on large task list payloads"""
+    help = 'Benchmark the stdlib and orjson JSON renderers on a task list payload'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tasks', type=int, default=1000,
+                            help='Number of tasks in the payload')
+        parser.add_argument('--iterations', type=int, default=50,
+                            help='Number of times each renderer runs')
+
+    def build_payload(self, count):
+        """Build a serialized task list payload without touching the database"""
+        creator = RegisteredUser(
+            id=1, email='creator@example.com', name='Task', surname='Creator',
+            username='creator', phone_number='1234567890', location='Somewhere'
+        )
+        assignee = RegisteredUser(
+            id=2, email='assignee@example.com', name='Task', surname='Assignee',
+            username='assignee', phone_number='0987654321', location='Elsewhere'
+        )
+        categories = [choice[0] for choice in TaskCategory.choices]
+        now = timezone.now()
+
+        tasks = []
+        for i in range(count):
+            tasks.append(Task(
+                id=i + 1,
+                title=f'Task {i}',
+                description='Need help with something in the neighborhood. ' * 3,
+                category=categories[i % len(categories)],
+                location=f'{i} Main Street',
+                deadline=now + datetime.timedelta(days=i % 30 + 1),
+                requirements='None',
+                urgency_level=i % 5,
+                volunteer_number=1,
+                creator=creator,
+                assignee=assignee if i % 2 else None,
+                created_at=now,
+                updated_at=now,
+            ))
+
+        return format_response(
+            status='success',
+            data={'tasks': TaskSerializer(tasks, many=True).data}
+        )
+
+    def time_it(self, func, iterations):
+        """Return the average seconds per call of func"""
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        return (time.perf_counter() - start) / iterations
+
+    def handle(self, *args, **options):
+        count = options['tasks']
+        iterations = options['iterations']
+        payload = self.build_payload(count)
+
+        stdlib_renderer = JSONRenderer()
+        fast_renderer = FastJSONRenderer()
+        body = stdlib_renderer.render(payload)
+
+        results = [
+            ('render stdlib', self.time_it(lambda: stdlib_renderer.render(payload), iterations)),
+            ('render fast', self.time_it(lambda: fast_renderer.render(payload), iterations)),
+            ('parse stdlib', self.time_it(lambda: JSONParser().parse(BytesIO(body)), iterations)),
+            ('parse fast', self.time_it(lambda: FastJSONParser().parse(BytesIO(body)), iterations)),
+        ]
+
+        self.stdout.write(f'Payload: {count} tasks, {len(body) / 1024:.1f} KiB')
+        self.stdout.write(f"orjson installed: {'yes' if orjson is not None else 'no (fast == stdlib)'}")
+        for name, seconds in results:
+            self.stdout.write(
+                f'{name:<14} {seconds * 1000:8.2f} ms/payload  '
+                f'{len(body) / seconds / (1024 * 1024):8.1f} MiB/s'
+            )
@@ -0,0 +1,310 @@
+import datetime
+import itertools
+import random
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from core.models import (
+    RegisteredUser, Task, TaskCategory, TaskStatus, Volunteer, VolunteerStatus,
+    Review, Notification, NotificationType, Bookmark, Tag, VolunteerCandidate
+)
+
+
+DISTRICTS = [
+    'Kadikoy', 'Besiktas', 'Sisli', 'Uskudar', 'Beyoglu', 'Fatih', 'Atasehir',
+    'Maltepe', 'Bakirkoy', 'Sariyer', 'Kartal', 'Pendik', 'Umraniye', 'Esenyurt',
+]
+STREETS = ['Main St', 'Oak Ave', 'Station Rd', 'Park Ln', 'Market St', 'Hill Rd', 'Bridge St']
+
+# Relative frequencies of task categories and statuses
+CATEGORY_WEIGHTS = {
+    TaskCategory.GROCERY_SHOPPING: 30,
+    TaskCategory.TUTORING: 20,
+    TaskCategory.HOME_REPAIR: 15,
+    TaskCategory.MOVING_HELP: 12,
+    TaskCategory.HOUSE_CLEANING: 13,
+    TaskCategory.OTHER: 10,
+}
+STATUS_WEIGHTS = {
+    TaskStatus.POSTED: 50,
+    TaskStatus.ASSIGNED: 12,
+    TaskStatus.IN_PROGRESS: 8,
+    TaskStatus.COMPLETED: 22,
+    TaskStatus.CANCELLED: 4,
+    TaskStatus.EXPIRED: 4,
+}
+WORDS = [
+    'help', 'needed', 'urgent', 'weekend', 'groceries', 'math', 'english', 'furniture',
+    'move', 'boxes', 'paint', 'fix', 'leak', 'garden', 'clean', 'kitchen', 'elderly',
+    'neighbor', 'pharmacy', 'pickup', 'homework', 'laptop', 'shelf', 'door',
+]
+
+
+def zipf_weights(count, exponent):
+    """Cumulative weights giving rank r a probability proportional to 1 / r**exponent"""
+    return list(itertools.accumulate(1.0 / rank ** exponent for rank in range(1, count + 1)))
+
+
+def chunks(iterable, size):
+    """Yield lists of up to size items"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class Command(BaseCommand):
+    """Generate a large synthetic dataset for load tests and benchmarks"""
+    help = (
+        'Bulk create users, tasks, volunteers, reviews, notifications, bookmarks and tags '
+        'with skewed, realistic distributions: a few users create most tasks, a few '
+        'tasks attract most volunteers. Never run it against production.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=10000,
+                            help='Number of users to create')
+        parser.add_argument('--tasks', type=int, default=None,
+                            help='Number of tasks to create (default: 3 per user)')
+        parser.add_argument('--volunteers-per-task', type=float, default=3.0,
+                            help='Mean number of volunteers per task')
+        parser.add_argument('--notifications-per-user', type=float, default=20.0,
+                            help='Mean number of notifications per user')
+        parser.add_argument('--bookmarks-per-user', type=float, default=2.0,
+                            help='Mean number of bookmarks per user')
+        parser.add_argument('--tags', type=int, default=500,
+                            help='Number of tags to create')
+        parser.add_argument('--tags-per-task', type=float, default=2.0,
+                            help='Mean number of tags per task')
+        parser.add_argument('--batch-size', type=int, default=5000,
+                            help='Number of rows inserted per query')
+        parser.add_argument('--seed', type=int, default=None,
+                            help='Random seed for a reproducible dataset')
+        parser.add_argument('--prefix', default='load',
+                            help='Prefix of generated usernames and emails')
+        parser.add_argument('--password', default='loadtest123',
+                            help='Password of every generated user')
+
+    def handle(self, *args, **options):
+        if options['users'] < 2:
+            raise CommandError('At least 2 users are needed.')
+
+        self.random = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        task_count = options['tasks'] if options['tasks'] is not None else options['users'] * 3
+
+        user_ids = self.create_users(options['users'], options['prefix'], options['password'])
+        self.stdout.write(f'Created {len(user_ids)} users.')
+
+        tasks = self.create_tasks(user_ids, task_count)
+        self.stdout.write(f'Created {len(tasks)} tasks.')
+
+        volunteers = self.create_volunteers(user_ids, tasks, options['volunteers_per_task'])
+        self.stdout.write(f'Created {volunteers} volunteers.')
+
+        reviews = self.create_reviews(tasks)
+        self.stdout.write(f'Created {reviews} reviews.')
+
+        notifications = self.create_notifications(user_ids, tasks, options['notifications_per_user'])
+        self.stdout.write(f'Created {notifications} notifications.')
+
+        bookmarks = self.create_bookmarks(user_ids, tasks, options['bookmarks_per_user'])
+        self.stdout.write(f'Created {bookmarks} bookmarks.')
+
+        tag_links = self.create_tags(tasks, options['tags'], options['tags_per_task'])
+        self.stdout.write(f'Created {tag_links} task tags.')
+
+        # Rows were bulk inserted, bypassing the counter updates
+        counted = Task.recount_counters()
+        self.stdout.write(f'Counted related rows of {counted} tasks.')
+        counted = Tag.refresh_usage_counts()
+        self.stdout.write(f'Counted usage of {counted} tags.')
+
+        entries = VolunteerCandidate.rebuild()
+        self.stdout.write(self.style.SUCCESS(f'Done. Rebuilt candidate index with {entries} entries.'))
+
+    def sample_count(self, mean):
+        """Draw a skewed non-negative count with the given mean"""
+        if mean <= 0:
+            return 0
+        return int(self.random.expovariate(1.0 / mean) + 0.5)
+
+    def location(self):
+        """Random street address in a district"""
+        district = self.random.choice(DISTRICTS)
+        return f'{self.random.randint(1, 200)} {self.random.choice(STREETS)}, {district}'
+
+    def create_users(self, count, prefix, password):
+        """Create users, returning their ids"""
+        # Hash once; hashing per user would dominate the run time
+        password_hash = make_password(password)
+        start = RegisteredUser.objects.filter(username__startswith=f'{prefix}_').count()
+        usernames = []
+
+        for batch in chunks(range(start, start + count), self.batch_size):
+            users = [
+                RegisteredUser(
+                    email=f'{prefix}_{i}@example.com',
+                    name=f'Load{i}',
+                    surname='User',
+                    username=f'{prefix}_{i}',
+                    phone_number=f'555{i:07d}'[-10:],
+                    location=self.location(),
+                    rating=round(min(5.0, max(0.0, self.random.gauss(3.8, 0.8))), 2),
+                    password=password_hash,
+                )
+                for i in batch
+            ]
+            RegisteredUser.objects.bulk_create(users)
+            usernames.extend(user.username for user in users)
+
+        user_ids = []
+        for batch in chunks(usernames, self.batch_size):
+            user_ids.extend(RegisteredUser.objects.filter(username__in=batch).values_list('id', flat=True))
+        return user_ids
+
+    def create_tasks(self, user_ids, count):
+        """Create tasks, returning (id, creator_id, assignee_id, status, category) tuples"""
+        now = timezone.now()
+        # A few very active users create most of the tasks
+        creator_weights = zipf_weights(len(user_ids), 1.1)
+        creators = self.random.sample(user_ids, len(user_ids))
+        categories, category_weights = zip(*CATEGORY_WEIGHTS.items())
+        statuses, status_weights = zip(*STATUS_WEIGHTS.items())
+        created = []
+
+        for batch in chunks(range(count), self.batch_size):
+            tasks = []
+            for _ in batch:
+                creator_id = self.random.choices(creators, cum_weights=creator_weights)[0]
+                status = self.random.choices(statuses, weights=status_weights)[0]
+                assignee_id = None
+                if status in (TaskStatus.ASSIGNED, TaskStatus.IN_PROGRESS, TaskStatus.COMPLETED):
+                    index = self.random.randrange(len(user_ids))
+                    if user_ids[index] == creator_id:
+                        index = (index + 1) % len(user_ids)
+                    assignee_id = user_ids[index]
+                if status in (TaskStatus.COMPLETED, TaskStatus.EXPIRED):
+                    deadline = now - datetime.timedelta(hours=self.random.randint(1, 24 * 90))
+                else:
+                    deadline = now + datetime.timedelta(hours=self.random.randint(1, 24 * 60))
+                words = self.random.sample(WORDS, 4)
+                tasks.append(Task(
+                    title=' '.join(words[:3]).capitalize(),
+                    description=' '.join(self.random.choices(WORDS, k=20)),
+                    category=self.random.choices(categories, weights=category_weights)[0],
+                    location=self.location(),
+                    deadline=deadline,
+                    urgency_level=self.random.choices([0, 1, 2, 3], weights=[50, 30, 15, 5])[0],
+                    volunteer_number=self.random.choices([1, 2, 3, 5], weights=[70, 20, 7, 3])[0],
+                    status=status,
+                    creator_id=creator_id,
+                    assignee_id=assignee_id,
+                ))
+            with transaction.atomic():
+                Task.objects.bulk_create(tasks)
+            created.extend(
+                (task.id, task.creator_id, task.assignee_id, task.status, task.category)
+                for task in tasks
+            )
+        return created
+
+    def create_volunteers(self, user_ids, tasks, mean):
+        """Create volunteers, with popular tasks attracting most of them"""
+        def rows():
+            for task_id, creator_id, assignee_id, status, _ in tasks:
+                count = min(self.sample_count(mean), len(user_ids) - 1)
+                chosen = set(self.random.sample(user_ids, count))
+                chosen.discard(creator_id)
+                if assignee_id:
+                    chosen.add(assignee_id)
+                for user_id in chosen:
+                    if user_id == assignee_id:
+                        volunteer_status = VolunteerStatus.ACCEPTED
+                    elif status == TaskStatus.POSTED:
+                        volunteer_status = VolunteerStatus.PENDING
+                    else:
+                        volunteer_status = VolunteerStatus.REJECTED
+                    yield Volunteer(task_id=task_id, user_id=user_id, status=volunteer_status)
+
+        return self.insert(Volunteer, rows())
+
+    def create_reviews(self, tasks):
+        """Create reviews for completed tasks, by the creator and often by the assignee"""
+        def rows():
+            for task_id, creator_id, assignee_id, status, _ in tasks:
+                if status != TaskStatus.COMPLETED or not assignee_id:
+                    continue
+                score = min(5.0, max(1.0, round(self.random.gauss(4.2, 0.8))))
+                yield Review(task_id=task_id, reviewer_id=creator_id, reviewee_id=assignee_id,
+                             score=score, comment='Generated review')
+                if self.random.random() < 0.6:
+                    yield Review(task_id=task_id, reviewer_id=assignee_id, reviewee_id=creator_id,
+                                 score=min(5.0, score + 0.5), comment='Generated review')
+
+        return self.insert(Review, rows())
+
+    def create_notifications(self, user_ids, tasks, mean):
+        """Create notifications, most of them already read"""
+        types = [choice for choice, _ in NotificationType.choices]
+
+        def rows():
+            for user_id in user_ids:
+                for _ in range(self.sample_count(mean)):
+                    task = self.random.choice(tasks) if tasks else None
+                    yield Notification(
+                        user_id=user_id,
+                        related_task_id=task[0] if task else None,
+                        type=self.random.choice(types),
+                        content='Generated notification',
+                        is_read=self.random.random() < 0.8,
+                    )
+
+        return self.insert(Notification, rows())
+
+    def create_bookmarks(self, user_ids, tasks, mean):
+        """Create bookmarks of random tasks"""
+        if not tasks:
+            return 0
+
+        def rows():
+            for user_id in user_ids:
+                count = min(self.sample_count(mean), len(tasks))
+                for task in self.random.sample(tasks, count):
+                    yield Bookmark(user_id=user_id, task_id=task[0])
+
+        return self.insert(Bookmark, rows())
+
+    def create_tags(self, tasks, count, mean):
+        """Create tags and link tasks to them, with a few tags used by most tasks"""
+        if count <= 0 or not tasks:
+            return 0
+        names = [f'{WORDS[i % len(WORDS)]}-{i // len(WORDS)}' for i in range(count)]
+        self.insert(Tag, (Tag(name=name) for name in names))
+        tag_ids = list(Tag.objects.filter(name__in=names).values_list('id', flat=True))
+        tag_weights = zipf_weights(len(tag_ids), 1.0)
+        TaskTag = Tag.tasks.through
+
+        def rows():
+            for task in tasks:
+                chosen = set(self.random.choices(
+                    tag_ids, cum_weights=tag_weights, k=self.sample_count(mean)
+                ))
+                for tag_id in chosen:
+                    yield TaskTag(task_id=task[0], tag_id=tag_id)
+
+        return self.insert(TaskTag, rows())
+
+    def insert(self, model, rows):
+        """Bulk insert generated rows in batches"""
+        total = 0
+        for batch in chunks(rows, self.batch_size):
+            with transaction.atomic():
+                model.objects.bulk_create(batch, ignore_conflicts=True)
+            total += len(batch)
+        return total
@@ -0,0 +1,86 @@
+import csv
+import json
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.api.serializers.task_serializers import TaskBulkImportSerializer
+from core.models import RegisteredUser
+
+
+class Command(BaseCommand):
+    """Import tasks from a CSV or JSON file"""
+    help = (
+        'Bulk import tasks from a CSV or JSON file. CSV columns match the task '
+        'fields; the optional "tags" column holds comma separated tag names.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Path to a .csv or .json file')
+        parser.add_argument('--creator', required=True,
+                            help='Email of the user the tasks are created for')
+        parser.add_argument('--chunk-size', type=int, default=settings.TASK_IMPORT_CHUNK_SIZE,
+                            help='Number of tasks inserted per transaction')
+
+    def read_rows(self, path):
+        """Read task rows from a CSV or JSON file"""
+        extension = os.path.splitext(path)[1].lower()
+
+        with open(path, newline='', encoding='utf-8') as f:
+            if extension == '.json':
+                rows = json.load(f)
+                if isinstance(rows, dict):
+                    rows = rows.get('tasks', [])
+                return rows
+
+            if extension == '.csv':
+                rows = []
+                for row in csv.DictReader(f):
+                    # Empty cells fall back to the model defaults
+                    row = {key: value for key, value in row.items() if value not in (None, '')}
+                    if 'tags' in row:
+                        row['tags'] = [tag.strip() for tag in row['tags'].split(',') if tag.strip()]
+                    rows.append(row)
+                return rows
+
+        raise CommandError(f"Unsupported file type '{extension}'. Use .csv or .json.")
+
+    def handle(self, *args, **options):
+        try:
+            creator = RegisteredUser.objects.get(email=options['creator'])
+        except RegisteredUser.DoesNotExist:
+            raise CommandError(f"User '{options['creator']}' not found.")
+
+        try:
+            rows = self.read_rows(options['path'])
+        except (OSError, ValueError) as e:
+            raise CommandError(f'Could not read {options["path"]}: {e}')
+
+        if not rows:
+            raise CommandError('No rows to import.')
+
+        result = {'created': 0, 'failed': 0, 'errors': []}
+        # Keep each request-sized batch within the serializer's row limit
+        max_rows = settings.TASK_IMPORT_MAX_ROWS
+        for start in range(0, len(rows), max_rows):
+            serializer = TaskBulkImportSerializer(
+                data={'tasks': rows[start:start + max_rows]},
+                context={'creator': creator, 'chunk_size': options['chunk_size']}
+            )
+            if not serializer.is_valid():
+                raise CommandError(serializer.errors)
+            batch = serializer.save()
+
+            result['created'] += batch['created']
+            result['failed'] += batch['failed']
+            result['errors'].extend(
+                dict(error, row=error['row'] + start) for error in batch['errors']
+            )
+
+        for error in result['errors']:
+            self.stderr.write(f"Row {error['row']}: {error['errors']}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {result['created']} tasks, {result['failed']} rows failed."
+        ))
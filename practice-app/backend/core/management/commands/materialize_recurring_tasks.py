@@ -0,0 +1,39 @@
+import datetime
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.models import RecurrenceRule
+
+
+class Command(BaseCommand):
+    """Create upcoming occurrences of recurring tasks"""
+    help = (
+        'Materialize occurrences of recurring tasks due within the horizon. '
+        'Run it from cron, or with --loop as a long running worker.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--horizon-days', type=int, default=settings.RECURRENCE_HORIZON_DAYS,
+                            help='How many days ahead occurrences are created')
+        parser.add_argument('--batch-size', type=int, default=settings.RECURRENCE_BATCH_SIZE,
+                            help='Number of recurrence rules processed per transaction')
+        parser.add_argument('--loop', action='store_true',
+                            help='Keep running, materializing every --interval seconds')
+        parser.add_argument('--interval', type=int, default=300,
+                            help='Seconds to sleep between runs with --loop')
+
+    def handle(self, *args, **options):
+        horizon = datetime.timedelta(days=options['horizon_days'])
+
+        while True:
+            created = RecurrenceRule.materialize_due(
+                horizon=horizon,
+                batch_size=options['batch_size']
+            )
+            self.stdout.write(f'Materialized {created} recurring task occurrences.')
+
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
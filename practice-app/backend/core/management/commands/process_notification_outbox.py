@@ -0,0 +1,46 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.models import NotificationOutbox
+from core.notification_queue import get_push_backend
+
+
+class Command(BaseCommand):
+    """Deliver queued notifications from the outbox"""
+    help = (
+        'Move pending notification outbox entries to notifications in batches. '
+        'Run it from cron, or with --loop as a long running worker.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=settings.NOTIFICATION_BATCH_SIZE,
+                            help='Number of outbox entries delivered per transaction')
+        parser.add_argument('--max-attempts', type=int,
+                            default=settings.NOTIFICATION_OUTBOX_MAX_ATTEMPTS,
+                            help='Attempts before an entry is marked failed')
+        parser.add_argument('--loop', action='store_true',
+                            help='Keep running, polling every --interval seconds when idle')
+        parser.add_argument('--interval', type=float, default=1.0,
+                            help='Seconds to sleep when the outbox is empty with --loop')
+
+    def handle(self, *args, **options):
+        deliver = get_push_backend()
+
+        while True:
+            total = 0
+            while True:
+                delivered = NotificationOutbox.drain(
+                    batch_size=options['batch_size'],
+                    max_attempts=options['max_attempts'],
+                    deliver=deliver
+                )
+                total += delivered
+                if delivered < options['batch_size']:
+                    break
+            self.stdout.write(f'Delivered {total} notifications.')
+
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
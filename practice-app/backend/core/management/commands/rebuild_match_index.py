@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from core.models import VolunteerCandidate
+
+
+class Command(BaseCommand):
+    """Rebuild the precomputed volunteer candidate index"""
+    help = (
+        'Recompute volunteer candidate entries from volunteering history, '
+        'completed tasks, ratings and current load. Run periodically to pick '
+        'up rating and location changes.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Number of entries inserted per query')
+
+    def handle(self, *args, **options):
+        count = VolunteerCandidate.rebuild(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt candidate index with {count} entries.'))
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from core.models import Task, Comment
+
+
+class Command(BaseCommand):
+    """Repair the denormalized counters on tasks"""
+    help = (
+        'Recount comment, volunteer, bookmark and photo counts of tasks and fix '
+        'the ones that drifted, e.g. after rows were deleted outside the model methods. '
+        'Reply counts of comments are recounted too.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Number of tasks updated per query')
+
+    def handle(self, *args, **options):
+        fixed = Task.recount_counters(batch_size=options['batch_size'])
+        self.stdout.write(f'Recounted counters of {fixed} tasks.')
+        comments = Comment.recount_replies()
+        self.stdout.write(self.style.SUCCESS(f'Recounted replies of {comments} comments.'))
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from core.models import Tag
+
+
+class Command(BaseCommand):
+    """Recount how often each tag is used"""
+    help = (
+        'Recount the tasks and bookmarks using each tag, which rank tag '
+        'suggestions, e.g. after links were changed outside the model methods.'
+    )
+
+    def handle(self, *args, **options):
+        updated = Tag.refresh_usage_counts()
+        self.stdout.write(self.style.SUCCESS(f'Refreshed usage counts of {updated} tags.'))
@@ -0,0 +1,66 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.management.benchmark import scenarios
+
+
+class Command(BaseCommand):
+    """Benchmark the main API paths against the current database"""
+    help = (
+        'Run the benchmark scenarios (feed, search, task list, notification list, task page, '
+        'volunteer accept, review submit) and report p50/p95 latency and query counts. '
+        'Load a dataset with generate_load_data first. Write scenarios are rolled back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('scenarios', nargs='*',
+                            help=f'Scenarios to run (default: all of {", ".join(scenarios.SCENARIOS)})')
+        parser.add_argument('--iterations', type=int, default=50,
+                            help='Measured runs per scenario')
+        parser.add_argument('--warmup', type=int, default=3,
+                            help='Unmeasured runs per scenario before measuring')
+        parser.add_argument('--baseline', default=settings.BENCHMARK_BASELINE_PATH,
+                            help='Path of the baseline JSON file')
+        parser.add_argument('--save-baseline', action='store_true',
+                            help='Store the results as the new baseline')
+        parser.add_argument('--compare', action='store_true',
+                            help='Fail if a scenario regressed against the baseline')
+        parser.add_argument('--tolerance', type=float, default=0.2,
+                            help='Allowed p95 latency increase over the baseline (0.2 = 20%%)')
+
+    def handle(self, *args, **options):
+        names = options['scenarios'] or list(scenarios.SCENARIOS)
+        unknown = [name for name in names if name not in scenarios.SCENARIOS]
+        if unknown:
+            raise CommandError(f"Unknown scenarios: {', '.join(unknown)}")
+
+        results = {}
+        self.stdout.write(f"{'scenario':<20}{'p50 ms':>10}{'p95 ms':>10}{'mean ms':>10}{'queries':>9}")
+        for name in names:
+            try:
+                result = scenarios.run_scenario(
+                    name, iterations=options['iterations'], warmup=options['warmup']
+                )
+            except scenarios.ScenarioSkipped as e:
+                self.stdout.write(f'{name:<20}skipped ({e})')
+                continue
+            results[name] = result
+            self.stdout.write(
+                f"{name:<20}{result['p50_ms']:>10}{result['p95_ms']:>10}"
+                f"{result['mean_ms']:>10}{result['queries']:>9}"
+            )
+
+        if options['compare']:
+            baseline = scenarios.load_baseline(options['baseline'])
+            if not baseline:
+                raise CommandError(f"No baseline at {options['baseline']}. Run with --save-baseline first.")
+            regressions = scenarios.compare(results, baseline, options['tolerance'])
+            if regressions:
+                raise CommandError('Benchmark regressions:\n' + '\n'.join(regressions))
+            self.stdout.write(self.style.SUCCESS('No regressions against the baseline.'))
+
+        if options['save_baseline']:
+            baseline = scenarios.load_baseline(options['baseline'])
+            baseline.update(results)
+            scenarios.save_baseline(options['baseline'], baseline)
+            self.stdout.write(f"Saved baseline to {options['baseline']}.")
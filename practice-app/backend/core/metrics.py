@@ -0,0 +1,257 @@
+"""
+In-process metrics in the Prometheus text format
+
+Metrics are kept in memory per process and served by the /metrics endpoint,
+so no external service is needed. With several worker processes each one
+reports its own values; scrape them individually or aggregate in Prometheus.
+"""
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+
+from django.core.cache import cache as default_cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+
+# Latency buckets in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value):
+    """Escape a label value for the text format"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels):
+    """Format label pairs as {name="value",...}"""
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels) + '}'
+
+
+def _format_value(value):
+    """Format a sample value, dropping the fraction of whole numbers"""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class Metric(ABC):
+    """Base class for labelled metrics"""
+    type = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        """Get the label values of a sample in label name order"""
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f'{self.name} expects labels {self.labelnames}, got {tuple(labels)}')
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def clear(self):
+        """Remove all samples"""
+        with self._lock:
+            self._values.clear()
+
+    @abstractmethod
+    def samples(self):
+        """Get (suffix, labels, value) tuples of all samples"""
+
+    def render(self):
+        """Render the metric in the text format"""
+        lines = [
+            f'# HELP {self.name} {self.documentation}',
+            f'# TYPE {self.name} {self.type}',
+        ]
+        for suffix, labels, value in self.samples():
+            lines.append(f'{self.name}{suffix}{_format_labels(labels)} {_format_value(value)}')
+        return '\n'.join(lines)
+
+
+class Counter(Metric):
+    """Monotonically increasing counter"""
+    type = 'counter'
+
+    def inc(self, amount=1, **labels):
+        """Increment the counter"""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels):
+        """Get the current value"""
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        return [('', list(zip(self.labelnames, key)), value) for key, value in items]
+
+
+class Histogram(Metric):
+    """Histogram with cumulative buckets, a sum and a count"""
+    type = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        """Record an observation"""
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.get(key, ([0] * (len(self.buckets) + 1), 0.0))
+            counts[index] += 1
+            self._values[key] = (counts, total + value)
+
+    def get_count(self, **labels):
+        """Get the number of observations"""
+        counts, _ = self._values.get(self._key(labels), ([0], 0.0))
+        return sum(counts)
+
+    def samples(self):
+        with self._lock:
+            items = sorted((key, (list(counts), total)) for key, (counts, total) in self._values.items())
+
+        samples = []
+        for key, (counts, total) in items:
+            labels = list(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else _format_value(float(bound))
+                samples.append(('_bucket', labels + [('le', le)], cumulative))
+            samples.append(('_sum', labels, total))
+            samples.append(('_count', labels, cumulative))
+        return samples
+
+
+class Registry:
+    """Collection of metrics rendered together"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        """Register a metric, returning the already registered one with the same name"""
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name, documentation, labelnames=()):
+        """Create and register a counter"""
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        """Create and register a histogram"""
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def clear(self):
+        """Reset all registered metrics"""
+        for metric in list(self._metrics.values()):
+            metric.clear()
+
+    def render(self):
+        """Render all metrics in the text format"""
+        return '\n'.join(metric.render() for metric in self._metrics.values()) + '\n'
+
+
+REGISTRY = Registry()
+
+http_requests = REGISTRY.counter(
+    'http_requests_total',
+    'HTTP requests by view, method and status code.',
+    ['view', 'method', 'status']
+)
+http_request_duration = REGISTRY.histogram(
+    'http_request_duration_seconds',
+    'HTTP request latency by view and method.',
+    ['view', 'method']
+)
+db_queries = REGISTRY.counter(
+    'db_queries_total',
+    'Database queries issued while handling requests, by view.',
+    ['view']
+)
+db_query_duration = REGISTRY.counter(
+    'db_query_duration_seconds_total',
+    'Time spent in database queries while handling requests, by view.',
+    ['view']
+)
+db_queries_per_request = REGISTRY.histogram(
+    'db_queries_per_request',
+    'Database queries per request, by view.',
+    ['view'],
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500)
+)
+db_connections_opened = REGISTRY.counter(
+    'db_connections_opened_total',
+    'New database connections opened, by database.',
+    ['database']
+)
+db_connection_wait = REGISTRY.histogram(
+    'db_connection_wait_seconds',
+    'Time to obtain a database connection, connecting or waiting for the pool, by database.',
+    ['database']
+)
+db_connection_errors = REGISTRY.counter(
+    'db_connection_errors_total',
+    'Failed attempts to obtain a database connection, by database and error.',
+    ['database', 'error']
+)
+db_replica_fallbacks = REGISTRY.counter(
+    'db_replica_fallbacks_total',
+    'Replica health checks that sent reads back to the primary, by database and reason.',
+    ['database', 'reason']
+)
+cache_requests = REGISTRY.counter(
+    'cache_requests_total',
+    'Cache lookups by cache name and result (hit or miss).',
+    ['cache', 'result']
+)
+maintenance_rows = REGISTRY.counter(
+    'maintenance_rows_written_total',
+    'Rows written by maintenance jobs, by operation.',
+    ['operation']
+)
+
+
+def record_maintenance(operation, rows):
+    """Count rows written by a maintenance path"""
+    if rows:
+        maintenance_rows.inc(rows, operation=operation)
+
+
+def record_cache_lookup(name, hit):
+    """Count a cache lookup as a hit or a miss"""
+    cache_requests.inc(cache=name, result='hit' if hit else 'miss')
+
+
+def cache_get_or_set(name, key, compute, timeout=DEFAULT_TIMEOUT, cache=None):
+    """
+    Get a value from the cache, computing and storing it on a miss
+
+    Args:
+        name: Cache name used as the metric label
+        key: Cache key
+        compute: Callable returning the value on a miss
+        timeout: Cache timeout in seconds, the cache's default if not given
+        cache: Cache to use, the default cache if not given
+
+    Returns:
+        The cached or computed value
+    """
+    cache = cache or default_cache
+    sentinel = object()
+    value = cache.get(key, sentinel)
+    record_cache_lookup(name, value is not sentinel)
+    if value is sentinel:
+        value = compute()
+        cache.set(key, value, timeout)
+    return value
@@ -0,0 +1,282 @@
+"""
+Request instrumentation middleware
+
+QueryCountMiddleware records how many queries each request ran, how long they
+took, which statements repeated (the N+1 pattern) and the slowest statements.
+The result is attached to the request as request.query_stats, added as
+X-Query-* response headers when DEBUG is on, and logged to the 'core.queries'
+logger. Requests over the configured thresholds are logged as warnings. Every
+connection records into the statistics of the request in its context, so
+queries run in other threads for the request, like the parallel pieces of the
+async views, count too.
+
+MetricsMiddleware records request counts, latency and query statistics per
+view in the in-process metrics registry served by /metrics.
+
+ReplicaRoutingMiddleware resets read-replica routing for each request and keeps
+users who just wrote on the primary for their next requests.
+
+All three run natively under WSGI and ASGI, so async views are not adapted to
+a worker thread for them.
+"""
+import heapq
+import logging
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+
+from core import metrics
+from core.db import routers
+
+
+logger = logging.getLogger('core.queries')
+
+# Statistics of the request being served, copied into threads it runs code in
+_query_stats = ContextVar('query_stats', default=None)
+
+
+class QueryStats:
+    """Collects query statistics through connection.execute_wrapper()"""
+
+    def __init__(self, slowest_count=3):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = Counter()
+        self.slowest_count = slowest_count
+        self._slowest = []
+        # Parallel pieces of a request record from several threads
+        self._lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            with self._lock:
+                self.count += 1
+                self.duration += duration
+                # Statements are compared without their parameters, so the same
+                # query issued once per row of a loop counts as a duplicate
+                self.statements[sql] += 1
+                entry = (duration, self.count, sql)
+                if len(self._slowest) < self.slowest_count:
+                    heapq.heappush(self._slowest, entry)
+                else:
+                    heapq.heappushpop(self._slowest, entry)
+
+    @property
+    def duration_ms(self):
+        """Total SQL time in milliseconds"""
+        return round(self.duration * 1000, 2)
+
+    def duplicates(self, threshold=2):
+        """Get statements executed at least threshold times, most repeated first"""
+        return [
+            (sql, count)
+            for sql, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+    def slowest(self):
+        """Get the slowest statements as (milliseconds, sql), slowest first"""
+        return [
+            (round(duration * 1000, 2), sql)
+            for duration, _, sql in sorted(self._slowest, reverse=True)
+        ]
+
+
+def record_query(execute, sql, params, many, context):
+    """Execute wrapper recording into the statistics of the current request, if any"""
+    stats = _query_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    return stats(execute, sql, params, many, context)
+
+
+def instrument_connection(sender, connection, **kwargs):
+    """Install record_query on a connection, connected to connection_created"""
+    if record_query not in connection.execute_wrappers:
+        # Outermost, so execute_wrapper() blocks still pop their own wrappers
+        connection.execute_wrappers.insert(0, record_query)
+
+
+class AsyncCapableMiddleware:
+    """
+    Base for middleware that runs natively in both sync and async request handling
+
+    Subclasses handle a request with handle() in sync mode and with the
+    coroutine __acall__() in async mode.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.handle(request)
+
+
+class QueryCountMiddleware(AsyncCapableMiddleware):
+    """Record per-request query count, SQL time, duplicate and slowest queries"""
+
+    def handle(self, request):
+        if not getattr(settings, 'QUERY_INSTRUMENTATION_ENABLED', True):
+            return self.get_response(request)
+
+        stats = self.start(request)
+        token = _query_stats.set(stats)
+        try:
+            response = self.get_response(request)
+        finally:
+            _query_stats.reset(token)
+        return self.finish(request, response, stats)
+
+    async def __acall__(self, request):
+        if not getattr(settings, 'QUERY_INSTRUMENTATION_ENABLED', True):
+            return await self.get_response(request)
+
+        stats = self.start(request)
+        token = _query_stats.set(stats)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _query_stats.reset(token)
+        return self.finish(request, response, stats)
+
+    def start(self, request):
+        """Create the statistics of a request"""
+        stats = QueryStats(slowest_count=settings.QUERY_SLOWEST_COUNT)
+        request.query_stats = stats
+        return stats
+
+    def finish(self, request, response, stats):
+        """Report the statistics of a finished request"""
+        # Streaming responses run their remaining queries while the body is sent;
+        # only the queries issued before the response was returned are counted
+        duplicates = stats.duplicates(settings.QUERY_DUPLICATE_THRESHOLD)
+
+        if settings.DEBUG:
+            response['X-Query-Count'] = str(stats.count)
+            response['X-Query-Time-Ms'] = str(stats.duration_ms)
+            response['X-Query-Duplicates'] = str(len(duplicates))
+
+        self.log(request, response, stats, duplicates)
+        return response
+
+    def get_endpoint(self, request):
+        """Get the URL pattern of the request, falling back to the path"""
+        match = getattr(request, 'resolver_match', None)
+        if match is not None and match.route:
+            return match.route
+        return request.path
+
+    def log(self, request, response, stats, duplicates):
+        """Log the request's query statistics, as a warning when over a threshold"""
+        flagged = (
+            stats.count > settings.QUERY_COUNT_WARNING_THRESHOLD
+            or stats.duration_ms > settings.QUERY_TIME_WARNING_MS
+            or bool(duplicates)
+        )
+        level = logging.WARNING if flagged else logging.DEBUG
+        if not logger.isEnabledFor(level):
+            return
+
+        data = {
+            'method': request.method,
+            'endpoint': self.get_endpoint(request),
+            'status': response.status_code,
+            'query_count': stats.count,
+            'query_time_ms': stats.duration_ms,
+            'duplicate_queries': [
+                {'sql': sql, 'count': count} for sql, count in duplicates
+            ],
+            'slowest_queries': [
+                {'sql': sql, 'time_ms': duration} for duration, sql in stats.slowest()
+            ],
+        }
+        logger.log(
+            level,
+            '%s %s: %d queries in %.2f ms (%d duplicated)',
+            data['method'], data['endpoint'], stats.count, stats.duration_ms, len(duplicates),
+            extra={'query_stats': data}
+        )
+
+
+class MetricsMiddleware(AsyncCapableMiddleware):
+    """Record request count, latency and database usage per view"""
+
+    def handle(self, request):
+        start = time.perf_counter()
+        response = self.get_response(request)
+        self.record(request, response, time.perf_counter() - start)
+        return response
+
+    async def __acall__(self, request):
+        start = time.perf_counter()
+        response = await self.get_response(request)
+        self.record(request, response, time.perf_counter() - start)
+        return response
+
+    def record(self, request, response, duration):
+        """Record a finished request in the metrics registry"""
+        view = self.get_view_name(request)
+        metrics.http_requests.inc(view=view, method=request.method, status=response.status_code)
+        metrics.http_request_duration.observe(duration, view=view, method=request.method)
+
+        stats = getattr(request, 'query_stats', None)
+        if stats is not None:
+            metrics.db_queries.inc(stats.count, view=view)
+            metrics.db_query_duration.inc(stats.duration, view=view)
+            metrics.db_queries_per_request.observe(stats.count, view=view)
+
+    def get_view_name(self, request):
+        """Get the URL name of the request's view, keeping label cardinality bounded"""
+        match = getattr(request, 'resolver_match', None)
+        if match is None:
+            return 'unmatched'
+        return match.view_name or match.route or 'unnamed'
+
+
+class ReplicaRoutingMiddleware(AsyncCapableMiddleware):
+    """Reset replica routing per request and make users who wrote sticky to the primary"""
+
+    # Methods that don't change data
+    SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+    def handle(self, request):
+        # Threads serve many requests; don't inherit the previous one's state
+        routers.reset()
+        response = self.get_response(request)
+        if self.wrote(request):
+            self.stick(request)
+        return response
+
+    async def __acall__(self, request):
+        routers.reset()
+        response = await self.get_response(request)
+        if self.wrote(request):
+            # Loading the user and the sticky cache use the database
+            await sync_to_async(self.stick)(request)
+        return response
+
+    def wrote(self, request):
+        """Whether the request wrote on the primary"""
+        return request.method not in self.SAFE_METHODS and routers.is_pinned()
+
+    def stick(self, request):
+        """Keep the request's user on the primary for their next requests"""
+        # DRF copies the authenticated user to the underlying request
+        user = getattr(request, 'user', None)
+        if user is not None and user.is_authenticated:
+            routers.mark_sticky(user)
@@ -0,0 +1,47 @@
+# Generated by Django 4.2.30 on 2026-10-19 05:34
+
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_registereduser_reset_token_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RecurrenceRule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('frequency', models.CharField(choices=[('DAILY', 'Daily'), ('WEEKLY', 'Weekly'), ('MONTHLY', 'Monthly')], default='WEEKLY', max_length=10)),
+                ('interval', models.PositiveIntegerField(default=1, validators=[django.core.validators.MinValueValidator(1)])),
+                ('end_date', models.DateTimeField(blank=True, null=True)),
+                ('max_occurrences', models.PositiveIntegerField(blank=True, null=True)),
+                ('generated_count', models.PositiveIntegerField(default=0)),
+                ('next_occurrence_at', models.DateTimeField(blank=True, null=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='parent_task',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='occurrences', to='core.task'),
+        ),
+        migrations.AddConstraint(
+            model_name='task',
+            constraint=models.UniqueConstraint(fields=('parent_task', 'deadline'), name='unique_task_occurrence'),
+        ),
+        migrations.AddField(
+            model_name='recurrencerule',
+            name='task',
+            field=models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='recurrence', to='core.task'),
+        ),
+        migrations.AddIndex(
+            model_name='recurrencerule',
+            index=models.Index(fields=['is_active', 'next_occurrence_at'], name='recurrence_due_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-19 05:36
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_task_recurrence'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VolunteerCandidate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('category', models.CharField(max_length=50)),
+                ('area', models.CharField(blank=True, max_length=100)),
+                ('history_count', models.IntegerField(default=0)),
+                ('rating', models.FloatField(default=0.0)),
+                ('load', models.IntegerField(default=0)),
+                ('score', models.FloatField(default=0.0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='candidate_entries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['category', 'area', '-score'], name='candidate_area_idx'), models.Index(fields=['category', '-score'], name='candidate_category_idx')],
+                'unique_together': {('user', 'category')},
+            },
+        ),
+    ]
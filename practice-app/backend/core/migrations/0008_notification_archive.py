@@ -0,0 +1,48 @@
+# Generated by Django 4.2.30 on 2026-10-19 05:47
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_notification_coalescing'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedNotification',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('content', models.TextField()),
+                ('timestamp', models.DateTimeField()),
+                ('type', models.CharField(choices=[('TASK_CREATED', 'Task Created'), ('VOLUNTEER_APPLIED', 'Volunteer Applied'), ('TASK_ASSIGNED', 'Task Assigned'), ('TASK_COMPLETED', 'Task Completed'), ('TASK_CANCELLED', 'Task Cancelled'), ('NEW_REVIEW', 'New Review'), ('SYSTEM_NOTIFICATION', 'System Notification')], default='SYSTEM_NOTIFICATION', max_length=30)),
+                ('is_read', models.BooleanField(default=True)),
+                ('count', models.PositiveIntegerField(default=1)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('is_read', True)), fields=['timestamp'], name='notification_read_idx'),
+        ),
+        migrations.AddField(
+            model_name='archivednotification',
+            name='related_task',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='archived_notifications', to='core.task'),
+        ),
+        migrations.AddField(
+            model_name='archivednotification',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_notifications', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='archivednotification',
+            index=models.Index(fields=['user', '-timestamp'], name='archived_notification_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='archivednotification',
+            index=models.Index(fields=['timestamp'], name='archived_notification_ts_idx'),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 4.2.30 on 2026-10-19 06:34
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_existing(apps, schema_editor):
+    """Fill the new counters from the existing rows"""
+    Task = apps.get_model('core', 'Task')
+
+    def related_count(model_name, *conditions):
+        rows = apps.get_model('core', model_name).objects.filter(
+            *conditions, task=OuterRef('pk')
+        ).order_by().values('task').annotate(total=Count('id')).values('total')
+        return Coalesce(Subquery(rows), 0)
+
+    Task.objects.using(schema_editor.connection.alias).update(
+        comment_count=related_count('Comment'),
+        volunteer_count=related_count('Volunteer', ~Q(status='WITHDRAWN')),
+        bookmark_count=related_count('Bookmark'),
+        photo_count=related_count('Photo'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_notification_archive'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='bookmark_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='comment_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='photo_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='volunteer_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(count_existing, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 4.2.30 on 2026-10-19 06:39
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_usage(apps, schema_editor):
+    """Fill the new usage counts from the existing task and bookmark links"""
+    Tag = apps.get_model('core', 'Tag')
+    Bookmark = apps.get_model('core', 'Bookmark')
+
+    def link_count(through):
+        rows = through.objects.filter(tag=OuterRef('pk')).order_by().values('tag').annotate(
+            total=Count('id')
+        ).values('total')
+        return Coalesce(Subquery(rows), 0)
+
+    Tag.objects.using(schema_editor.connection.alias).update(
+        usage_count=link_count(Tag.tasks.through) + link_count(Bookmark.tags.through)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_task_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tag',
+            name='usage_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='tag',
+            index=models.Index(fields=['name'], name='tag_name_prefix_idx', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='tag',
+            index=models.Index(fields=['-usage_count', 'name'], name='tag_usage_idx'),
+        ),
+        migrations.RunPython(count_usage, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 4.2.30 on 2026-10-19 07:02
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+import django.db.models.deletion
+
+
+def merge_links(apps, schema_editor):
+    """Copy the tags of the implicit M2M table into BookmarkTag and fill in the users"""
+    Bookmark = apps.get_model('core', 'Bookmark')
+    BookmarkTag = apps.get_model('core', 'BookmarkTag')
+    Tag = apps.get_model('core', 'Tag')
+    alias = schema_editor.connection.alias
+
+    links = Bookmark.tags.through.objects.using(alias).values_list('bookmark_id', 'tag_id')
+    batch = []
+    for bookmark_id, tag_id in links.iterator(chunk_size=2000):
+        batch.append(BookmarkTag(bookmark_id=bookmark_id, tag_id=tag_id))
+        if len(batch) == 2000:
+            BookmarkTag.objects.using(alias).bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    BookmarkTag.objects.using(alias).bulk_create(batch, ignore_conflicts=True)
+
+    BookmarkTag.objects.using(alias).update(
+        user_id=Subquery(Bookmark.objects.filter(id=OuterRef('bookmark_id')).values('user_id'))
+    )
+
+    # Links only BookmarkTag had are now counted too
+    def link_count(through):
+        rows = through.objects.filter(tag=OuterRef('pk')).order_by().values('tag').annotate(
+            total=Count('id')
+        ).values('total')
+        return Coalesce(Subquery(rows), 0)
+
+    Tag.objects.using(alias).update(
+        usage_count=link_count(Tag.tasks.through) + link_count(BookmarkTag)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_tag_usage'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bookmarktag',
+            name='user',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='bookmark_tags', to='core.registereduser'),
+        ),
+        migrations.RunPython(merge_links, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-19 07:02
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_bookmark_tag_user'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='bookmarktag',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='bookmark_tags', to='core.registereduser'),
+        ),
+        # The implicit core_bookmark_tags table is dropped; BookmarkTag takes its place
+        migrations.RemoveField(
+            model_name='bookmark',
+            name='tags',
+        ),
+        migrations.AddField(
+            model_name='bookmark',
+            name='tags',
+            field=models.ManyToManyField(blank=True, related_name='bookmarks', through='core.BookmarkTag', to='core.tag'),
+        ),
+        migrations.AddIndex(
+            model_name='bookmarktag',
+            index=models.Index(fields=['user', 'tag', 'bookmark'], name='bookmarktag_user_tag_idx'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 4.2.30 on 2026-10-19 06:54
+
+from django.db import migrations, models
+from django.db.models import CharField, Value
+from django.db.models.functions import Cast, Concat, LPad
+import django.db.models.deletion
+
+
+def set_paths(apps, schema_editor):
+    """Existing comments are top-level; their path is their own zero padded id"""
+    Comment = apps.get_model('core', 'Comment')
+    Comment.objects.using(schema_editor.connection.alias).update(
+        path=Concat(LPad(Cast('id', CharField()), 10, Value('0')), Value('/'))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_bookmark_tag_through'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='parent',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='replies', to='core.comment'),
+        ),
+        migrations.AddField(
+            model_name='comment',
+            name='path',
+            field=models.CharField(default='', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='comment',
+            name='reply_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(set_paths, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['task', 'parent', 'path'], name='comment_thread_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['path'], name='comment_path_idx', opclasses=['varchar_pattern_ops']),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 4.2.30 on 2026-10-19 06:58
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_comment_threads'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReportTarget',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('target_type', models.CharField(choices=[('USER', 'User'), ('TASK', 'Task'), ('COMMENT', 'Comment'), ('REVIEW', 'Review')], max_length=10)),
+                ('target_id', models.PositiveIntegerField()),
+                ('report_count', models.IntegerField(default=0)),
+                ('last_reported_at', models.DateTimeField()),
+                ('last_reason', models.TextField(blank=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='report_targets', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['target_type', '-report_count', '-id'], name='report_queue_idx')],
+                'unique_together': {('target_type', 'target_id')},
+            },
+        ),
+        migrations.CreateModel(
+            name='Report',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('target_type', models.CharField(choices=[('USER', 'User'), ('TASK', 'Task'), ('COMMENT', 'Comment'), ('REVIEW', 'Review')], max_length=10)),
+                ('target_id', models.PositiveIntegerField()),
+                ('reason', models.TextField()),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('reporter', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reports_filed', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'unique_together': {('reporter', 'target_type', 'target_id')},
+            },
+        ),
+    ]
@@ -1,7 +1,7 @@
 from .user import RegisteredUser, Administrator, Guest
 from .task import Task, TaskCategory, TaskStatus
 from .volunteer import Volunteer, VolunteerStatus
-from .notification import Notification, NotificationType
+from .notification import Notification, NotificationType, ArchivedNotification
 from .review import Review
 from .bookmark import Bookmark, BookmarkTag
 from .tag import Tag
@@ -9,6 +9,10 @@ from .photo import Photo
 from .feed import Feed
 from .comment import Comment
 from .search import Search
+from .recurrence import RecurrenceRule, RecurrenceFrequency
+from .matching import VolunteerCandidate
+from .outbox import NotificationOutbox, OutboxStatus
+from .report import Report, ReportTarget, ReportTargetType
 
 __all__ = [
     'RegisteredUser',
@@ -21,6 +25,7 @@ __all__ = [
     'VolunteerStatus',
     'Notification',
     'NotificationType',
+    'ArchivedNotification',
     'Review',
     'Bookmark',
     'BookmarkTag',
@@ -29,4 +34,12 @@ __all__ = [
     'Feed',
     'Comment',
     'Search',
+    'RecurrenceRule',
+    'RecurrenceFrequency',
+    'VolunteerCandidate',
+    'NotificationOutbox',
+    'OutboxStatus',
+    'Report',
+    'ReportTarget',
+    'ReportTargetType',
 ]
\ No newline at end of file
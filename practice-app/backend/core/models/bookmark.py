@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 
 
 class Bookmark(models.Model):
@@ -16,7 +16,7 @@ class Bookmark(models.Model):
         on_delete=models.CASCADE,
         related_name='bookmarks'
     )
-    tags = models.ManyToManyField('Tag', related_name='bookmarks', blank=True)
+    tags = models.ManyToManyField('Tag', through='BookmarkTag', related_name='bookmarks', blank=True)
     
     class Meta:
         # A user can bookmark a task only once
@@ -57,24 +57,101 @@ class Bookmark(models.Model):
             return existing
         
         # Create new bookmark
+        from .task import Task
         bookmark = cls(user=user, task=task)
-        bookmark.save()
+        with transaction.atomic():
+            bookmark.save()
+            Task.adjust_count(bookmark, 'bookmark_count', 1)
         return bookmark
     
     def remove_bookmark(self):
         """Remove this bookmark"""
-        self.delete()
+        from .task import Task
+        from .tag import Tag
+        with transaction.atomic():
+            # Tag links go with the bookmark, so recount their tags afterwards
+            tag_ids = list(BookmarkTag.objects.filter(bookmark_id=self.id).values_list('tag_id', flat=True))
+            # Only count the bookmark if this call removed its row
+            _, deleted = self.delete()
+            if deleted.get(Bookmark._meta.label):
+                Task.adjust_count(self, 'bookmark_count', -1)
+            Tag.refresh_usage_counts(tag_ids)
         return True
     
     def add_tag(self, tag):
         """Add a tag to this bookmark"""
-        # This would involve a BookmarkTag model or ManyToMany relationship
-        self.tags.add(tag)
+        from .tag import Tag
+        self.tags.add(tag, through_defaults={'user_id': self.user_id})
+        Tag.refresh_usage_counts([tag.id])
         return True
+    
+    def remove_tag(self, tag):
+        """Remove a tag from this bookmark"""
+        from .tag import Tag
+        self.tags.remove(tag)
+        Tag.refresh_usage_counts([tag.id])
+        return True
+    
+    def add_tags(self, names):
+        """
+        Add tags by name, creating missing ones
+        
+        Links are inserted with one query, so the number of queries does not
+        depend on the number of tags.
+        
+        Args:
+            names: Iterable of tag names (case insensitive)
+            
+        Returns:
+            dict: Mapping of lowercase tag name to the added Tag
+        """
+        from .tag import Tag
+        tags = Tag.ensure_many(names)
+        if not tags:
+            return tags
+        with transaction.atomic():
+            BookmarkTag.objects.bulk_create([
+                BookmarkTag(bookmark_id=self.id, tag_id=tag.id, user_id=self.user_id)
+                for tag in tags.values()
+            ], ignore_conflicts=True)
+            Tag.refresh_usage_counts(tag.id for tag in tags.values())
+        self.forget_tags()
+        return tags
+    
+    def remove_tags(self, names):
+        """
+        Remove tags by name, ignoring names of tags that don't exist
+        
+        Args:
+            names: Iterable of tag names (case insensitive)
+            
+        Returns:
+            int: Number of tags removed
+        """
+        from .tag import Tag
+        tag_ids = list(Tag.resolve_names(names).values())
+        if not tag_ids:
+            return 0
+        with transaction.atomic():
+            removed, _ = BookmarkTag.objects.filter(
+                bookmark_id=self.id, tag_id__in=tag_ids
+            ).delete()
+            Tag.refresh_usage_counts(tag_ids)
+        self.forget_tags()
+        return removed
+    
+    def forget_tags(self):
+        """Drop tags prefetched before they were changed through the link table"""
+        getattr(self, '_prefetched_objects_cache', {}).pop('tags', None)
 
 
 class BookmarkTag(models.Model):
-    """M2M relationship between Bookmarks and Tags"""
+    """
+    Link between a bookmark and a tag, the through model of Bookmark.tags
+    
+    The bookmark's user is copied onto the link so a user's bookmarks with a
+    tag are found with one range scan of the (user, tag) index.
+    """
     bookmark = models.ForeignKey(
         'Bookmark',
         on_delete=models.CASCADE,
@@ -85,10 +162,41 @@ class BookmarkTag(models.Model):
         on_delete=models.CASCADE,
         related_name='bookmark_tags'
     )
+    # Denormalized from bookmark.user, which never changes
+    user = models.ForeignKey(
+        'RegisteredUser',
+        on_delete=models.CASCADE,
+        related_name='bookmark_tags'
+    )
     
     class Meta:
         unique_together = ['bookmark', 'tag']
+        indexes = [
+            models.Index(fields=['user', 'tag', 'bookmark'], name='bookmarktag_user_tag_idx'),
+        ]
     
     def __str__(self):
         """Return string representation"""
-        return f"{self.bookmark} - {self.tag.name}"
\ No newline at end of file
+        return f"{self.bookmark} - {self.tag.name}"
+    
+    def save(self, *args, **kwargs):
+        """Save the link, copying the user from its bookmark"""
+        if self.user_id is None:
+            self.user_id = self.bookmark.user_id
+        super().save(*args, **kwargs)
+    
+    @classmethod
+    def bookmark_ids(cls, user, tag_name):
+        """
+        Ids of a user's bookmarks having a tag, for use as a subquery
+        
+        Args:
+            user: Owner of the bookmarks
+            tag_name: Tag name (case insensitive)
+            
+        Returns:
+            QuerySet: bookmark_id values
+        """
+        return cls.objects.filter(
+            user=user, tag__name=tag_name.strip().lower()
+        ).values('bookmark_id')
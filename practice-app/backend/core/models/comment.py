@@ -1,10 +1,35 @@
-from django.db import models
+import re
+
+from django.db import models, transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+# Digits each ancestor id takes in a comment's path
+PATH_ID_WIDTH = 10
+# Deepest reply nesting that fits the path column
+MAX_COMMENT_DEPTH = 255 // (PATH_ID_WIDTH + 1)
+PATH_PATTERN = re.compile(rf'^(\d{{{PATH_ID_WIDTH}}}/)+$')
+
+
+def path_step(comment_id):
+    """The path segment of a comment id"""
+    return f'{comment_id:0{PATH_ID_WIDTH}d}/'
 
 
 class Comment(models.Model):
-    """Model for task comments"""
+    """
+    Model for task comments
+    
+    Replies form threads. Each comment stores a materialized path of its
+    ancestors' ids and its own, zero padded so that ordering by path lists a
+    thread depth first and a whole subtree is one prefix range of the path
+    index. reply_count caches the number of replies below a comment.
+    """
     content = models.TextField()
     timestamp = models.DateTimeField(auto_now_add=True)
+    path = models.CharField(max_length=255, default='')
+    reply_count = models.IntegerField(default=0)
     
     # Foreign Keys
     user = models.ForeignKey(
@@ -17,6 +42,29 @@ class Comment(models.Model):
         on_delete=models.CASCADE,
         related_name='comments'
     )
+    parent = models.ForeignKey(
+        'self',
+        on_delete=models.CASCADE,
+        related_name='replies',
+        null=True,
+        blank=True
+    )
+    
+    class Meta:
+        indexes = [
+            # Top-level comments of a task, in path (creation) order
+            models.Index(fields=['task', 'parent', 'path'], name='comment_thread_idx'),
+            # Subtrees by path prefix; PostgreSQL needs the pattern opclass for LIKE 'prefix%'
+            models.Index(fields=['path'], name='comment_path_idx', opclasses=['varchar_pattern_ops']),
+        ]
+    
+    def save(self, *args, **kwargs):
+        """Save the comment, giving a new one its path"""
+        super().save(*args, **kwargs)
+        if not self.path:
+            # The path ends with the comment's own id, known only once saved
+            self.path = (self.parent.path if self.parent_id else '') + path_step(self.id)
+            Comment.objects.filter(id=self.id).update(path=self.path)
     
     def __str__(self):
         """Return string representation of comment"""
@@ -50,26 +98,105 @@ class Comment(models.Model):
         self.save()
     
     # Business logic methods
+    @property
+    def depth(self):
+        """Nesting level, 0 for a top-level comment"""
+        return self.path.count('/') - 1
+    
+    def ancestor_ids(self):
+        """Ids of the comments above this one, from the top of the thread down"""
+        return [int(step) for step in self.path.split('/')[:-2]]
+    
     @classmethod
-    def add_comment(cls, user, task, content):
-        """Add a new comment to a task"""
+    def add_comment(cls, user, task, content, parent=None):
+        """
+        Add a new comment to a task
+        
+        Args:
+            user: Author of the comment
+            task: Commented task
+            content: Comment text
+            parent: Optional comment of the same task this one replies to
+            
+        Returns:
+            Comment: The new comment
+        """
+        if parent is not None:
+            if parent.task_id != task.id:
+                raise ValueError('A reply must belong to the task of its parent comment.')
+            if parent.depth + 1 >= MAX_COMMENT_DEPTH:
+                raise ValueError('Replies are nested too deeply.')
         comment = cls(
             user=user,
             task=task,
-            content=content
+            content=content,
+            parent=parent
         )
-        comment.save()
+        from .task import Task
+        with transaction.atomic():
+            comment.save()
+            ancestor_ids = comment.ancestor_ids()
+            if ancestor_ids:
+                cls.objects.filter(id__in=ancestor_ids).update(reply_count=F('reply_count') + 1)
+                parent.reply_count += 1
+            Task.adjust_count(comment, 'comment_count', 1)
         return comment
     
     def delete_comment(self):
-        """Delete this comment"""
-        self.delete()
+        """Delete this comment with its replies"""
+        from .task import Task
+        with transaction.atomic():
+            # Count what is actually deleted; replies may have been added since
+            # this instance was loaded, so its reply_count can be stale
+            _, deleted = Comment.objects.filter(path__startswith=self.path).delete()
+            removed = deleted.get(Comment._meta.label, 0)
+            if removed:
+                ancestor_ids = self.ancestor_ids()
+                if ancestor_ids:
+                    Comment.objects.filter(id__in=ancestor_ids).update(reply_count=F('reply_count') - removed)
+                Task.adjust_count(self, 'comment_count', -removed)
         return True
     
-    def report_comment(self, reason):
-        """Report this comment for moderation"""
-        # This would involve a CommentReport model (to be implemented)
-        pass
+    def get_subtree(self):
+        """
+        Get the replies below this comment with one prefix range query
+        
+        Returns:
+            QuerySet: Replies in thread (depth first) order
+        """
+        return Comment.objects.filter(path__startswith=self.path).exclude(id=self.id).order_by('path')
+    
+    @classmethod
+    def get_threads(cls, task_id):
+        """
+        Get the top-level comments of a task
+        
+        Returns:
+            QuerySet: Comments in creation order
+        """
+        return cls.objects.filter(task_id=task_id, parent__isnull=True).order_by('path')
+    
+    @classmethod
+    def recount_replies(cls, queryset=None):
+        """
+        Recount cached reply counts from the comment paths
+        
+        Args:
+            queryset: Optional comments to recount, all comments if not given
+            
+        Returns:
+            int: Number of comments updated
+        """
+        queryset = cls.objects.all() if queryset is None else queryset
+        below = cls.objects.filter(path__startswith=OuterRef('path')).exclude(id=OuterRef('id')).order_by().values(
+            'task_id'
+        ).annotate(total=Count('id')).values('total')
+        return queryset.update(reply_count=Coalesce(Subquery(below), 0))
+    
+    def report_comment(self, reporter, reason):
+        """Report this comment for moderation, returning (Report, created)"""
+        from .report import Report
+        return Report.file_report(reporter, self, reason)
     
     def edit_comment(self, new_content):
         """Edit comment content"""
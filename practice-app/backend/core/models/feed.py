@@ -1,5 +1,7 @@
 from django.db import models
 from django.utils import timezone
+from core.db.routers import use_replica
+from .tag import Tag
 from .task import Task
 
 
@@ -17,6 +19,7 @@ class Feed:
         """Get feed owner"""
         return self.user
     
+    @use_replica
     def load_feed(self, page=1, items_per_page=20):
         """
         Load personalized feed based on user preferences
@@ -37,6 +40,8 @@ class Feed:
             deadline__gt=timezone.now()
         ).exclude(
             creator=self.user  # Exclude user's own tasks
+        ).select_related(
+            'creator', 'assignee'  # Serialized with every task
         ).order_by('deadline')  # Sort by deadline (earliest first)
         
         # Apply pagination
@@ -44,6 +49,7 @@ class Feed:
         
         return tasks
     
+    @use_replica
     def filter_feed(self, filter_criteria):
         """
         Filter the feed based on criteria
@@ -52,7 +58,9 @@ class Feed:
             filter_criteria: Dictionary with filter parameters
                 - category: Task category
                 - location: Task location
-                - tags: List of tag names
+                - tags: List of tag names a task must all have
+                - any_tags: List of tag names a task must have at least one of
+                - exclude_tags: List of tag names a task must not have
                 - urgency: Minimum urgency level
                 
         Returns:
@@ -72,9 +80,9 @@ class Feed:
         if 'location' in filter_criteria:
             query = query.filter(location__icontains=filter_criteria['location'])
             
-        if 'tags' in filter_criteria and filter_criteria['tags']:
-            for tag in filter_criteria['tags']:
-                query = query.filter(tags__name=tag)
+        tag_criteria = [filter_criteria.get(key) or () for key in ('tags', 'any_tags', 'exclude_tags')]
+        if any(tag_criteria):
+            query = query.filter(Tag.task_filter(*tag_criteria))
                 
         if 'urgency' in filter_criteria:
             query = query.filter(urgency_level__gte=filter_criteria['urgency'])
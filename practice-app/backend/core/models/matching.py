@@ -0,0 +1,195 @@
+import math
+from collections import defaultdict
+
+from django.db import models, transaction
+from django.db.models import Count
+
+from core.metrics import record_maintenance
+
+
+# Weights of the candidate score components
+CATEGORY_HISTORY_WEIGHT = 2.0
+RATING_WEIGHT = 1.0
+LOAD_WEIGHT = 0.75
+
+# Tasks in these states count towards a volunteer's current load
+ACTIVE_TASK_STATUSES = ['ASSIGNED', 'IN_PROGRESS']
+
+
+def area_key(location):
+    """
+    Normalize a free text location to the area used for matching
+
+    The last comma separated part is used (e.g. the district in
+    "12 Main St, Kadikoy"), lowercased and stripped.
+
+    Args:
+        location: Location string
+
+    Returns:
+        str: Area key, empty if the location is blank
+    """
+    if not location:
+        return ''
+    return location.rsplit(',', 1)[-1].strip().lower()[:100]
+
+
+def candidate_score(history_count, rating, load):
+    """Score a candidate from category history, rating and current load"""
+    return (
+        CATEGORY_HISTORY_WEIGHT * math.log1p(history_count)
+        + RATING_WEIGHT * (rating or 0.0) / 5.0
+        - LOAD_WEIGHT * load
+    )
+
+
+class VolunteerCandidate(models.Model):
+    """
+    Precomputed candidate index for volunteer-to-task matching
+
+    One row per user and task category the user has history in, stored
+    under the user's area and ranked by a precomputed score, so matching a
+    new task is an index range scan over its (category, area) bucket
+    instead of a scan over all users.
+    """
+    user = models.ForeignKey(
+        'RegisteredUser',
+        on_delete=models.CASCADE,
+        related_name='candidate_entries'
+    )
+    category = models.CharField(max_length=50)
+    area = models.CharField(max_length=100, blank=True)
+    history_count = models.IntegerField(default=0)
+    rating = models.FloatField(default=0.0)
+    load = models.IntegerField(default=0)
+    score = models.FloatField(default=0.0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ['user', 'category']
+        indexes = [
+            models.Index(fields=['category', 'area', '-score'], name='candidate_area_idx'),
+            models.Index(fields=['category', '-score'], name='candidate_category_idx'),
+        ]
+
+    def __str__(self):
+        """Return string representation of candidate entry"""
+        return f"{self.user_id} - {self.category} ({self.score:.2f})"
+
+    # Business logic methods
+    @classmethod
+    def build_entries(cls, user_ids=None):
+        """
+        Compute candidate entries from volunteering and completed task history
+
+        Args:
+            user_ids: Optional list of user ids to limit the computation to
+
+        Returns:
+            list: Unsaved VolunteerCandidate objects
+        """
+        from .user import RegisteredUser
+        from .task import Task, TaskStatus
+        from .volunteer import Volunteer, VolunteerStatus
+
+        volunteers = Volunteer.objects.exclude(status=VolunteerStatus.WITHDRAWN)
+        completed = Task.objects.filter(status=TaskStatus.COMPLETED, assignee__isnull=False)
+        active = Task.objects.filter(status__in=ACTIVE_TASK_STATUSES, assignee__isnull=False)
+        users = RegisteredUser.objects.filter(is_active=True)
+        if user_ids is not None:
+            volunteers = volunteers.filter(user_id__in=user_ids)
+            completed = completed.filter(assignee_id__in=user_ids)
+            active = active.filter(assignee_id__in=user_ids)
+            users = users.filter(id__in=user_ids)
+
+        history = defaultdict(int)
+        for row in volunteers.values('user_id', 'task__category').annotate(count=Count('id')):
+            history[(row['user_id'], row['task__category'])] += row['count']
+        for row in completed.values('assignee_id', 'category').annotate(count=Count('id')):
+            history[(row['assignee_id'], row['category'])] += row['count']
+
+        loads = dict(
+            active.values('assignee_id').annotate(count=Count('id')).values_list('assignee_id', 'count')
+        )
+        profiles = {
+            user_id: (location, rating)
+            for user_id, location, rating in users.filter(
+                id__in={user_id for user_id, category in history}
+            ).values_list('id', 'location', 'rating')
+        }
+
+        entries = []
+        for (user_id, category), count in history.items():
+            if user_id not in profiles:
+                continue
+            location, rating = profiles[user_id]
+            load = loads.get(user_id, 0)
+            entries.append(cls(
+                user_id=user_id,
+                category=category,
+                area=area_key(location),
+                history_count=count,
+                rating=rating,
+                load=load,
+                score=candidate_score(count, rating, load),
+            ))
+        return entries
+
+    @classmethod
+    def refresh_users(cls, user_ids):
+        """
+        Recompute the candidate entries of some users
+
+        Args:
+            user_ids: Ids of the users whose history changed
+        """
+        user_ids = list(user_ids)
+        if not user_ids:
+            return
+        entries = cls.build_entries(user_ids)
+        with transaction.atomic():
+            cls.objects.filter(user_id__in=user_ids).delete()
+            cls.objects.bulk_create(entries)
+
+    @classmethod
+    def rebuild(cls, batch_size=1000):
+        """
+        Recompute the whole candidate index
+
+        Returns:
+            int: Number of candidate entries written
+        """
+        entries = cls.build_entries()
+        with transaction.atomic():
+            cls.objects.all().delete()
+            cls.objects.bulk_create(entries, batch_size=batch_size)
+        record_maintenance('match_index_rebuild', len(entries))
+        return len(entries)
+
+    @classmethod
+    def match(cls, task, limit=10):
+        """
+        Find the best volunteer candidates for a task
+
+        Candidates in the task's area come first; the rest of the list is
+        filled from the same category in other areas.
+
+        Args:
+            task: Task to find volunteers for
+            limit: Maximum number of candidates
+
+        Returns:
+            list: VolunteerCandidate entries, best first
+        """
+        area = area_key(task.location)
+        base = cls.objects.filter(
+            category=task.category,
+            user__is_active=True
+        ).exclude(user_id=task.creator_id)
+
+        matches = list(base.filter(area=area).order_by('-score')[:limit]) if area else []
+        if len(matches) < limit:
+            matches.extend(
+                base.exclude(area=area).order_by('-score')[:limit - len(matches)]
+            )
+        return matches
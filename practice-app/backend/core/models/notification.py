@@ -1,4 +1,11 @@
-from django.db import models
+import datetime
+
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import Max, Sum
+from django.utils import timezone
+
+from core.metrics import record_maintenance
 
 
 class NotificationType(models.TextChoices):
@@ -12,6 +19,10 @@ class NotificationType(models.TextChoices):
     SYSTEM_NOTIFICATION = 'SYSTEM_NOTIFICATION', 'System Notification'
 
 
+# Columns Notification and ArchivedNotification share, in the same order in both
+UNION_FIELDS = ('id', 'content', 'timestamp', 'type', 'is_read', 'count', 'user', 'related_task')
+
+
 class Notification(models.Model):
     """Model for user notifications"""
     content = models.TextField()
@@ -22,6 +33,8 @@ class Notification(models.Model):
         default=NotificationType.SYSTEM_NOTIFICATION
     )
     is_read = models.BooleanField(default=False)
+    # Number of events merged into this notification by coalescing
+    count = models.PositiveIntegerField(default=1)
     
     # Foreign Keys
     user = models.ForeignKey(
@@ -37,6 +50,15 @@ class Notification(models.Model):
         related_name='notifications'
     )
     
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', '-timestamp'], name='notification_user_idx'),
+            # Lookup of the unread notification a new event is merged into
+            models.Index(fields=['user', 'related_task', 'type', 'is_read'], name='notification_coalesce_idx'),
+            # Retention scan over read notifications only
+            models.Index(fields=['timestamp'], condition=models.Q(is_read=True), name='notification_read_idx'),
+        ]
+    
     def __str__(self):
         """Return string representation of notification"""
         return f"{self.type} - {self.timestamp.strftime('%Y-%m-%d %H:%M')}"
@@ -66,6 +88,10 @@ class Notification(models.Model):
         """Get related task if any"""
         return self.related_task
     
+    def get_count(self):
+        """Get number of events merged into this notification"""
+        return self.count
+    
     # Setters
     def set_content(self, content):
         """Set notification content"""
@@ -101,24 +127,225 @@ class Notification(models.Model):
         return notification
     
     @classmethod
-    def send_task_created_notification(cls, task):
-        """Send notification for task creation to relevant users"""
-        # This would typically notify users who might be interested in this task
-        # The implementation would depend on business logic
-        pass
+    def coalesce_window(cls, user):
+        """Get how long an unread notification keeps absorbing new events for a user"""
+        if user.notification_digest:
+            return datetime.timedelta(seconds=settings.NOTIFICATION_DIGEST_WINDOW)
+        return datetime.timedelta(seconds=settings.NOTIFICATION_COALESCE_WINDOW)
+    
+    @classmethod
+    def send_coalesced_notification(cls, user, content, notification_type, related_task,
+                                    coalesced_content=None, window=None):
+        """
+        Send a notification, merging it into a recent unread one for the same task
+        
+        An unread notification of the same type about the same task that was
+        updated within the window absorbs the event: its count is incremented
+        and it moves to the top of the list, instead of a new row being added.
+        
+        Args:
+            user: Recipient
+            content: Content of a new notification
+            notification_type: Type of the notification
+            related_task: Task the notification is about
+            coalesced_content: Optional callable building the content from the merged count
+            window: Optional timedelta overriding the user's coalescing window
+            
+        Returns:
+            Notification: The created or updated notification
+        """
+        if window is None:
+            window = cls.coalesce_window(user)
+        now = timezone.now()
+        
+        with transaction.atomic():
+            existing = cls.objects.select_for_update().filter(
+                user=user,
+                related_task=related_task,
+                type=notification_type,
+                is_read=False,
+                timestamp__gte=now - window
+            ).order_by('-timestamp').first()
+            
+            if existing is None:
+                return cls.send_notification(
+                    user=user,
+                    content=content,
+                    notification_type=notification_type,
+                    related_task=related_task
+                )
+            
+            existing.count += 1
+            existing.content = coalesced_content(existing.count) if coalesced_content else content
+            existing.timestamp = now
+            existing.save(update_fields=['count', 'content', 'timestamp'])
+            return existing
+    
+    @classmethod
+    def get_digest(cls, user, since=None):
+        """
+        Summarize a user's unread notifications per task and type
+        
+        Args:
+            user: User the digest is built for
+            since: Optional datetime limiting the digest to newer notifications
+            
+        Returns:
+            list: Dicts with type, related_task_id, related_task_title, total and latest
+        """
+        notifications = cls.objects.filter(user=user, is_read=False)
+        if since is not None:
+            notifications = notifications.filter(timestamp__gte=since)
+        
+        return [
+            {
+                'type': row['type'],
+                'related_task_id': row['related_task_id'],
+                'related_task_title': row['related_task__title'],
+                'total': row['total'],
+                'latest': row['latest'],
+            }
+            for row in notifications.values(
+                'type', 'related_task_id', 'related_task__title'
+            ).annotate(
+                total=Sum('count'),
+                latest=Max('timestamp')
+            ).order_by('-latest')
+        ]
+    
+    @classmethod
+    def with_archive(cls, user):
+        """
+        Get a user's notifications from both the hot and the archive table
+        
+        Archived rows keep their original id and are returned as Notification
+        objects. Both sides select the UNION_FIELDS columns only, so fields
+        added to Notification later don't misalign the union. Related objects
+        can't be joined on a union, so prefetch them on the sliced page instead.
+        
+        Args:
+            user: Recipient
+            
+        Returns:
+            QuerySet: Union of hot and archived notifications
+        """
+        return cls.objects.filter(user=user).only(*UNION_FIELDS).union(
+            ArchivedNotification.objects.filter(user=user).only(*UNION_FIELDS),
+            all=True
+        )
+    
+    @classmethod
+    def archive_read(cls, older_than, batch_size=1000):
+        """
+        Move read notifications older than a cutoff to the archive table
+        
+        Each batch is copied and deleted in its own short transaction so the
+        hot table is never locked for long.
+        
+        Args:
+            older_than: timedelta; read notifications older than this are archived
+            batch_size: Number of notifications moved per transaction
+            
+        Returns:
+            int: Number of notifications archived
+        """
+        cutoff = timezone.now() - older_than
+        archived = 0
+        
+        while True:
+            with transaction.atomic():
+                batch = list(
+                    cls.objects.select_for_update(skip_locked=True)
+                    .filter(is_read=True, timestamp__lt=cutoff)
+                    .order_by('timestamp')[:batch_size]
+                )
+                if not batch:
+                    break
+                
+                ArchivedNotification.objects.bulk_create([
+                    ArchivedNotification(
+                        id=notification.id,
+                        content=notification.content,
+                        timestamp=notification.timestamp,
+                        type=notification.type,
+                        is_read=notification.is_read,
+                        count=notification.count,
+                        user_id=notification.user_id,
+                        related_task_id=notification.related_task_id,
+                    )
+                    for notification in batch
+                ], ignore_conflicts=True)
+                cls.objects.filter(id__in=[notification.id for notification in batch]).delete()
+            
+            archived += len(batch)
+            record_maintenance('notification_archive', len(batch))
+        
+        return archived
+    
+    @classmethod
+    def enqueue_notification(cls, user, content, notification_type, related_task=None):
+        """Send a notification through the dispatch queue"""
+        return cls.enqueue_notifications([{
+            'user_id': user.id,
+            'content': content,
+            'type': notification_type,
+            'related_task_id': related_task.id if related_task else None,
+        }])
+    
+    @classmethod
+    def enqueue_notifications(cls, rows):
+        """
+        Send several notifications through the dispatch queue
+        
+        Args:
+            rows: List of dicts with user_id, content, type and related_task_id
+            
+        Returns:
+            list: Created notifications in synchronous mode, otherwise empty
+        """
+        from core.notification_queue import dispatch
+        return dispatch(rows)
+    
+    @classmethod
+    def send_task_created_notification(cls, task, limit=None):
+        """Notify the best matching volunteers about a new task"""
+        from django.conf import settings
+        from .matching import VolunteerCandidate
+        
+        if limit is None:
+            limit = settings.MATCH_NOTIFY_TOP_K
+        
+        candidates = VolunteerCandidate.match(task, limit=limit)
+        content = f"A new task that matches your experience was posted: {task.title}"
+        
+        return cls.enqueue_notifications([
+            {
+                'user_id': candidate.user_id,
+                'content': content,
+                'type': NotificationType.TASK_CREATED,
+                'related_task_id': task.id,
+            }
+            for candidate in candidates
+        ])
     
     @classmethod
     def send_volunteer_applied_notification(cls, volunteer):
         """Send notification when someone volunteers for a task"""
         task = volunteer.task
         user = task.creator
-        content = f"{volunteer.user.username} has volunteered for your task: {task.title}"
+        username = volunteer.user.username
+        content = f"{username} has volunteered for your task: {task.title}"
         
-        return cls.send_notification(
+        def coalesced_content(count):
+            others = 'other' if count == 2 else 'others'
+            return f"{username} and {count - 1} {others} have volunteered for your task: {task.title}"
+        
+        return cls.send_coalesced_notification(
             user=user,
             content=content,
             notification_type=NotificationType.VOLUNTEER_APPLIED,
-            related_task=task
+            related_task=task,
+            coalesced_content=coalesced_content
         )
     
     @classmethod
@@ -137,20 +364,94 @@ class Notification(models.Model):
     def send_task_completed_notification(cls, task):
         """Send notification when a task is marked as completed"""
         # Notify task creator
-        creator_content = f"Your task '{task.title}' has been marked as completed."
-        cls.send_notification(
-            user=task.creator,
-            content=creator_content,
-            notification_type=NotificationType.TASK_COMPLETED,
-            related_task=task
-        )
+        rows = [{
+            'user_id': task.creator_id,
+            'content': f"Your task '{task.title}' has been marked as completed.",
+            'type': NotificationType.TASK_COMPLETED,
+            'related_task_id': task.id,
+        }]
         
         # Notify the assignee if exists
-        if task.assignee:
-            assignee_content = f"Task '{task.title}' has been marked as completed."
-            cls.send_notification(
-                user=task.assignee,
-                content=assignee_content,
-                notification_type=NotificationType.TASK_COMPLETED,
-                related_task=task
-            )
\ No newline at end of file
+        if task.assignee_id:
+            rows.append({
+                'user_id': task.assignee_id,
+                'content': f"Task '{task.title}' has been marked as completed.",
+                'type': NotificationType.TASK_COMPLETED,
+                'related_task_id': task.id,
+            })
+        
+        return cls.enqueue_notifications(rows)
+
+
+class ArchivedNotification(models.Model):
+    """
+    Model for read notifications moved out of the hot Notification table
+    
+    Fields mirror Notification in the same order so both tables can be read
+    together with a UNION of the UNION_FIELDS columns (see
+    Notification.with_archive). Rows keep the id they had in the hot table.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    content = models.TextField()
+    timestamp = models.DateTimeField()
+    type = models.CharField(
+        max_length=30,
+        choices=NotificationType.choices,
+        default=NotificationType.SYSTEM_NOTIFICATION
+    )
+    is_read = models.BooleanField(default=True)
+    count = models.PositiveIntegerField(default=1)
+    
+    # Foreign Keys
+    user = models.ForeignKey(
+        'RegisteredUser',
+        on_delete=models.CASCADE,
+        related_name='archived_notifications'
+    )
+    related_task = models.ForeignKey(
+        'Task',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='archived_notifications'
+    )
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', '-timestamp'], name='archived_notification_user_idx'),
+            models.Index(fields=['timestamp'], name='archived_notification_ts_idx'),
+        ]
+    
+    def __str__(self):
+        """Return string representation of archived notification"""
+        return f"{self.type} - {self.timestamp.strftime('%Y-%m-%d %H:%M')} (archived)"
+    
+    # Business logic methods
+    @classmethod
+    def purge(cls, older_than, batch_size=1000):
+        """
+        Delete archived notifications older than a cutoff in batches
+        
+        Args:
+            older_than: timedelta; archived notifications older than this are deleted
+            batch_size: Number of rows deleted per query
+            
+        Returns:
+            int: Number of notifications deleted
+        """
+        cutoff = timezone.now() - older_than
+        deleted = 0
+        
+        while True:
+            ids = list(
+                cls.objects.filter(timestamp__lt=cutoff)
+                .order_by('timestamp')
+                .values_list('id', flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            cls.objects.filter(id__in=ids).delete()
+            deleted += len(ids)
+            record_maintenance('notification_archive_purge', len(ids))
+        
+        return deleted
@@ -0,0 +1,125 @@
+import datetime
+import logging
+
+from django.db import models, transaction
+from django.utils import timezone
+
+from core.metrics import record_maintenance
+
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxStatus(models.TextChoices):
+    """Enumeration for notification outbox entry status"""
+    PENDING = 'PENDING', 'Pending'
+    FAILED = 'FAILED', 'Failed'
+
+
+class NotificationOutbox(models.Model):
+    """
+    Model for notifications waiting to be delivered
+
+    Request handlers write here instead of to Notification, and the
+    process_notification_outbox worker moves entries to Notification in
+    batches. Entries are deleted once delivered.
+    """
+    user = models.ForeignKey(
+        'RegisteredUser',
+        on_delete=models.CASCADE,
+        related_name='outbox_notifications'
+    )
+    related_task = models.ForeignKey(
+        'Task',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='outbox_notifications'
+    )
+    content = models.TextField()
+    type = models.CharField(max_length=30)
+    created_at = models.DateTimeField(default=timezone.now)
+    status = models.CharField(
+        max_length=10,
+        choices=OutboxStatus.choices,
+        default=OutboxStatus.PENDING
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    available_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'available_at'], name='outbox_pending_idx'),
+        ]
+
+    def __str__(self):
+        """Return string representation of outbox entry"""
+        return f"{self.type} for {self.user_id} ({self.status})"
+
+    # Business logic methods
+    @classmethod
+    def drain(cls, batch_size=500, max_attempts=5, deliver=None):
+        """
+        Deliver one batch of pending outbox entries
+
+        The batch is locked with SKIP LOCKED so several workers can drain
+        concurrently. Notifications are inserted with one bulk_create and the
+        optional push callback receives the whole batch. On failure the batch
+        is rolled back and retried later with exponential backoff; entries
+        that keep failing are marked FAILED.
+
+        Args:
+            batch_size: Maximum number of entries delivered
+            max_attempts: Attempts before an entry is marked FAILED
+            deliver: Optional callable receiving the created notifications
+
+        Returns:
+            int: Number of notifications delivered
+        """
+        from .notification import Notification
+
+        entries = []
+        try:
+            with transaction.atomic():
+                entries = list(
+                    cls.objects.select_for_update(skip_locked=True)
+                    .filter(status=OutboxStatus.PENDING, available_at__lte=timezone.now())
+                    .order_by('id')[:batch_size]
+                )
+                if not entries:
+                    return 0
+
+                notifications = Notification.objects.bulk_create([
+                    Notification(
+                        user_id=entry.user_id,
+                        related_task_id=entry.related_task_id,
+                        content=entry.content,
+                        type=entry.type,
+                    )
+                    for entry in entries
+                ])
+                if deliver is not None:
+                    deliver(notifications)
+
+                cls.objects.filter(id__in=[entry.id for entry in entries]).delete()
+            record_maintenance('notification_outbox_drain', len(notifications))
+            return len(notifications)
+        except Exception as e:
+            logger.exception('Notification outbox batch failed')
+            cls.record_failure([entry.id for entry in entries], str(e), max_attempts)
+            return 0
+
+    @classmethod
+    def record_failure(cls, entry_ids, error, max_attempts):
+        """Schedule failed entries for a retry with exponential backoff"""
+        now = timezone.now()
+        entries = list(cls.objects.filter(id__in=entry_ids))
+        for entry in entries:
+            entry.attempts += 1
+            entry.last_error = error
+            if entry.attempts >= max_attempts:
+                entry.status = OutboxStatus.FAILED
+            else:
+                entry.available_at = now + datetime.timedelta(seconds=2 ** entry.attempts)
+        cls.objects.bulk_update(entries, ['attempts', 'last_error', 'status', 'available_at'])
@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 import os
 import uuid
 
@@ -50,8 +50,11 @@ class Photo(models.Model):
     @classmethod
     def upload_photo(cls, task, image_file):
         """Upload a new photo for a task"""
+        from .task import Task
         photo = cls(task=task, url=image_file)
-        photo.save()
+        with transaction.atomic():
+            photo.save()
+            Task.adjust_count(photo, 'photo_count', 1)
         return photo
     
     def delete_photo(self):
@@ -62,5 +65,10 @@ class Photo(models.Model):
                 os.remove(self.url.path)
         
         # Delete the database record
-        self.delete()
+        from .task import Task
+        with transaction.atomic():
+            # Only count the photo if this call removed its row
+            _, deleted = self.delete()
+            if deleted.get(Photo._meta.label):
+                Task.adjust_count(self, 'photo_count', -1)
         return True
\ No newline at end of file
@@ -0,0 +1,239 @@
+import calendar
+import datetime
+from collections import defaultdict
+
+from django.core.validators import MinValueValidator
+from django.db import models, transaction
+from django.utils import timezone
+
+from core.metrics import record_maintenance
+
+
+class RecurrenceFrequency(models.TextChoices):
+    """Enumeration for recurrence frequencies"""
+    DAILY = 'DAILY', 'Daily'
+    WEEKLY = 'WEEKLY', 'Weekly'
+    MONTHLY = 'MONTHLY', 'Monthly'
+
+
+def add_months(value, months):
+    """Add months to a datetime, clamping the day to the end of the target month"""
+    month_index = value.month - 1 + months
+    year = value.year + month_index // 12
+    month = month_index % 12 + 1
+    day = min(value.day, calendar.monthrange(year, month)[1])
+    return value.replace(year=year, month=month, day=day)
+
+
+class RecurrenceRule(models.Model):
+    """
+    Model for the recurrence rule of a recurring task
+
+    The rule's task is the template of the series. Occurrences are separate
+    Task rows pointing back to it through Task.parent_task, and are created
+    ahead of time by the materialize_recurring_tasks command. The template is
+    also the first occurrence, so completing or cancelling it leaves the
+    series running; only stopping the recurrence deactivates the rule.
+    """
+    task = models.OneToOneField(
+        'Task',
+        on_delete=models.CASCADE,
+        related_name='recurrence'
+    )
+    frequency = models.CharField(
+        max_length=10,
+        choices=RecurrenceFrequency.choices,
+        default=RecurrenceFrequency.WEEKLY
+    )
+    interval = models.PositiveIntegerField(default=1, validators=[MinValueValidator(1)])
+    # End conditions: no occurrence after end_date, at most max_occurrences occurrences
+    end_date = models.DateTimeField(null=True, blank=True)
+    max_occurrences = models.PositiveIntegerField(null=True, blank=True)
+
+    generated_count = models.PositiveIntegerField(default=0)
+    next_occurrence_at = models.DateTimeField(null=True, blank=True)
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # Scheduler scans active rules whose next occurrence is due
+            models.Index(fields=['is_active', 'next_occurrence_at'], name='recurrence_due_idx'),
+        ]
+
+    def __str__(self):
+        """Return string representation of recurrence rule"""
+        return f"{self.task.title} every {self.interval} {self.get_frequency_display().lower()}"
+
+    # Getters
+    def get_frequency(self):
+        """Get recurrence frequency"""
+        return self.frequency
+
+    def get_interval(self):
+        """Get recurrence interval"""
+        return self.interval
+
+    def get_next_occurrence_at(self):
+        """Get deadline of the next occurrence to materialize"""
+        return self.next_occurrence_at
+
+    # Business logic methods
+    def occurrence_deadline(self, index):
+        """
+        Get the deadline of an occurrence
+
+        Args:
+            index: Occurrence number, where 0 is the template task itself
+
+        Returns:
+            datetime: Deadline of the occurrence
+        """
+        base = self.task.deadline
+        if self.frequency == RecurrenceFrequency.DAILY:
+            return base + datetime.timedelta(days=self.interval * index)
+        if self.frequency == RecurrenceFrequency.WEEKLY:
+            return base + datetime.timedelta(weeks=self.interval * index)
+        # Computed from the template each time so clamped days don't drift
+        return add_months(base, self.interval * index)
+
+    def has_occurrence(self, index):
+        """Check if the occurrence is within the rule's end conditions"""
+        if self.max_occurrences is not None and index > self.max_occurrences:
+            return False
+        if self.end_date is not None and self.occurrence_deadline(index) > self.end_date:
+            return False
+        return True
+
+    def reset_schedule(self):
+        """Recompute the next occurrence after the rule has been changed"""
+        next_index = self.generated_count + 1
+        self.is_active = self.has_occurrence(next_index)
+        self.next_occurrence_at = self.occurrence_deadline(next_index) if self.is_active else None
+
+    def save(self, *args, **kwargs):
+        """Save the rule, keeping the next occurrence in sync"""
+        self.reset_schedule()
+        super().save(*args, **kwargs)
+
+    def build_occurrences(self, until):
+        """
+        Build unsaved occurrence tasks with deadlines up to a limit
+
+        Advances generated_count and next_occurrence_at past the built occurrences.
+
+        Args:
+            until: Latest deadline to materialize
+
+        Returns:
+            list: Unsaved Task objects
+        """
+        from .task import Task, TaskStatus
+
+        template = self.task
+        now = timezone.now()
+        occurrences = []
+        index = self.generated_count + 1
+        while self.has_occurrence(index):
+            deadline = self.occurrence_deadline(index)
+            if deadline > until:
+                break
+            index += 1
+            # Occurrences missed while the scheduler wasn't running are skipped
+            if deadline <= now:
+                continue
+            occurrences.append(Task(
+                title=template.title,
+                description=template.description,
+                category=template.category,
+                location=template.location,
+                deadline=deadline,
+                requirements=template.requirements,
+                urgency_level=template.urgency_level,
+                volunteer_number=template.volunteer_number,
+                status=TaskStatus.POSTED,
+                is_recurring=True,
+                creator_id=template.creator_id,
+                parent_task_id=template.id,
+            ))
+
+        self.generated_count = index - 1
+        self.reset_schedule()
+        return occurrences
+
+    @classmethod
+    def materialize_due(cls, horizon=datetime.timedelta(days=14), batch_size=500):
+        """
+        Create the occurrences of all recurring tasks due within a horizon
+
+        Rules are processed in batches, each in its own transaction. Rows are
+        locked with SKIP LOCKED so several workers can run at once, and the
+        unique (parent_task, deadline) constraint makes reruns idempotent.
+
+        Args:
+            horizon: How far ahead of now occurrences are created
+            batch_size: Number of rules processed per transaction
+
+        Returns:
+            int: Number of occurrences materialized
+        """
+        from .task import Task
+        from .tag import Tag
+
+        until = timezone.now() + horizon
+        TaskTag = Tag.tasks.through
+        created = 0
+        last_id = 0
+
+        while True:
+            with transaction.atomic():
+                rules = list(
+                    cls.objects.select_for_update(skip_locked=True, of=('self',))
+                    .select_related('task')
+                    .filter(
+                        is_active=True,
+                        next_occurrence_at__lte=until,
+                        id__gt=last_id
+                    )
+                    .order_by('id')[:batch_size]
+                )
+                if not rules:
+                    break
+                last_id = rules[-1].id
+
+                occurrences = []
+                for rule in rules:
+                    occurrences.extend(rule.build_occurrences(until))
+
+                Task.objects.bulk_create(occurrences, ignore_conflicts=True)
+                cls.objects.bulk_update(rules, ['generated_count', 'next_occurrence_at', 'is_active'])
+
+                # Copy template tags; ids aren't returned for ignored conflicts, so re-read them
+                template_ids = {rule.task_id for rule in rules}
+                template_tags = defaultdict(list)
+                for task_id, tag_id in TaskTag.objects.filter(
+                    task_id__in=template_ids
+                ).values_list('task_id', 'tag_id'):
+                    template_tags[task_id].append(tag_id)
+
+                # Match the exact (template, deadline) pairs of this batch, so older
+                # occurrences sharing a deadline with another series are left alone
+                pairs = models.Q()
+                for task in occurrences:
+                    if task.parent_task_id in template_tags:
+                        pairs |= models.Q(parent_task_id=task.parent_task_id, deadline=task.deadline)
+                if pairs:
+                    new_tasks = Task.objects.filter(pairs).values_list('id', 'parent_task_id')
+                    TaskTag.objects.bulk_create([
+                        TaskTag(task_id=task_id, tag_id=tag_id)
+                        for task_id, parent_id in new_tasks
+                        for tag_id in template_tags[parent_id]
+                    ], ignore_conflicts=True)
+                    Tag.refresh_usage_counts({
+                        tag_id for tag_ids in template_tags.values() for tag_id in tag_ids
+                    })
+
+                created += len(occurrences)
+                record_maintenance('recurrence_materialize', len(occurrences))
+
+        return created
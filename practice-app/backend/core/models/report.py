@@ -0,0 +1,176 @@
+from django.apps import apps
+from django.db import models, transaction
+from django.db.models import F
+from django.utils import timezone
+
+
+class ReportTargetType(models.TextChoices):
+    """Enumeration for the kinds of objects users can report"""
+    USER = 'USER', 'User'
+    TASK = 'TASK', 'Task'
+    COMMENT = 'COMMENT', 'Comment'
+    REVIEW = 'REVIEW', 'Review'
+
+
+# Model of each target type and the field naming the user responsible for it
+TARGET_MODELS = {
+    ReportTargetType.USER: ('RegisteredUser', 'id'),
+    ReportTargetType.TASK: ('Task', 'creator_id'),
+    ReportTargetType.COMMENT: ('Comment', 'user_id'),
+    ReportTargetType.REVIEW: ('Review', 'reviewer_id'),
+}
+
+
+class Report(models.Model):
+    """
+    Model for a user's report of a user, task, comment or review
+
+    A user reports a target once. Filing a report also updates the target's
+    ReportTarget aggregates, which the moderation queue reads.
+    """
+    reporter = models.ForeignKey(
+        'RegisteredUser',
+        on_delete=models.CASCADE,
+        related_name='reports_filed'
+    )
+    target_type = models.CharField(max_length=10, choices=ReportTargetType.choices)
+    target_id = models.PositiveIntegerField()
+    reason = models.TextField()
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        unique_together = ['reporter', 'target_type', 'target_id']
+
+    def __str__(self):
+        """Return string representation of report"""
+        return f"Report of {self.target_type} {self.target_id} by {self.reporter_id}"
+
+    @staticmethod
+    def target_type_of(target):
+        """The ReportTargetType of a model instance"""
+        name = type(target).__name__
+        for target_type, (model_name, _) in TARGET_MODELS.items():
+            if model_name == name:
+                return target_type
+        raise ValueError(f'{name} objects cannot be reported.')
+
+    @staticmethod
+    def get_target(target_type, target_id):
+        """
+        Load a reported object
+
+        Returns:
+            The object, or None if it doesn't exist
+        """
+        model_name, _ = TARGET_MODELS[target_type]
+        return apps.get_model('core', model_name).objects.filter(id=target_id).first()
+
+    @staticmethod
+    def responsible_user_id(target):
+        """Id of the user a target belongs to (the user itself for a user)"""
+        _, field = TARGET_MODELS[Report.target_type_of(target)]
+        return getattr(target, field)
+
+    @classmethod
+    def file_report(cls, reporter, target, reason):
+        """
+        Report a user, task, comment or review
+
+        Args:
+            reporter: RegisteredUser filing the report
+            target: Reported object
+            reason: Why it is reported
+
+        Returns:
+            tuple: (Report, created), created is False if the reporter had
+            already reported the target
+        """
+        target_type = cls.target_type_of(target)
+        with transaction.atomic():
+            report, created = cls.objects.get_or_create(
+                reporter=reporter,
+                target_type=target_type,
+                target_id=target.id,
+                defaults={'reason': reason}
+            )
+            if created:
+                ReportTarget.add_report(report, cls.responsible_user_id(target))
+        return report, created
+
+
+class ReportTarget(models.Model):
+    """
+    Model for the report aggregates of one reported object
+
+    report_count, last_reported_at and last_reason are maintained as reports
+    are filed, so the moderation queue is an ordered range scan of the queue
+    index instead of a count over all reports.
+    """
+    target_type = models.CharField(max_length=10, choices=ReportTargetType.choices)
+    target_id = models.PositiveIntegerField()
+    # The reported user, or the author of the reported content
+    user = models.ForeignKey(
+        'RegisteredUser',
+        on_delete=models.CASCADE,
+        related_name='report_targets'
+    )
+    report_count = models.IntegerField(default=0)
+    last_reported_at = models.DateTimeField()
+    last_reason = models.TextField(blank=True)
+
+    class Meta:
+        unique_together = ['target_type', 'target_id']
+        indexes = [
+            models.Index(fields=['target_type', '-report_count', '-id'], name='report_queue_idx'),
+        ]
+
+    def __str__(self):
+        """Return string representation of report target"""
+        return f"{self.target_type} {self.target_id} ({self.report_count} reports)"
+
+    @classmethod
+    def add_report(cls, report, user_id):
+        """
+        Count a new report in its target's aggregates
+
+        Args:
+            report: The new Report
+            user_id: Id of the user responsible for the target
+        """
+        target, created = cls.objects.get_or_create(
+            target_type=report.target_type,
+            target_id=report.target_id,
+            defaults={
+                'user_id': user_id,
+                'report_count': 1,
+                'last_reported_at': report.created_at,
+                'last_reason': report.reason,
+            }
+        )
+        if not created:
+            cls.objects.filter(id=target.id).update(
+                report_count=F('report_count') + 1,
+                last_reported_at=report.created_at,
+                last_reason=report.reason
+            )
+
+    @classmethod
+    def get_queue(cls, target_type, cursor=None):
+        """
+        Get reported objects of a type, most reported first
+
+        Args:
+            target_type: ReportTargetType value
+            cursor: Optional (report_count, id) of the last target of the previous page
+
+        Returns:
+            QuerySet: ReportTarget objects in queue order
+        """
+        queryset = cls.objects.filter(target_type=target_type).order_by('-report_count', '-id')
+        if cursor is not None:
+            report_count, target_id = cursor
+            queryset = queryset.filter(
+                models.Q(report_count__lt=report_count) |
+                models.Q(report_count=report_count, id__lt=target_id)
+            )
+        return queryset
@@ -125,9 +125,9 @@ class Review(models.Model):
         # Update user rating
         review.update_user_rating()
         
-        # Send notification (if implemented)
+        # Send notification
         from .notification import Notification, NotificationType
-        Notification.send_notification(
+        Notification.enqueue_notification(
             user=reviewee,
             content=f"You received a new review from {reviewer.username}",
             notification_type=NotificationType.NEW_REVIEW,
@@ -136,10 +136,10 @@ class Review(models.Model):
         
         return review
     
-    def report_review(self, reason):
-        """Report this review for moderation"""
-        # This would involve a ReviewReport model (to be implemented)
-        pass
+    def report_review(self, reporter, reason):
+        """Report this review for moderation, returning (Report, created)"""
+        from .report import Report
+        return Report.file_report(reporter, self, reason)
     
     def update_user_rating(self):
         """Update the reviewee's rating based on all reviews"""
@@ -1,5 +1,7 @@
 from django.db.models import Q
 from django.utils import timezone
+from core.db.routers import use_replica
+from .tag import Tag
 from .task import Task, TaskCategory
 from .user import RegisteredUser
 
@@ -11,6 +13,7 @@ class Search:
     """
     
     @staticmethod
+    @use_replica
     def search_by_keyword(keyword):
         """
         Search tasks by keyword in title or description
@@ -32,6 +35,7 @@ class Search:
         )
     
     @staticmethod
+    @use_replica
     def search_by_location(location):
         """
         Search tasks by location
@@ -52,6 +56,7 @@ class Search:
         )
     
     @staticmethod
+    @use_replica
     def search_by_category(category):
         """
         Search tasks by category
@@ -72,27 +77,30 @@ class Search:
         )
     
     @staticmethod
-    def search_by_tags(tags):
+    @use_replica
+    def search_by_tags(tags, any_tags=None, exclude_tags=None):
         """
         Search tasks by tags
         
         Args:
-            tags: List of tag names
+            tags: List of tag names a task must all have
+            any_tags: Optional list of tag names a task must have at least one of
+            exclude_tags: Optional list of tag names a task must not have
             
         Returns:
             QuerySet of matching Task objects
         """
-        if not tags:
+        if not tags and not any_tags:
             return Task.objects.none()
         
-        query = Task.objects.filter(deadline__gt=timezone.now())
-        
-        for tag in tags:
-            query = query.filter(tags__name=tag)
-            
-        return query
+        return Task.objects.filter(
+            Tag.task_filter(all_of=tags or (), any_of=any_tags or (), none_of=exclude_tags or ())
+        ).filter(
+            deadline__gt=timezone.now()
+        )
     
     @staticmethod
+    @use_replica
     def search_users(keyword):
         """
         Search users by name, surname, or username
@@ -113,6 +121,7 @@ class Search:
         )
     
     @staticmethod
+    @use_replica
     def filter_by_rating(min_rating):
         """
         Filter users by minimum rating
@@ -129,6 +138,7 @@ class Search:
         return RegisteredUser.objects.filter(rating__gte=min_rating)
     
     @staticmethod
+    @use_replica
     def sort_by_deadline(ascending=True):
         """
         Sort tasks by deadline
@@ -145,6 +155,7 @@ class Search:
         ).order_by(order_by)
     
     @staticmethod
+    @use_replica
     def sort_by_proximity(location):
         """
         Sort tasks by proximity to a location
@@ -166,8 +177,10 @@ class Search:
         )
     
     @staticmethod
+    @use_replica
     def complex_search(keywords=None, location=None, category=None, 
-                      tags=None, min_rating=None, sort_by='deadline'):
+                      tags=None, min_rating=None, sort_by='deadline',
+                      any_tags=None, exclude_tags=None):
         """
         Combined search with multiple criteria
         
@@ -175,9 +188,11 @@ class Search:
             keywords: Search terms for title/description
             location: Location search term
             category: TaskCategory value
-            tags: List of tag names
+            tags: List of tag names a task must all have
             min_rating: Minimum creator rating
             sort_by: Field to sort by ('deadline', 'rating', 'location')
+            any_tags: List of tag names a task must have at least one of
+            exclude_tags: List of tag names a task must not have
             
         Returns:
             QuerySet of matching Task objects
@@ -201,9 +216,10 @@ class Search:
         if category and category in [c[0] for c in TaskCategory.choices]:
             query = query.filter(category=category)
             
-        if tags:
-            for tag in tags:
-                query = query.filter(tags__name=tag)
+        if tags or any_tags or exclude_tags:
+            query = query.filter(
+                Tag.task_filter(all_of=tags or (), any_of=any_tags or (), none_of=exclude_tags or ())
+            )
                 
         if min_rating is not None and min_rating >= 1.0 and min_rating <= 5.0:
             query = query.filter(creator__rating__gte=min_rating)
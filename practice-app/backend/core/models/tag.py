@@ -1,10 +1,37 @@
 from django.db import models
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+from core.metrics import record_maintenance
+
+
+def normalize_names(names):
+    """Stripped, lowercased tag names, without blank ones"""
+    return {name.strip().lower() for name in names if name and name.strip()}
+
+
+def link_count(through, **filters):
+    """Subquery counting the links of a through table to the outer tag"""
+    rows = through.objects.filter(tag=OuterRef('pk'), **filters).order_by().values('tag').annotate(
+        total=Count('id')
+    ).values('total')
+    return Coalesce(Subquery(rows), 0)
 
 
 class Tag(models.Model):
     """Model for tags/labels used for tasks"""
     name = models.CharField(max_length=50, unique=True)
     tasks = models.ManyToManyField('Task', related_name='tags')
+    # Number of tasks and bookmarks using the tag, for ranking suggestions
+    usage_count = models.IntegerField(default=0)
+    
+    class Meta:
+        indexes = [
+            # Prefix (LIKE 'abc%') lookups for suggestions; PostgreSQL only uses the
+            # unique index for them under the C collation
+            models.Index(fields=['name'], name='tag_name_prefix_idx', opclasses=['varchar_pattern_ops']),
+            models.Index(fields=['-usage_count', 'name'], name='tag_usage_idx'),
+        ]
     
     def __str__(self):
         """Return string representation of tag"""
@@ -36,12 +63,147 @@ class Tag(models.Model):
         tag, created = cls.objects.get_or_create(name=name.lower())
         return tag
     
+    @classmethod
+    def ensure_many(cls, names):
+        """
+        Get or create several tags at once
+        
+        Args:
+            names: Iterable of tag names (case insensitive)
+            
+        Returns:
+            dict: Mapping of normalized tag name to Tag
+        """
+        names = normalize_names(names)
+        if not names:
+            return {}
+        
+        tags = {tag.name: tag for tag in cls.objects.filter(name__in=names)}
+        
+        missing = names - set(tags)
+        if missing:
+            # Concurrent requests may create the same tags, so ignore conflicts and re-read
+            cls.objects.bulk_create([cls(name=name) for name in missing], ignore_conflicts=True)
+            tags.update((tag.name, tag) for tag in cls.objects.filter(name__in=missing))
+        
+        return tags
+    
+    @classmethod
+    def refresh_usage_counts(cls, tag_ids=None):
+        """
+        Recount how many tasks and bookmarks use tags
+        
+        Args:
+            tag_ids: Optional ids of the tags to recount, all tags if not given
+            
+        Returns:
+            int: Number of tags updated
+        """
+        from .bookmark import Bookmark
+        queryset = cls.objects.all()
+        if tag_ids is not None:
+            tag_ids = list(tag_ids)
+            if not tag_ids:
+                return 0
+            queryset = queryset.filter(id__in=tag_ids)
+        updated = queryset.update(
+            usage_count=link_count(cls.tasks.through) + link_count(Bookmark.tags.through)
+        )
+        if tag_ids is None:
+            record_maintenance('tag_usage', updated)
+        return updated
+    
+    @classmethod
+    def resolve_names(cls, names):
+        """
+        Look up the ids of tags by name with one query
+        
+        Args:
+            names: Tag names (case insensitive)
+            
+        Returns:
+            dict: Lowercased name to id, for the tags that exist
+        """
+        names = normalize_names(names)
+        if not names:
+            return {}
+        return dict(cls.objects.filter(name__in=names).values_list('name', 'id'))
+    
+    @classmethod
+    def task_filter(cls, all_of=(), any_of=(), none_of=()):
+        """
+        Build a condition on tasks matching a tag query
+        
+        Names are resolved to ids in one query. Each part then becomes a
+        single subquery over the task-tag links, however many tags it has:
+        tasks having all tags are found by grouping the links and counting
+        the matched tags.
+        
+        Args:
+            all_of: Names of tags a task must all have
+            any_of: Names of tags a task must have at least one of
+            none_of: Names of tags a task must not have
+            
+        Returns:
+            Q: Condition to filter a Task queryset with
+        """
+        all_of, any_of, none_of = (
+            normalize_names(names) for names in (all_of, any_of, none_of)
+        )
+        ids = cls.resolve_names(all_of | any_of | none_of)
+        links = cls.tasks.through.objects.order_by()
+        no_tasks = Q(id__in=[])
+        condition = Q()
+        
+        if all_of:
+            if not all_of <= ids.keys():
+                return no_tasks
+            tag_ids = [ids[name] for name in all_of]
+            matching = links.filter(tag_id__in=tag_ids).values('task_id')
+            if len(tag_ids) > 1:
+                matching = matching.annotate(matched=Count('tag_id')).filter(
+                    matched=len(tag_ids)
+                ).values('task_id')
+            condition &= Q(id__in=matching)
+        
+        if any_of:
+            tag_ids = [ids[name] for name in any_of if name in ids]
+            if not tag_ids:
+                return no_tasks
+            condition &= Q(id__in=links.filter(tag_id__in=tag_ids).values('task_id'))
+        
+        tag_ids = [ids[name] for name in none_of if name in ids]
+        if tag_ids:
+            condition &= ~Q(id__in=links.filter(tag_id__in=tag_ids).values('task_id'))
+        
+        return condition
+    
+    @classmethod
+    def suggest(cls, prefix, limit=10):
+        """
+        Suggest tags starting with a prefix, most used first
+        
+        Args:
+            prefix: Beginning of the tag name (case insensitive)
+            limit: Maximum number of tags
+            
+        Returns:
+            QuerySet: Matching tags
+        """
+        queryset = cls.objects.all()
+        prefix = prefix.strip().lower()
+        if prefix:
+            queryset = queryset.filter(name__startswith=prefix)
+        return queryset.order_by('-usage_count', 'name')[:limit]
+    
     def add_to_task(self, task):
         """Add this tag to a task"""
         self.tasks.add(task)
+        Tag.refresh_usage_counts([self.id])
         return True
     
     def remove_from_task(self, task):
         """Remove this tag from a task"""
         self.tasks.remove(task)
+        Tag.refresh_usage_counts([self.id])
         return True
\ No newline at end of file
@@ -1,6 +1,13 @@
-from django.db import models
+from functools import reduce
+from operator import or_
+
+from django.db import models, transaction, DatabaseError, DEFAULT_DB_ALIAS
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
+from core.metrics import record_maintenance
+
 
 class TaskCategory(models.TextChoices):
     """Enumeration for task categories"""
@@ -22,6 +29,14 @@ class TaskStatus(models.TextChoices):
     EXPIRED = 'EXPIRED', 'Expired'
 
 
+def related_count(model, *conditions):
+    """Subquery counting the rows of a model that belong to the outer task"""
+    rows = model.objects.filter(*conditions, task=OuterRef('pk')).order_by().values('task').annotate(
+        total=Count('id')
+    ).values('total')
+    return Coalesce(Subquery(rows), 0)
+
+
 class Task(models.Model):
     """Model for assistance tasks"""
     title = models.CharField(max_length=255)
@@ -58,10 +73,46 @@ class Task(models.Model):
         blank=True,
         related_name='assigned_tasks'
     )
+    # Template task of the recurring series this task is an occurrence of
+    parent_task = models.ForeignKey(
+        'self',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='occurrences'
+    )
+    
+    # Denormalized counts shown on task cards, kept up to date by the model
+    # methods adding and removing the related rows; recount_counters repairs them
+    comment_count = models.IntegerField(default=0)
+    volunteer_count = models.IntegerField(default=0)
+    bookmark_count = models.IntegerField(default=0)
+    photo_count = models.IntegerField(default=0)
+    
+    class Meta:
+        constraints = [
+            # One occurrence per deadline keeps recurrence materialization idempotent
+            models.UniqueConstraint(
+                fields=['parent_task', 'deadline'],
+                name='unique_task_occurrence'
+            ),
+        ]
+    
+    COUNTER_FIELDS = ('comment_count', 'volunteer_count', 'bookmark_count', 'photo_count')
     
     def __str__(self):
         """Return string representation of task"""
         return self.title
+    
+    def save(self, *args, **kwargs):
+        """Save the task, leaving its counters to adjust_count and recount_counters"""
+        # A stale in-memory copy must not overwrite counts changed since it was loaded
+        if not self._state.adding and not kwargs.get('force_insert') and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
 
     # Getters
     def get_task_id(self):
@@ -124,6 +175,10 @@ class Task(models.Model):
         """Get tags associated with this task"""
         return self.tags.all()
     
+    def get_parent_task(self):
+        """Get the recurring task this task is an occurrence of"""
+        return self.parent_task
+    
     # Setters
     def set_title(self, title):
         """Set task title"""
@@ -174,6 +229,48 @@ class Task(models.Model):
         """Set whether task is recurring"""
         self.is_recurring = is_recurring
         self.save()
+        
+        # Stop generating occurrences when recurrence is switched off
+        if not is_recurring:
+            self.stop_recurrence()
+    
+    def stop_recurrence(self):
+        """Deactivate the recurrence rule of this task, if it has one"""
+        from .recurrence import RecurrenceRule
+        RecurrenceRule.objects.filter(task=self).update(is_active=False, next_occurrence_at=None)
+    
+    def set_recurrence(self, frequency, interval=1, end_date=None, max_occurrences=None):
+        """
+        Make this task recurring with the given rule
+        
+        Args:
+            frequency: RecurrenceFrequency value
+            interval: Number of frequency units between occurrences
+            end_date: Optional latest occurrence deadline
+            max_occurrences: Optional maximum number of occurrences
+            
+        Returns:
+            RecurrenceRule: The created or updated rule
+        """
+        from .recurrence import RecurrenceRule
+        
+        rule, created = RecurrenceRule.objects.get_or_create(
+            task=self,
+            defaults={'frequency': frequency, 'interval': interval,
+                      'end_date': end_date, 'max_occurrences': max_occurrences}
+        )
+        if not created:
+            rule.frequency = frequency
+            rule.interval = interval
+            rule.end_date = end_date
+            rule.max_occurrences = max_occurrences
+            rule.save()
+        
+        if not self.is_recurring:
+            self.is_recurring = True
+            self.save()
+        
+        return rule
     
     def set_assignee(self, assignee):
         """Set task assignee"""
@@ -186,6 +283,59 @@ class Task(models.Model):
         self.save()
         return self
     
+    @classmethod
+    def bulk_import(cls, creator, rows, chunk_size=500):
+        """
+        Insert many validated tasks with their tags
+        
+        Tags for all rows are resolved up front, then tasks and tag links are
+        inserted with bulk_create in one transaction per chunk. A failing chunk
+        is rolled back and reported without aborting the remaining chunks.
+        
+        Args:
+            creator: RegisteredUser who creates the tasks
+            rows: List of dicts of Task field values, each with an optional 'tags' list
+            chunk_size: Number of tasks inserted per transaction
+            
+        Returns:
+            tuple: (created, failed) where created is a list of (position, Task)
+                and failed is a list of (position, error message)
+        """
+        from .tag import Tag, normalize_names
+        
+        tags = Tag.ensure_many(
+            name for row in rows for name in row.get('tags', [])
+        )
+        TaskTag = Tag.tasks.through
+        
+        created = []
+        failed = []
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            positions = range(start, start + len(chunk))
+            tasks = [
+                cls(creator=creator, **{k: v for k, v in row.items() if k != 'tags'})
+                for row in chunk
+            ]
+            
+            try:
+                with transaction.atomic():
+                    cls.objects.bulk_create(tasks)
+                    TaskTag.objects.bulk_create([
+                        TaskTag(tag_id=tags[name].id, task_id=task.id)
+                        for task, row in zip(tasks, chunk)
+                        for name in normalize_names(row.get('tags', []))
+                    ], ignore_conflicts=True)
+            except DatabaseError as e:
+                failed.extend((position, str(e)) for position in positions)
+                continue
+            
+            created.extend(zip(positions, tasks))
+        
+        Tag.refresh_usage_counts(tag.id for tag in tags.values())
+        
+        return created, failed
+    
     def update_task(self):
         """Update the task"""
         self.updated_at = timezone.now()
@@ -203,6 +353,11 @@ class Task(models.Model):
         self.save()
         return True
     
+    def report_task(self, reporter, reason):
+        """Report this task for moderation, returning (Report, created)"""
+        from .report import Report
+        return Report.file_report(reporter, self, reason)
+    
     def confirm_completion(self):
         """Mark task as completed"""
         self.status = TaskStatus.COMPLETED
@@ -211,6 +366,10 @@ class Task(models.Model):
         # Update the assignee's completed task count
         if self.assignee:
             self.assignee.increment_completed_task_count()
+            
+            # Completed work counts towards the assignee's category history
+            from .matching import VolunteerCandidate
+            VolunteerCandidate.refresh_users([self.assignee_id])
         
         return True
     
@@ -225,5 +384,63 @@ class Task(models.Model):
         if self.deadline < timezone.now() and self.status == TaskStatus.POSTED:
             self.status = TaskStatus.EXPIRED
             self.save()
+            record_maintenance('task_expiry', 1)
             return True
-        return False
\ No newline at end of file
+        return False
+    
+    @classmethod
+    def adjust_count(cls, obj, field, delta):
+        """
+        Atomically add to a counter of the task an object belongs to
+        
+        Args:
+            obj: Comment, Volunteer, Bookmark or Photo of the task
+            field: Counter field name, e.g. 'comment_count'
+            delta: Amount to add
+        """
+        cls.objects.filter(id=obj.task_id).update(**{field: F(field) + delta})
+        # Keep a loaded task in step so responses show the new count
+        if type(obj).task.is_cached(obj):
+            setattr(obj.task, field, getattr(obj.task, field) + delta)
+    
+    @classmethod
+    def counter_expressions(cls):
+        """Expressions computing each counter from the related rows"""
+        from .comment import Comment
+        from .volunteer import Volunteer, VolunteerStatus
+        from .bookmark import Bookmark
+        from .photo import Photo
+        return {
+            'comment_count': related_count(Comment),
+            'volunteer_count': related_count(Volunteer, ~Q(status=VolunteerStatus.WITHDRAWN)),
+            'bookmark_count': related_count(Bookmark),
+            'photo_count': related_count(Photo),
+        }
+    
+    @classmethod
+    def recount_counters(cls, queryset=None, batch_size=1000):
+        """
+        Recount the counters of tasks whose stored counts drifted
+        
+        Args:
+            queryset: Optional queryset limiting the tasks checked
+            batch_size: Number of tasks updated per query
+            
+        Returns:
+            int: Number of tasks corrected
+        """
+        if queryset is None:
+            queryset = cls.objects.all()
+        expressions = cls.counter_expressions()
+        drifted = queryset.using(DEFAULT_DB_ALIAS).annotate(
+            **{f'actual_{field}': expression for field, expression in expressions.items()}
+        ).filter(
+            reduce(or_, (~Q(**{field: F(f'actual_{field}')}) for field in expressions))
+        )
+        task_ids = list(drifted.values_list('id', flat=True))
+        for start in range(0, len(task_ids), batch_size):
+            cls.objects.using(DEFAULT_DB_ALIAS).filter(
+                id__in=task_ids[start:start + batch_size]
+            ).update(**expressions)
+        record_maintenance('task_counters', len(task_ids))
+        return len(task_ids)
@@ -54,6 +54,8 @@ class RegisteredUser(AbstractBaseUser, PermissionsMixin):
     location = models.CharField(max_length=255, blank=True)
     rating = models.FloatField(default=0.0)
     completed_task_count = models.IntegerField(default=0)
+    # Merge notifications over the longer digest window instead of the default one
+    notification_digest = models.BooleanField(default=False)
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
     reset_token = models.CharField(max_length=100, null=True, blank=True)
@@ -199,9 +201,9 @@ class RegisteredUser(AbstractBaseUser, PermissionsMixin):
         pass
     
     def report_user(self, user, reason):
-        """Report a user"""
-        # This would involve a UserReport model (to be implemented)
-        pass
+        """Report a user, returning (Report, created)"""
+        from .report import Report
+        return Report.file_report(self, user, reason)
 
 
 class Administrator(models.Model):
@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 
 
@@ -72,8 +72,15 @@ class Volunteer(models.Model):
         if existing:
             return existing
         
+        from .task import Task
         volunteer = cls(user=user, task=task)
-        volunteer.save()
+        with transaction.atomic():
+            volunteer.save()
+            Task.adjust_count(volunteer, 'volunteer_count', 1)
+        
+        # Keep the matching index in sync with the user's category history
+        from .matching import VolunteerCandidate
+        VolunteerCandidate.refresh_users([user.id])
         return volunteer
     
     def withdraw_volunteer(self):
@@ -84,8 +91,18 @@ class Volunteer(models.Model):
             task.set_status('POSTED')
             task.set_assignee(None)
         
-        self.status = VolunteerStatus.WITHDRAWN
-        self.save()
+        from .task import Task
+        with transaction.atomic():
+            # Decided by the row, not this instance, so concurrent withdrawals count once
+            changed = Volunteer.objects.filter(id=self.id).exclude(
+                status=VolunteerStatus.WITHDRAWN
+            ).update(status=VolunteerStatus.WITHDRAWN)
+            if changed:
+                Task.adjust_count(self, 'volunteer_count', -1)
+            self.status = VolunteerStatus.WITHDRAWN
+        
+        from .matching import VolunteerCandidate
+        VolunteerCandidate.refresh_users([self.user_id])
         return True
     
     def accept_volunteer(self):
@@ -112,6 +129,10 @@ class Volunteer(models.Model):
             volunteer.status = VolunteerStatus.REJECTED
             volunteer.save()
         
+        # The accepted volunteer's load changed
+        from .matching import VolunteerCandidate
+        VolunteerCandidate.refresh_users([self.user_id])
+        
         return True
     
     def reject_volunteer(self):
@@ -0,0 +1,221 @@
+"""
+Notification dispatch queue
+
+Notifications sent from request handlers go through dispatch() instead of
+being inserted one by one. NOTIFICATION_DISPATCH_MODE selects how:
+
+- 'sync': insert immediately (used by the test suite)
+- 'outbox': one INSERT into NotificationOutbox after the request's
+  transaction commits; the process_notification_outbox worker moves them to
+  Notification in batches and performs push delivery
+- 'memory': queue in-process and flush from a background thread in batches;
+  when the queue is full (backpressure) or a flush keeps failing, entries are
+  written to the outbox instead so they are not lost. When the process exits,
+  entries still queued are written to the outbox as well
+"""
+import atexit
+import logging
+import queue
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils.module_loading import import_string
+
+
+logger = logging.getLogger(__name__)
+
+SYNC = 'sync'
+OUTBOX = 'outbox'
+MEMORY = 'memory'
+
+_queue = None
+_worker = None
+_worker_lock = threading.Lock()
+# Held by the worker while it flushes a batch it took off the queue
+_flush_lock = threading.Lock()
+
+
+def get_mode():
+    """Return the configured dispatch mode"""
+    return getattr(settings, 'NOTIFICATION_DISPATCH_MODE', SYNC)
+
+
+def get_push_backend():
+    """Return the configured push delivery callable, if any"""
+    path = getattr(settings, 'NOTIFICATION_PUSH_BACKEND', None)
+    return import_string(path) if path else None
+
+
+def _build(rows, model):
+    """Build unsaved model instances from notification rows"""
+    return [model(**row) for row in rows]
+
+
+def deliver_now(rows):
+    """
+    Insert notifications with one query and push them
+
+    Args:
+        rows: List of dicts with user_id, content, type and related_task_id
+
+    Returns:
+        list: Created Notification objects
+    """
+    from core.models import Notification
+
+    notifications = Notification.objects.bulk_create(_build(rows, Notification))
+    push = get_push_backend()
+    if push is not None:
+        push(notifications)
+    return notifications
+
+
+def write_outbox(rows):
+    """Write notifications to the outbox with one query"""
+    from core.models import NotificationOutbox
+
+    NotificationOutbox.objects.bulk_create(_build(rows, NotificationOutbox))
+
+
+def dispatch(rows):
+    """
+    Send notifications using the configured dispatch mode
+
+    Args:
+        rows: List of dicts with user_id, content, type and related_task_id
+
+    Returns:
+        list: Created Notification objects in sync mode, otherwise an empty list
+    """
+    rows = list(rows)
+    if not rows:
+        return []
+
+    mode = get_mode()
+    if mode == OUTBOX:
+        # Only rows from committed transactions reach the outbox
+        transaction.on_commit(lambda: write_outbox(rows))
+        return []
+    if mode == MEMORY:
+        transaction.on_commit(lambda: _enqueue(rows))
+        return []
+    return deliver_now(rows)
+
+
+def _enqueue(rows):
+    """Put rows on the in-process queue, spilling to the outbox when it is full"""
+    _ensure_worker()
+    for index, row in enumerate(rows):
+        try:
+            _queue.put_nowait(row)
+        except queue.Full:
+            logger.warning('Notification queue full, writing %d notifications to the outbox',
+                           len(rows) - index)
+            write_outbox(rows[index:])
+            return
+
+
+def _ensure_worker():
+    """Start the background flush thread once per process"""
+    global _queue, _worker
+    if _worker is not None and _worker.is_alive():
+        return
+    with _worker_lock:
+        if _worker is not None and _worker.is_alive():
+            return
+        if _queue is None:
+            _queue = queue.Queue(maxsize=settings.NOTIFICATION_QUEUE_MAX_SIZE)
+            # The worker is a daemon thread; don't lose what it hasn't flushed
+            atexit.register(spill_queue)
+        _worker = threading.Thread(target=_run_worker, name='notification-dispatch', daemon=True)
+        _worker.start()
+
+
+def _take_batch(timeout):
+    """Block for the first row, then take whatever else is queued up to the batch size"""
+    try:
+        batch = [_queue.get(timeout=timeout)]
+    except queue.Empty:
+        return []
+    while len(batch) < settings.NOTIFICATION_BATCH_SIZE:
+        try:
+            batch.append(_queue.get_nowait())
+        except queue.Empty:
+            break
+    return batch
+
+
+def flush(batch):
+    """
+    Deliver a batch from the in-process queue, retrying with backoff
+
+    Batches that still fail after NOTIFICATION_MAX_ATTEMPTS are written to the
+    outbox for the outbox worker to retry.
+    """
+    attempts = settings.NOTIFICATION_MAX_ATTEMPTS
+    for attempt in range(1, attempts + 1):
+        try:
+            deliver_now(batch)
+            return True
+        except Exception:
+            logger.exception('Notification flush failed (attempt %d/%d)', attempt, attempts)
+            close_old_connections()
+            if attempt < attempts:
+                time.sleep(min(2 ** attempt * 0.1, 5))
+
+    try:
+        write_outbox(batch)
+    except Exception:
+        logger.exception('Dropping %d notifications after failed flush', len(batch))
+    return False
+
+
+def _run_worker():
+    """Background loop draining the in-process queue"""
+    while True:
+        batch = _take_batch(timeout=settings.NOTIFICATION_FLUSH_INTERVAL)
+        if batch:
+            with _flush_lock:
+                flush(batch)
+        close_old_connections()
+
+
+def drain_queue():
+    """Flush everything currently in the in-process queue (used in tests)"""
+    if _queue is None:
+        return
+    while True:
+        batch = _take_batch(timeout=0.01)
+        if not batch:
+            return
+        flush(batch)
+
+
+def spill_queue():
+    """
+    Write everything left in the in-process queue to the outbox
+
+    Registered to run at process exit. Waits up to
+    NOTIFICATION_SHUTDOWN_TIMEOUT seconds for a batch the worker is flushing,
+    then writes the queued rows with one INSERT for the outbox worker to deliver.
+    """
+    if _queue is None:
+        return
+    acquired = _flush_lock.acquire(timeout=settings.NOTIFICATION_SHUTDOWN_TIMEOUT)
+    try:
+        rows = []
+        while True:
+            try:
+                rows.append(_queue.get_nowait())
+            except queue.Empty:
+                break
+        if rows:
+            try:
+                write_outbox(rows)
+            except Exception:
+                logger.exception('Dropping %d queued notifications at shutdown', len(rows))
+    finally:
+        if acquired:
+            _flush_lock.release()
@@ -1,24 +1,79 @@
 from rest_framework import permissions
 
 
+# Foreign keys naming the user who owns an object, checked in order
+OWNER_FIELDS = ('user', 'creator', 'reviewer')
+
+
+def load_roles(user_id):
+    """Query the roles of a user"""
+    from core.models import Administrator
+    roles = set()
+    if Administrator.objects.filter(user_id=user_id).exists():
+        roles.add('administrator')
+    return frozenset(roles)
+
+
+def get_roles(user):
+    """
+    Get the roles of a user, querying them once per request
+
+    Roles are kept on the user instance, which lives as long as the request.
+    They aren't cached across requests, so a revoked role takes effect on the
+    next request in every worker process.
+
+    Args:
+        user: The request's user
+
+    Returns:
+        frozenset: Role names, empty for anonymous users
+    """
+    if not user.is_authenticated:
+        return frozenset()
+    roles = getattr(user, '_roles', None)
+    if roles is None:
+        roles = user._roles = load_roles(user.pk)
+    return roles
+
+
+def administrator_changed(sender, instance, **kwargs):
+    """Signal receiver keeping the roles of a loaded user made or unmade administrator current"""
+    if sender.user.is_cached(instance):
+        instance.user._roles = load_roles(instance.user_id)
+
+
+def is_administrator(user):
+    """Whether a user is an administrator"""
+    return 'administrator' in get_roles(user)
+
+
+def owner_id(obj):
+    """
+    Get the id of the user owning an object from its foreign key column
+
+    Returns:
+        The owner's id, or the object's own id when it has no owner field
+    """
+    for field in OWNER_FIELDS:
+        attname = f'{field}_id'
+        if hasattr(obj, attname):
+            return getattr(obj, attname)
+    return getattr(obj, 'id', None)
+
+
+def task_of(obj):
+    """The object itself if it is a task, otherwise the task it belongs to"""
+    return obj if hasattr(obj, 'creator_id') else obj.task
+
+
 class IsOwner(permissions.BasePermission):
     """
     Custom permission to only allow owners of an object to access it.
     """
     def has_object_permission(self, request, view, obj):
-        # Check if the object has a user attribute and if the user is the owner
-        if hasattr(obj, 'user'):
-            return obj.user == request.user
-        
-        # Check if the object has a creator attribute and if the user is the creator
-        if hasattr(obj, 'creator'):
-            return obj.creator == request.user
-            
-        # Check if the object is a user object itself
-        if hasattr(obj, 'id') and hasattr(request.user, 'id'):
-            return obj.id == request.user.id
-            
-        return False
+        # Compare ids, the owner is not loaded
+        user_id = getattr(request.user, 'id', None)
+        return user_id is not None and owner_id(obj) == user_id
 
 
 class IsTaskCreator(permissions.BasePermission):
@@ -26,7 +81,7 @@ class IsTaskCreator(permissions.BasePermission):
     Custom permission to only allow creators of a task to perform actions on it.
     """
     def has_object_permission(self, request, view, obj):
-        return obj.creator == request.user
+        return task_of(obj).creator_id == request.user.id
 
 
 class IsTaskParticipant(permissions.BasePermission):
@@ -34,7 +89,8 @@ class IsTaskParticipant(permissions.BasePermission):
     Custom permission to only allow participants of a task (creator or assignee) to access it.
     """
     def has_object_permission(self, request, view, obj):
-        return (obj.creator == request.user or obj.assignee == request.user)
+        task = task_of(obj)
+        return request.user.id is not None and request.user.id in (task.creator_id, task.assignee_id)
 
 
 class IsAdministrator(permissions.BasePermission):
@@ -42,7 +98,7 @@ class IsAdministrator(permissions.BasePermission):
     Custom permission to only allow administrators to access.
     """
     def has_permission(self, request, view):
-        return hasattr(request.user, 'administrator')
-        
+        return is_administrator(request.user)
+
     def has_object_permission(self, request, view, obj):
-        return hasattr(request.user, 'administrator')
\ No newline at end of file
+        return is_administrator(request.user)
@@ -0,0 +1,147 @@
+from asgiref.sync import async_to_sync
+from django.test import TestCase, override_settings
+from django.utils import timezone
+import datetime
+import threading
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+from core.api.views import async_views
+from core.models import (
+    RegisteredUser, Task, TaskCategory, Comment, Review, Notification, NotificationType, Bookmark
+)
+
+
+# Worker threads use their own connections, which don't see the test's transaction
+@override_settings(ASYNC_PARALLEL_QUERIES=False)
+class AsyncViewTests(TestCase):
+    """Test cases for the async composite read endpoints"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        self.user = self.create_user('user')
+        self.other = self.create_user('other')
+        self.task = self.create_task(self.other)
+        self.own_task = self.create_task(self.user)
+        self.client.force_authenticate(user=self.user)
+
+    def create_user(self, name):
+        """Create a user"""
+        return RegisteredUser.objects.create_user(
+            email=f'{name}@example.com',
+            name=name.title(),
+            surname='User',
+            username=name,
+            phone_number='1234567890',
+            password='password123'
+        )
+
+    def create_task(self, creator):
+        """Create a posted task"""
+        return Task.objects.create(
+            title='Task',
+            description='Description',
+            category=TaskCategory.OTHER,
+            location='Location',
+            deadline=timezone.now() + datetime.timedelta(days=2),
+            creator=creator
+        )
+
+    def test_requires_authentication(self):
+        """Test anonymous requests are rejected"""
+        response = APIClient().get('/api/async/feed/')
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()['status'], 'error')
+
+    def test_token_authentication(self):
+        """Test the API's token authentication is accepted"""
+        token = Token.objects.create(user=self.user)
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+
+        response = client.get('/api/async/notifications/')
+        self.assertEqual(response.status_code, 200)
+
+    def test_only_get(self):
+        """Test other methods are not allowed"""
+        response = self.client.post('/api/async/feed/')
+        self.assertEqual(response.status_code, 405)
+
+    def test_invalid_page(self):
+        """Test non-numeric page parameters are rejected"""
+        response = self.client.get('/api/async/feed/', {'limit': 'all'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_feed(self):
+        """Test the feed page combines open tasks, unread count and bookmarks"""
+        Bookmark.objects.create(user=self.user, task=self.task)
+        Notification.objects.create(
+            user=self.user, type=NotificationType.TASK_CREATED, content='New task', related_task=self.task
+        )
+
+        response = self.client.get('/api/async/feed/')
+        self.assertEqual(response.status_code, 200)
+        data = response.json()['data']
+        # The user's own tasks are not in their feed
+        self.assertEqual([task['id'] for task in data['tasks']], [self.task.id])
+        self.assertEqual(data['tasks'][0]['creator']['id'], self.other.id)
+        self.assertEqual(data['unread_count'], 1)
+        self.assertEqual(data['bookmarked_task_ids'], [self.task.id])
+
+    def test_notifications(self):
+        """Test the notification page matches the list endpoint's shape"""
+        for i in range(3):
+            Notification.objects.create(
+                user=self.user, type=NotificationType.TASK_CREATED, content=f'Notification {i}',
+                related_task=self.task, is_read=i == 0
+            )
+        Notification.objects.create(user=self.other, type=NotificationType.TASK_CREATED, content='Other')
+
+        response = self.client.get('/api/async/notifications/', {'limit': 2})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()['data']
+        self.assertEqual([n['content'] for n in data['notifications']], ['Notification 2', 'Notification 1'])
+        self.assertEqual(data['pagination']['total_records'], 3)
+        self.assertEqual(data['pagination']['next_page'], 2)
+        self.assertEqual(data['unread_count'], 2)
+
+        response = self.client.get('/api/async/notifications/', {'unread': 'true'})
+        self.assertEqual(response.json()['data']['pagination']['total_records'], 2)
+
+    def test_task_page(self):
+        """Test the task page combines the task, its comments, photos and reviews"""
+        Comment.objects.create(user=self.user, task=self.task, content='First')
+        Comment.objects.create(user=self.other, task=self.task, content='Second')
+        Comment.objects.create(user=self.user, task=self.own_task, content='Elsewhere')
+        Review.objects.create(
+            reviewer=self.other, reviewee=self.user, task=self.task, score=5, comment='Great'
+        )
+
+        response = self.client.get(f'/api/async/tasks/{self.task.id}/', {'limit': 1, 'page': 2})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()['data']
+        self.assertEqual(data['task']['id'], self.task.id)
+        self.assertEqual([c['content'] for c in data['comments']], ['Second'])
+        self.assertEqual(data['comments_pagination']['total_records'], 2)
+        self.assertEqual(data['photos'], [])
+        self.assertEqual([r['comment'] for r in data['reviews']], ['Great'])
+
+    def test_task_page_not_found(self):
+        """Test a missing task returns 404"""
+        response = self.client.get('/api/async/tasks/999999/')
+        self.assertEqual(response.status_code, 404)
+
+    @override_settings(ASYNC_PARALLEL_QUERIES=True)
+    def test_gather_runs_pieces_concurrently(self):
+        """Test pieces run at the same time when parallel queries are enabled"""
+        # Each piece waits for the other; run one after another they would time out
+        barrier = threading.Barrier(2, timeout=5)
+
+        def piece(value):
+            def run():
+                barrier.wait()
+                return value
+            return run
+
+        results = async_to_sync(async_views.gather)(piece(1), piece(2))
+        self.assertEqual(results, [1, 2])
@@ -0,0 +1,97 @@
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
+import io
+import json
+import os
+import tempfile
+from core.management.benchmark import scenarios
+from core.models import (
+    RegisteredUser, Task, TaskStatus, Volunteer, Review, Notification, Bookmark
+)
+
+
+# Worker threads use their own connections, which don't see the test's transaction
+@override_settings(ASYNC_PARALLEL_QUERIES=False)
+class LoadDataAndBenchmarkTests(TestCase):
+    """Test cases for the load data generator and the benchmark suite"""
+
+    def setUp(self):
+        """Generate a small dataset"""
+        call_command(
+            'generate_load_data', users=30, tasks=80, seed=1, batch_size=25,
+            stdout=io.StringIO()
+        )
+        self.baseline_dir = tempfile.TemporaryDirectory()
+        self.baseline_path = os.path.join(self.baseline_dir.name, 'baseline.json')
+
+    def tearDown(self):
+        """Remove the baseline directory"""
+        self.baseline_dir.cleanup()
+
+    def run_benchmarks(self, *args, **options):
+        """Run the benchmark command, returning its output"""
+        out = io.StringIO()
+        call_command(
+            'run_benchmarks', *args, iterations=3, warmup=1,
+            baseline=self.baseline_path, stdout=out, **options
+        )
+        return out.getvalue()
+
+    def test_generated_data(self):
+        """Test the generator creates consistent related data"""
+        self.assertEqual(RegisteredUser.objects.filter(username__startswith='load_').count(), 30)
+        self.assertEqual(Task.objects.count(), 80)
+        self.assertTrue(Volunteer.objects.exists())
+        self.assertTrue(Notification.objects.exists())
+        self.assertTrue(Bookmark.objects.exists())
+
+        for task in Task.objects.filter(status=TaskStatus.COMPLETED):
+            self.assertIsNotNone(task.assignee_id)
+            self.assertNotEqual(task.assignee_id, task.creator_id)
+        self.assertFalse(Review.objects.exclude(task__status=TaskStatus.COMPLETED).exists())
+
+        # A second run adds users without clashing with the first one
+        call_command('generate_load_data', users=5, tasks=0, stdout=io.StringIO())
+        self.assertEqual(RegisteredUser.objects.filter(username__startswith='load_').count(), 35)
+
+    def test_percentile(self):
+        """Test nearest-rank percentiles"""
+        values = list(range(1, 101))
+        self.assertEqual(scenarios.percentile(values, 50), 50)
+        self.assertEqual(scenarios.percentile(values, 95), 95)
+        self.assertEqual(scenarios.percentile([7], 95), 7)
+
+    def test_scenarios_run(self):
+        """Test every scenario runs and write scenarios are rolled back"""
+        volunteers = list(Volunteer.objects.values_list('id', 'status'))
+        reviews = Review.objects.count()
+
+        output = self.run_benchmarks(save_baseline=True)
+
+        for name in scenarios.SCENARIOS:
+            self.assertIn(name, output)
+        self.assertEqual(list(Volunteer.objects.values_list('id', 'status')), volunteers)
+        self.assertEqual(Review.objects.count(), reviews)
+
+        with open(self.baseline_path) as f:
+            baseline = json.load(f)
+        self.assertEqual(set(baseline), set(scenarios.SCENARIOS))
+        self.assertGreater(baseline['task_list']['queries'], 0)
+
+    def test_compare_against_baseline(self):
+        """Test query count regressions fail the comparison"""
+        self.run_benchmarks('task_list', save_baseline=True)
+
+        with open(self.baseline_path) as f:
+            baseline = json.load(f)
+        baseline['task_list']['p95_ms'] = 10 ** 6
+        with open(self.baseline_path, 'w') as f:
+            json.dump(baseline, f)
+        self.assertIn('No regressions', self.run_benchmarks('task_list', compare=True))
+
+        baseline['task_list']['queries'] = 0
+        with open(self.baseline_path, 'w') as f:
+            json.dump(baseline, f)
+        with self.assertRaises(CommandError):
+            self.run_benchmarks('task_list', compare=True)
@@ -1,6 +1,7 @@
 from django.test import TestCase
 from django.utils import timezone
 import datetime
+from rest_framework.test import APIClient
 from core.models import RegisteredUser, Task, Bookmark, Tag, BookmarkTag
 
 
@@ -122,6 +123,16 @@ class BookmarkModelTests(TestCase):
         with self.assertRaises(Bookmark.DoesNotExist):
             Bookmark.objects.get(id=self.bookmark.id)
 
+    def test_remove_bookmark_twice_counts_once(self):
+        """Test removing an already removed bookmark leaves the task's count alone"""
+        before = Task.objects.get(id=self.task.id).bookmark_count
+        stale = Bookmark.objects.get(id=self.bookmark.id)
+
+        self.bookmark.remove_bookmark()
+        stale.remove_bookmark()
+
+        self.assertEqual(Task.objects.get(id=self.task.id).bookmark_count, before - 1)
+
     def test_bookmark_tags(self):
         """Test adding tags to bookmarks"""
         # Add tags to the bookmark
@@ -134,6 +145,46 @@ class BookmarkModelTests(TestCase):
         self.assertTrue(self.tag1 in tags)
         self.assertTrue(self.tag2 in tags)
 
+    def test_add_and_remove_tags_by_name(self):
+        """Test tags are added and removed by name with a constant number of queries"""
+        # Look up, create missing tags, re-read them, then link and recount in a savepoint
+        names = ['Urgent', 'weekend', 'garden', 'tools', 'groceries', 'urgent']
+        with self.assertNumQueries(7):
+            added = self.bookmark.add_tags(names)
+        self.assertEqual(set(added), {'urgent', 'weekend', 'garden', 'tools', 'groceries'})
+        self.assertEqual(self.bookmark.get_tags().count(), 5)
+        
+        # Adding existing tags again is a no-op
+        self.bookmark.add_tags(['weekend'])
+        self.assertEqual(self.bookmark.get_tags().count(), 5)
+        
+        # Resolve, then unlink and recount in a savepoint
+        with self.assertNumQueries(5):
+            removed = self.bookmark.remove_tags(['GARDEN', 'tools', 'groceries', 'nonexistent'])
+        self.assertEqual(removed, 3)
+        self.assertEqual(set(self.bookmark.get_tags().values_list('name', flat=True)), {'urgent', 'weekend'})
+        self.assertEqual(Tag.objects.get(name='garden').usage_count, 0)
+        self.assertEqual(Tag.objects.get(name='urgent').usage_count, 1)
+        
+        with self.assertNumQueries(1):
+            self.assertEqual(self.bookmark.remove_tags(['nonexistent']), 0)
+
+    def test_tag_names_are_stripped(self):
+        """Test padded names reuse the stripped tag and blank names are skipped"""
+        added = self.bookmark.add_tags([' urgent ', '  ', 'Urgent'])
+        self.assertEqual(set(added), {'urgent'})
+        self.assertFalse(Tag.objects.filter(name__startswith=' ').exists())
+
+        self.assertEqual(self.bookmark.remove_tags(['urgent']), 1)
+        self.assertFalse(self.bookmark.get_tags().exists())
+
+    def test_tags_prefetched_before_change(self):
+        """Test tags prefetched before a change are not served stale"""
+        bookmark = Bookmark.objects.prefetch_related('tags').get(id=self.bookmark.id)
+        self.assertEqual(list(bookmark.tags.all()), [])
+        bookmark.add_tags(['weekend'])
+        self.assertEqual([tag.name for tag in bookmark.tags.all()], ['weekend'])
+
 
 class BookmarkTagModelTests(TestCase):
     """Test cases for the BookmarkTag model"""
@@ -191,4 +242,33 @@ class BookmarkTagModelTests(TestCase):
             BookmarkTag.objects.create(
                 bookmark=self.bookmark,
                 tag=self.tag
-            )
\ No newline at end of file
+            )
+    def test_bookmark_tag_is_the_tags_relation(self):
+        """Test links made either way are the same rows, carrying the bookmark's user"""
+        self.assertEqual(list(self.bookmark.get_tags()), [self.tag])
+        self.assertEqual(self.bookmark_tag.user, self.user)
+        
+        self.bookmark.add_tags(['weekend'])
+        links = BookmarkTag.objects.filter(bookmark=self.bookmark)
+        self.assertEqual(set(links.values_list('tag__name', 'user_id')), {('urgent', self.user.id), ('weekend', self.user.id)})
+
+    def test_bookmarks_with_tag(self):
+        """Test a user's bookmarks with a tag are looked up by user and tag"""
+        other_task = Task.objects.create(
+            title='Other Task',
+            description='Description',
+            category='HOME_REPAIR',
+            location='Location',
+            deadline=timezone.now() + datetime.timedelta(days=1),
+            creator=self.user
+        )
+        other = Bookmark.objects.create(user=self.user, task=other_task)
+        other.add_tags(['weekend'])
+        
+        bookmarks = Bookmark.objects.filter(id__in=BookmarkTag.bookmark_ids(self.user, 'Urgent'))
+        self.assertEqual(list(bookmarks), [self.bookmark])
+        
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        response = client.get('/api/bookmarks/', {'tag': 'weekend'})
+        self.assertEqual([bookmark['id'] for bookmark in response.data['data']['bookmarks']], [other.id])
@@ -0,0 +1,164 @@
+from django.test import TestCase
+from django.utils import timezone
+import datetime
+from rest_framework.test import APIClient
+from core.models import RegisteredUser, Task, TaskCategory, Comment
+from core.models.comment import MAX_COMMENT_DEPTH
+
+
+class CommentThreadTests(TestCase):
+    """Test cases for threaded comments and their cursor pagination"""
+
+    def setUp(self):
+        """Set up a task with two threads"""
+        self.client = APIClient()
+        self.user = RegisteredUser.objects.create_user(
+            email='user@example.com',
+            name='Regular',
+            surname='User',
+            username='regularuser',
+            phone_number='1234567890',
+            password='password123'
+        )
+        self.task = Task.objects.create(
+            title='Task',
+            description='Description',
+            category=TaskCategory.OTHER,
+            location='Location',
+            deadline=timezone.now() + datetime.timedelta(days=2),
+            creator=self.user
+        )
+        self.first = self.comment('First')
+        self.reply = self.comment('Reply', parent=self.first)
+        self.nested = self.comment('Nested', parent=self.reply)
+        self.second_reply = self.comment('Second reply', parent=self.first)
+        self.second = self.comment('Second')
+        self.client.force_authenticate(user=self.user)
+
+    def comment(self, content, parent=None):
+        """Add a comment to the task"""
+        return Comment.add_comment(user=self.user, task=self.task, content=content, parent=parent)
+
+    def get(self, **params):
+        """GET the task's comments"""
+        response = self.client.get(f'/api/tasks/{self.task.id}/comments/', params)
+        return response, response.data.get('data')
+
+    def test_paths_and_reply_counts(self):
+        """Test paths nest and reply counts include every level below"""
+        self.assertEqual(self.nested.path, f'{self.first.id:010d}/{self.reply.id:010d}/{self.nested.id:010d}/')
+        self.assertEqual(self.nested.depth, 2)
+        self.assertEqual(self.nested.ancestor_ids(), [self.first.id, self.reply.id])
+        counts = dict(Comment.objects.values_list('content', 'reply_count'))
+        self.assertEqual(counts, {'First': 3, 'Reply': 1, 'Nested': 0, 'Second reply': 0, 'Second': 0})
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.comment_count, 5)
+
+    def test_subtree_in_one_query(self):
+        """Test a whole thread is fetched depth first with one query"""
+        with self.assertNumQueries(1):
+            replies = [comment.content for comment in self.first.get_subtree()]
+        self.assertEqual(replies, ['Reply', 'Nested', 'Second reply'])
+
+    def test_delete_removes_subtree(self):
+        """Test deleting a reply removes its replies and updates the counts above"""
+        self.reply.delete_comment()
+        self.assertEqual(set(Comment.objects.values_list('content', flat=True)), {'First', 'Second reply', 'Second'})
+        self.first.refresh_from_db()
+        self.assertEqual(self.first.reply_count, 1)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.comment_count, 3)
+
+    def test_delete_counts_replies_added_since_loading(self):
+        """Test replies added after the comment was loaded are subtracted too"""
+        loaded = Comment.objects.get(id=self.reply.id)
+        self.comment('Late reply', parent=self.nested)
+
+        loaded.delete_comment()
+        self.first.refresh_from_db()
+        self.assertEqual(self.first.reply_count, 1)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.comment_count, 3)
+
+    def test_recount_replies(self):
+        """Test drifted reply counts are repaired from the paths"""
+        Comment.objects.update(reply_count=7)
+        Comment.recount_replies()
+        counts = dict(Comment.objects.values_list('content', 'reply_count'))
+        self.assertEqual(counts, {'First': 3, 'Reply': 1, 'Nested': 0, 'Second reply': 0, 'Second': 0})
+
+    def test_reply_must_share_task(self):
+        """Test a reply to a comment of another task is rejected"""
+        other = Task.objects.create(
+            title='Other',
+            description='Description',
+            category=TaskCategory.OTHER,
+            location='Location',
+            deadline=timezone.now() + datetime.timedelta(days=2),
+            creator=self.user
+        )
+        with self.assertRaises(ValueError):
+            Comment.add_comment(user=self.user, task=other, content='Wrong', parent=self.first)
+
+        response = self.client.post(f'/api/tasks/{other.id}/comments/', {'content': 'Wrong', 'parent_id': self.first.id})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('parent_id', response.data)
+
+    def test_reply_through_api(self):
+        """Test replying through the task comments endpoint"""
+        response = self.client.post(
+            f'/api/tasks/{self.task.id}/comments/', {'content': 'Deep', 'parent_id': self.nested.id}, format='json'
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['data']['parent_id'], self.nested.id)
+        self.assertEqual(response.data['data']['depth'], 3)
+        self.first.refresh_from_db()
+        self.assertEqual(self.first.reply_count, 4)
+
+    def test_depth_limit(self):
+        """Test replies cannot nest deeper than the path column allows"""
+        parent = self.second
+        for _ in range(MAX_COMMENT_DEPTH - 1):
+            parent = self.comment('Deeper', parent=parent)
+        with self.assertRaises(ValueError):
+            self.comment('Too deep', parent=parent)
+
+    def test_first_screen_is_one_query(self):
+        """Test the top-level comments are listed with a single query"""
+        with self.assertNumQueries(1):
+            response, data = self.get(limit=1)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([c['content'] for c in data['comments']], ['First'])
+        self.assertEqual(data['comments'][0]['reply_count'], 3)
+        self.assertEqual(data['pagination']['next_cursor'], self.first.path)
+
+        _, data = self.get(limit=1, cursor=data['pagination']['next_cursor'])
+        self.assertEqual([c['content'] for c in data['comments']], ['Second'])
+        self.assertIsNone(data['pagination']['next_cursor'])
+
+    def test_thread_pages(self):
+        """Test the replies of a thread are paged with a cursor"""
+        _, data = self.get(thread=self.first.id, limit=2)
+        self.assertEqual([c['content'] for c in data['comments']], ['Reply', 'Nested'])
+        self.assertEqual([c['depth'] for c in data['comments']], [1, 2])
+
+        _, data = self.get(thread=self.first.id, limit=2, cursor=data['pagination']['next_cursor'])
+        self.assertEqual([c['content'] for c in data['comments']], ['Second reply'])
+        self.assertIsNone(data['pagination']['next_cursor'])
+
+    def test_normalized_thread(self):
+        """Test threads can be listed with side-loaded users and tasks"""
+        _, data = self.get(normalize='true')
+        self.assertEqual(data['comments'][0]['user_id'], self.user.id)
+        self.assertEqual(list(data['included']['tasks']), [self.task.id])
+
+    def test_invalid_parameters(self):
+        """Test invalid limits, cursors, threads and tasks"""
+        for params in ({'limit': '0'}, {'limit': 'many'}, {'cursor': 'abc'}, {'thread': 'x'}):
+            response, _ = self.get(**params)
+            self.assertEqual(response.status_code, 400)
+
+        response = self.client.get(f'/api/tasks/{self.task.id}/comments/', {'thread': 999999})
+        self.assertEqual(response.status_code, 404)
+        response = self.client.get('/api/tasks/999999/comments/')
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,119 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+import datetime
+from types import SimpleNamespace
+from rest_framework.test import APIClient
+from core.api.serializers.photo_serializers import PhotoCreateSerializer
+from core.models import RegisteredUser, Task, TaskCategory, TaskStatus, Comment, Bookmark, Volunteer, Review
+
+
+class CreateSerializerQueryTests(TestCase):
+    """Test cases for write endpoints loading referenced objects once"""
+
+    def setUp(self):
+        """Set up a task and a second user"""
+        self.client = APIClient()
+        self.creator = self.create_user('creator')
+        self.user = self.create_user('user')
+        self.task = Task.objects.create(
+            title='Task',
+            description='Description',
+            category=TaskCategory.OTHER,
+            location='Location',
+            deadline=timezone.now() + datetime.timedelta(days=2),
+            creator=self.creator
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def create_user(self, name):
+        """Create a user"""
+        return RegisteredUser.objects.create_user(
+            email=f'{name}@example.com',
+            name=name.title(),
+            surname='User',
+            username=name,
+            phone_number='1234567890',
+            password='password123'
+        )
+
+    def selects_from(self, queries, table):
+        """Number of queries loading rows of a table (aggregates are not counted)"""
+        return sum(1 for query in queries if query['sql'].startswith(f'SELECT "{table}"."id"'))
+
+    def post(self, url, data):
+        """POST JSON and capture the queries it makes"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(url, data, format='json')
+        return response, queries.captured_queries
+
+    def test_comment_create(self):
+        """Test creating a comment loads its task once"""
+        response, queries = self.post('/api/comments/', {'task_id': self.task.id, 'content': 'Hello'})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['data']['task']['creator']['id'], self.creator.id)
+        self.assertEqual(Comment.objects.count(), 1)
+        self.assertEqual(self.selects_from(queries, 'core_task'), 1)
+        self.assertEqual(self.selects_from(queries, 'core_registereduser'), 0)
+
+    def test_bookmark_create(self):
+        """Test creating a bookmark loads its task once"""
+        response, queries = self.post('/api/bookmarks/', {'task_id': self.task.id})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Bookmark.objects.filter(user=self.user, task=self.task).count(), 1)
+        self.assertEqual(self.selects_from(queries, 'core_task'), 1)
+
+    def test_bookmark_tag_queries_are_constant(self):
+        """Test bookmarking with tags and updating them costs the same for 1 or 6 tags"""
+        counts = []
+        for extra, names in (('extra1', ['one']), ('extra2', [f'tag{i}' for i in range(6)])):
+            Bookmark.objects.filter(user=self.user).delete()
+            response, queries = self.post('/api/bookmarks/', {'task_id': self.task.id, 'tag_names': names})
+            self.assertEqual(response.status_code, 201)
+            self.assertEqual(sorted(response.data['data']['tags']), sorted(names))
+            bookmark_id = response.data['data']['id']
+            create_count = len(queries)
+
+            _, queries = self.post(f'/api/bookmarks/{bookmark_id}/update-tags/', {
+                'add_tags': [name.upper() for name in names] + [extra], 'remove_tags': names
+            })
+            counts.append((create_count, len(queries)))
+            self.assertEqual(list(Bookmark.objects.get(id=bookmark_id).tags.values_list('name', flat=True)), [extra])
+        self.assertEqual(counts[0], counts[1])
+
+    def test_volunteer_create(self):
+        """Test volunteering loads the task once"""
+        response, queries = self.post('/api/volunteers/', {'task_id': self.task.id})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Volunteer.objects.filter(user=self.user, task=self.task).count(), 1)
+        self.assertEqual(self.selects_from(queries, 'core_task'), 1)
+
+    def test_missing_task(self):
+        """Test a missing task is still a validation error"""
+        response, _ = self.post('/api/comments/', {'task_id': 999999, 'content': 'Hello'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('task_id', response.data)
+
+    def test_task_review(self):
+        """Test the task review view hands its task and reviewee to the serializer"""
+        self.task.assignee = self.user
+        self.task.status = TaskStatus.COMPLETED
+        self.task.save()
+
+        response, queries = self.post(f'/api/tasks/{self.task.id}/reviews/', {'score': 5, 'comment': 'Great'})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Review.objects.get().reviewee, self.creator)
+        self.assertEqual(self.selects_from(queries, 'core_task'), 1)
+
+    def test_task_from_context(self):
+        """Test a task passed in the context is used without querying"""
+        request = SimpleNamespace(user=self.creator)
+        serializer = PhotoCreateSerializer(context={'request': request, 'task': self.task})
+        with self.assertNumQueries(0):
+            self.assertIs(serializer.validate_task_id(self.task.id), self.task)
+
+        serializer = PhotoCreateSerializer(context={'request': SimpleNamespace(user=self.user)})
+        with self.assertNumQueries(1):
+            with self.assertRaisesMessage(Exception, 'You can only add photos to your own tasks.'):
+                serializer.validate_task_id(self.task.id)
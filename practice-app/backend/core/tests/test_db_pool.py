@@ -0,0 +1,168 @@
+from django.test import SimpleTestCase
+import threading
+import time
+from core.db import pool as pools
+from core.db.pool import ConnectionPool, PoolTimeout, get_pool, is_current_pool
+
+
+class FakeConnection:
+    """Connection stand-in recording whether it was closed"""
+
+    def __init__(self, number):
+        self.number = number
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class ConnectionPoolTests(SimpleTestCase):
+    """Test cases for the per-process connection pool"""
+
+    def setUp(self):
+        """Set up a connection factory"""
+        self.opened = []
+
+    def connect(self):
+        """Open a numbered fake connection"""
+        connection = FakeConnection(len(self.opened))
+        self.opened.append(connection)
+        return connection
+
+    def test_reuses_released_connections(self):
+        """Test a released connection is handed out again instead of opening one"""
+        pool = ConnectionPool(max_size=2)
+
+        first = pool.acquire(self.connect)
+        pool.release(first)
+        second = pool.acquire(self.connect)
+
+        self.assertIs(second, first)
+        self.assertEqual(len(self.opened), 1)
+        self.assertEqual(pool.size, 1)
+
+    def test_times_out_when_exhausted(self):
+        """Test acquiring beyond max_size waits for the timeout, then fails"""
+        pool = ConnectionPool(max_size=1, timeout=0.05)
+        pool.acquire(self.connect)
+
+        with self.assertRaises(PoolTimeout):
+            pool.acquire(self.connect)
+        self.assertEqual(len(self.opened), 1)
+
+    def test_waiting_thread_gets_released_connection(self):
+        """Test a thread waiting on a full pool gets the next released connection"""
+        pool = ConnectionPool(max_size=1, timeout=5)
+        first = pool.acquire(self.connect)
+        received = []
+
+        waiter = threading.Thread(target=lambda: received.append(pool.acquire(self.connect)))
+        waiter.start()
+        time.sleep(0.05)
+        pool.release(first)
+        waiter.join(timeout=5)
+
+        self.assertEqual(received, [first])
+        self.assertEqual(len(self.opened), 1)
+
+    def test_discard_frees_slot(self):
+        """Test a discarded connection is closed and its slot reused"""
+        pool = ConnectionPool(max_size=1, timeout=0.05)
+        first = pool.acquire(self.connect)
+
+        pool.release(first, discard=True)
+        second = pool.acquire(self.connect)
+
+        self.assertTrue(first.closed)
+        self.assertIsNot(second, first)
+        self.assertEqual(pool.size, 1)
+
+    def test_failed_connect_frees_slot(self):
+        """Test a connection error does not leak a pool slot"""
+        pool = ConnectionPool(max_size=1, timeout=0.05)
+
+        def fail():
+            raise ConnectionError('database down')
+
+        with self.assertRaises(ConnectionError):
+            pool.acquire(fail)
+        self.assertEqual(pool.size, 0)
+        self.assertIsNotNone(pool.acquire(self.connect))
+
+    def test_unusable_idle_connection_is_replaced(self):
+        """Test the health check replaces a dead idle connection"""
+        pool = ConnectionPool(max_size=1, is_usable=lambda connection: connection.number != 0)
+        first = pool.acquire(self.connect)
+        pool.release(first)
+
+        second = pool.acquire(self.connect)
+
+        self.assertTrue(first.closed)
+        self.assertEqual(second.number, 1)
+        self.assertEqual(pool.size, 1)
+
+    def test_idle_connections_expire_above_min_size(self):
+        """Test connections idle longer than max_idle are closed down to min_size"""
+        pool = ConnectionPool(min_size=1, max_size=3, max_idle=0)
+        connections = [pool.acquire(self.connect) for _ in range(3)]
+
+        for connection in connections:
+            time.sleep(0.001)
+            pool.release(connection)
+
+        self.assertEqual(pool.idle, 1)
+        self.assertEqual(pool.size, 1)
+        self.assertEqual(sum(connection.closed for connection in connections), 2)
+
+    def test_invalid_sizes(self):
+        """Test inconsistent pool sizes are rejected"""
+        with self.assertRaises(ValueError):
+            ConnectionPool(min_size=5, max_size=2)
+        with self.assertRaises(ValueError):
+            ConnectionPool(max_size=0)
+
+
+class PoolRegistryTests(SimpleTestCase):
+    """Test cases for the per-process pools of each database"""
+
+    def setUp(self):
+        """Set up pooled database settings"""
+        pools._pools.clear()
+        self.settings_dict = {
+            'NAME': 'neighborhood_assistance',
+            'HOST': 'db',
+            'PORT': '5432',
+            'USER': 'postgres',
+            'POOL': {'MAX_SIZE': 2},
+        }
+
+    def tearDown(self):
+        """Forget the pools created by the test"""
+        pools._pools.clear()
+
+    def test_unpooled_database(self):
+        """Test databases without POOL settings have no pool"""
+        self.assertIsNone(get_pool('default', {'NAME': 'neighborhood_assistance'}))
+
+    def test_pool_is_shared(self):
+        """Test every connection of an alias gets the same pool"""
+        pool = get_pool('default', self.settings_dict)
+        self.assertIs(get_pool('default', dict(self.settings_dict)), pool)
+        self.assertEqual(pool.max_size, 2)
+        self.assertIsNot(get_pool('replica_1', self.settings_dict), pool)
+
+    def test_changed_settings_replace_pool(self):
+        """Test switching to another database drains the old pool instead of reusing it"""
+        pool = get_pool('default', self.settings_dict)
+        idle = pool.acquire(lambda: FakeConnection(0))
+        pool.release(idle)
+
+        # Like the test runner switching to the test database
+        self.settings_dict['NAME'] = 'test_neighborhood_assistance'
+        test_pool = get_pool('default', self.settings_dict)
+
+        self.assertIsNot(test_pool, pool)
+        self.assertTrue(idle.closed)
+        self.assertFalse(is_current_pool('default', pool))
+        self.assertTrue(is_current_pool('default', test_pool))
+        self.assertEqual(pool.size, 0)
@@ -0,0 +1,155 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase
+from django.utils import timezone
+import csv
+import datetime
+import io
+import json
+from rest_framework.test import APIClient
+from core.api.views.export_views import ExportView
+from core.models import (
+    RegisteredUser, Administrator, Task, TaskStatus, Review, Notification,
+    NotificationType
+)
+
+
+class ExportViewTests(TestCase):
+    """Test cases for the streaming export endpoints"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.user = RegisteredUser.objects.create_user(
+            email='user@example.com',
+            name='Regular',
+            surname='User',
+            username='regularuser',
+            phone_number='1234567890',
+            password='password123'
+        )
+        self.other_user = RegisteredUser.objects.create_user(
+            email='other@example.com',
+            name='Other',
+            surname='User',
+            username='otheruser',
+            phone_number='0987654321',
+            password='password456'
+        )
+        Administrator.objects.create(user=self.user)
+
+        self.task1 = Task.objects.create(
+            title='Grocery Task',
+            description='Buy groceries',
+            category='GROCERY_SHOPPING',
+            location='Test Location',
+            deadline=timezone.now() + datetime.timedelta(days=3),
+            creator=self.user
+        )
+        self.task2 = Task.objects.create(
+            title='Tutoring Task',
+            description='Math tutoring',
+            category='TUTORING',
+            location='Another Location',
+            deadline=timezone.now() + datetime.timedelta(days=5),
+            status=TaskStatus.COMPLETED,
+            assignee=self.other_user,
+            creator=self.user
+        )
+
+        Review.objects.create(
+            reviewer=self.user,
+            reviewee=self.other_user,
+            task=self.task2,
+            score=4.0,
+            comment='Great help'
+        )
+
+        for i in range(3):
+            Notification.send_notification(
+                user=self.user,
+                content=f'Notification {i}',
+                notification_type=NotificationType.SYSTEM_NOTIFICATION
+            )
+        Notification.send_notification(
+            user=self.other_user,
+            content='Not yours',
+            notification_type=NotificationType.SYSTEM_NOTIFICATION
+        )
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def read_ndjson(self, response):
+        """Decode an NDJSON streaming response"""
+        content = b''.join(response.streaming_content).decode()
+        return [json.loads(line) for line in content.splitlines()]
+
+    def test_export_tasks_ndjson(self):
+        """Test exporting tasks as NDJSON"""
+        response = self.client.get('/api/export/tasks/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        rows = self.read_ndjson(response)
+        self.assertEqual([row['id'] for row in rows], [self.task1.id, self.task2.id])
+        self.assertEqual(rows[1]['assignee_id'], self.other_user.id)
+
+    def test_export_tasks_uses_list_filters(self):
+        """Test task export applies the task list filters"""
+        response = self.client.get('/api/export/tasks/', {'category': 'TUTORING'})
+
+        rows = self.read_ndjson(response)
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['title'], 'Tutoring Task')
+
+    def test_export_tasks_csv(self):
+        """Test exporting tasks as CSV"""
+        response = self.client.get('/api/export/tasks/', {'file_format': 'csv'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('tasks.csv', response['Content-Disposition'])
+        content = b''.join(response.streaming_content).decode()
+        rows = list(csv.DictReader(io.StringIO(content)))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0]['title'], 'Grocery Task')
+
+    def test_export_tasks_requires_admin(self):
+        """Test only administrators can export tasks"""
+        client = APIClient()
+        client.force_authenticate(user=self.other_user)
+        response = client.get('/api/export/tasks/')
+        self.assertEqual(response.status_code, 403)
+
+    def test_export_invalid_format(self):
+        """Test unsupported export formats are rejected"""
+        response = self.client.get('/api/export/tasks/', {'file_format': 'xml'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_export_user_reviews(self):
+        """Test exporting reviews received by a user"""
+        response = self.client.get(f'/api/export/users/{self.other_user.id}/reviews/')
+
+        rows = self.read_ndjson(response)
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['score'], 4.0)
+        self.assertEqual(rows[0]['reviewer_id'], self.user.id)
+
+    def test_export_notifications(self):
+        """Test exporting only the requesting user's notifications"""
+        response = self.client.get('/api/export/notifications/')
+
+        rows = self.read_ndjson(response)
+        self.assertEqual(len(rows), 3)
+        self.assertNotIn('Not yours', [row['content'] for row in rows])
+
+    def test_incomplete_export_view_is_refused(self):
+        """Test an export view without fields or rows can't be routed"""
+        class NoRowsExportView(ExportView):
+            fields = ['id']
+
+        class NoFieldsExportView(ExportView):
+            def get_export_queryset(self, request, **kwargs):
+                return Task.objects.all()
+
+        for view in (ExportView, NoRowsExportView, NoFieldsExportView):
+            with self.assertRaises(ImproperlyConfigured):
+                view.as_view()
@@ -137,6 +137,10 @@ class FeedClassTests(TestCase):
         self.assertIn(self.task2, filtered)
         self.assertIn(self.task3, filtered)
         
+        # Filter by any of the tags, excluding others
+        filtered = self.feed.filter_feed({'any_tags': ['weekend', 'nonexistent'], 'exclude_tags': ['weekend']})
+        self.assertEqual(filtered.count(), 0)
+        
         # Filter by urgency
         filtered = self.feed.filter_feed({'urgency': 4})
         self.assertEqual(filtered.count(), 1)
@@ -1,4 +1,4 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.utils import timezone
 import datetime
 from core.models import (
@@ -7,6 +7,8 @@ from core.models import (
 )
 
 
+# Notifications are checked right after the actions that send them
+@override_settings(NOTIFICATION_DISPATCH_MODE='sync')
 class TaskWorkflowIntegrationTests(TestCase):
     """Integration tests for complete task workflows"""
 
@@ -0,0 +1,126 @@
+from django.test import TestCase, override_settings
+from django.utils import timezone
+import datetime
+from core.models import (
+    RegisteredUser, Task, TaskStatus, Volunteer, VolunteerCandidate,
+    Notification, NotificationType
+)
+from core.models.matching import area_key
+
+
+# Notifications are checked right after the actions that send them
+@override_settings(NOTIFICATION_DISPATCH_MODE='sync')
+class VolunteerCandidateModelTests(TestCase):
+    """Test cases for the volunteer matching engine"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.creator = RegisteredUser.objects.create_user(
+            email='creator@example.com',
+            name='Task',
+            surname='Creator',
+            username='creator',
+            phone_number='1234567890',
+            password='password123'
+        )
+        self.creator.location = 'Main St, Kadikoy'
+        self.creator.save()
+
+        self.users = []
+        for i, (location, rating) in enumerate([
+            ('1 Side St, Kadikoy', 4.5),
+            ('2 Other St, Besiktas', 5.0),
+            ('3 Third St, kadikoy ', 2.0),
+        ]):
+            user = RegisteredUser.objects.create_user(
+                email=f'volunteer{i}@example.com',
+                name='Volunteer',
+                surname=str(i),
+                username=f'volunteer{i}',
+                phone_number='0987654321',
+                password='password456'
+            )
+            user.location = location
+            user.rating = rating
+            user.save()
+            self.users.append(user)
+
+    def create_task(self, category='TUTORING', location='Library, Kadikoy', **kwargs):
+        """Create a task for the creator"""
+        return Task.objects.create(
+            title='Task',
+            description='Task Description',
+            category=category,
+            location=location,
+            deadline=timezone.now() + datetime.timedelta(days=3),
+            creator=self.creator,
+            **kwargs
+        )
+
+    def test_area_key(self):
+        """Test locations are normalized to their last part"""
+        self.assertEqual(area_key('12 Main St, Kadikoy '), 'kadikoy')
+        self.assertEqual(area_key('Kadikoy'), 'kadikoy')
+        self.assertEqual(area_key(''), '')
+
+    def test_volunteering_updates_index(self):
+        """Test volunteering adds category history to the candidate index"""
+        Volunteer.volunteer_for_task(self.users[0], self.create_task())
+        Volunteer.volunteer_for_task(self.users[0], self.create_task())
+
+        entry = VolunteerCandidate.objects.get(user=self.users[0], category='TUTORING')
+        self.assertEqual(entry.history_count, 2)
+        self.assertEqual(entry.area, 'kadikoy')
+        self.assertEqual(entry.rating, 4.5)
+
+    def test_match_prefers_area_then_score(self):
+        """Test candidates in the task's area are ranked first"""
+        for user in self.users:
+            Volunteer.volunteer_for_task(user, self.create_task())
+        # A completed task adds to the history of the third user
+        self.create_task(status=TaskStatus.COMPLETED, assignee=self.users[2])
+        VolunteerCandidate.rebuild()
+
+        matches = VolunteerCandidate.match(self.create_task(), limit=3)
+        self.assertEqual(
+            [entry.user_id for entry in matches],
+            [self.users[2].id, self.users[0].id, self.users[1].id]
+        )
+
+        # Other categories have no candidates
+        self.assertEqual(VolunteerCandidate.match(self.create_task(category='HOME_REPAIR')), [])
+
+    def test_match_penalizes_load(self):
+        """Test volunteers with active assignments rank lower"""
+        Volunteer.volunteer_for_task(self.users[0], self.create_task())
+        Volunteer.volunteer_for_task(self.users[2], self.create_task())
+        self.create_task(category='OTHER', status=TaskStatus.ASSIGNED, assignee=self.users[0])
+        self.create_task(category='OTHER', status=TaskStatus.IN_PROGRESS, assignee=self.users[0])
+        VolunteerCandidate.rebuild()
+
+        matches = VolunteerCandidate.match(self.create_task(), limit=1)
+        self.assertEqual(matches[0].user_id, self.users[2].id)
+
+    def test_match_excludes_creator_and_inactive(self):
+        """Test the task creator and banned users are never matched"""
+        Volunteer.volunteer_for_task(self.users[0], self.create_task())
+        self.users[0].is_active = False
+        self.users[0].save()
+
+        self.assertEqual(VolunteerCandidate.match(self.create_task()), [])
+
+    def test_send_task_created_notification(self):
+        """Test top matches are notified with a single insert"""
+        for user in self.users:
+            Volunteer.volunteer_for_task(user, self.create_task())
+        task = self.create_task()
+
+        # One candidate lookup in the task's area and one insert
+        with self.assertNumQueries(2):
+            notifications = Notification.send_task_created_notification(task, limit=2)
+
+        self.assertEqual(len(notifications), 2)
+        self.assertEqual(
+            Notification.objects.filter(type=NotificationType.TASK_CREATED, related_task=task).count(),
+            2
+        )
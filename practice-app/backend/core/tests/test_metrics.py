@@ -0,0 +1,129 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+import datetime
+from rest_framework.test import APIClient
+from core import metrics
+from core.metrics import Registry, cache_get_or_set
+from core.models import RegisteredUser, Task, TaskStatus
+
+
+class MetricsTests(TestCase):
+    """Test cases for the in-process metrics and the /metrics endpoint"""
+
+    def setUp(self):
+        """Set up test data"""
+        metrics.REGISTRY.clear()
+        cache.clear()
+        self.client = APIClient()
+        self.user = RegisteredUser.objects.create_user(
+            email='user@example.com',
+            name='Test',
+            surname='User',
+            username='testuser',
+            phone_number='1234567890',
+            password='password123'
+        )
+
+    def test_render_text_format(self):
+        """Test counters and histograms are rendered in the Prometheus text format"""
+        registry = Registry()
+        counter = registry.counter('jobs_total', 'Jobs run.', ['kind'])
+        histogram = registry.histogram('job_seconds', 'Job duration.', ['kind'], buckets=(0.1, 1))
+
+        counter.inc(kind='a')
+        counter.inc(2, kind='a')
+        histogram.observe(0.05, kind='a')
+        histogram.observe(0.5, kind='a')
+        histogram.observe(3, kind='a')
+
+        output = registry.render()
+        self.assertIn('# TYPE jobs_total counter', output)
+        self.assertIn('jobs_total{kind="a"} 3', output)
+        self.assertIn('job_seconds_bucket{kind="a",le="0.1"} 1', output)
+        self.assertIn('job_seconds_bucket{kind="a",le="1"} 2', output)
+        self.assertIn('job_seconds_bucket{kind="a",le="+Inf"} 3', output)
+        self.assertIn('job_seconds_count{kind="a"} 3', output)
+        self.assertIn('job_seconds_sum{kind="a"} 3.55', output)
+
+    def test_labels_are_validated(self):
+        """Test samples must use the metric's label names"""
+        with self.assertRaises(ValueError):
+            metrics.http_requests.inc(view='x')
+
+    def test_metric_must_define_samples(self):
+        """Test a metric type without samples() can't be created"""
+        class Gauge(metrics.Metric):
+            type = 'gauge'
+
+        with self.assertRaises(TypeError):
+            Gauge('queue_size', 'Queued jobs.')
+
+    def test_request_metrics(self):
+        """Test requests are counted and timed by route name"""
+        self.client.force_authenticate(user=self.user)
+        self.client.get('/api/tasks/')
+        self.client.get('/api/tasks/')
+
+        self.assertEqual(metrics.http_requests.get(view='task-list', method='GET', status='200'), 2)
+        self.assertEqual(metrics.http_request_duration.get_count(view='task-list', method='GET'), 2)
+        self.assertGreater(metrics.db_queries.get(view='task-list'), 0)
+
+        with override_settings(METRICS_TOKEN='secret'):
+            response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer secret')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        self.assertIn(
+            'http_requests_total{view="task-list",method="GET",status="200"} 2',
+            response.content.decode()
+        )
+
+    @override_settings(METRICS_TOKEN='secret')
+    def test_metrics_token(self):
+        """Test a configured token is required to scrape metrics"""
+        self.assertEqual(self.client.get('/metrics').status_code, 401)
+
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer secret')
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(METRICS_TOKEN='')
+    def test_metrics_without_token(self):
+        """Test metrics are refused without a token unless DEBUG is on"""
+        with override_settings(DEBUG=False):
+            self.assertEqual(self.client.get('/metrics').status_code, 403)
+        with override_settings(DEBUG=True):
+            self.assertEqual(self.client.get('/metrics').status_code, 200)
+
+    def test_cache_hit_ratio(self):
+        """Test cache lookups are counted as hits and misses"""
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return 'value'
+
+        for _ in range(3):
+            self.assertEqual(cache_get_or_set('test', 'metrics-key', compute), 'value')
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(metrics.cache_requests.get(cache='test', result='miss'), 1)
+        self.assertEqual(metrics.cache_requests.get(cache='test', result='hit'), 2)
+
+    def test_maintenance_rows(self):
+        """Test rows written by task expiry are counted"""
+        tasks = [
+            Task.objects.create(
+                title=f'Task {i}',
+                description='Description',
+                category='GENERAL',
+                location='Location',
+                deadline=timezone.now() - datetime.timedelta(days=1),
+                creator=self.user
+            )
+            for i in range(3)
+        ]
+
+        for task in tasks:
+            self.assertTrue(task.check_expiry())
+        self.assertEqual(Task.objects.filter(status=TaskStatus.EXPIRED).count(), 3)
+        self.assertEqual(metrics.maintenance_rows.get(operation='task_expiry'), 3)
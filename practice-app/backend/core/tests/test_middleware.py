@@ -0,0 +1,134 @@
+from asgiref.sync import async_to_sync, iscoroutinefunction, sync_to_async
+from django.db import connection, connections
+from django.http import HttpResponse
+from django.test import TestCase, RequestFactory, override_settings
+from core.api.views import async_views
+from core.middleware import QueryCountMiddleware, MetricsMiddleware, ReplicaRoutingMiddleware, QueryStats
+from core.models import RegisteredUser
+
+
+class QueryCountMiddlewareTests(TestCase):
+    """Test cases for the per-request query instrumentation"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.factory = RequestFactory()
+        for i in range(6):
+            RegisteredUser.objects.create_user(
+                email=f'user{i}@example.com',
+                name='User',
+                surname=str(i),
+                username=f'user{i}',
+                phone_number='1234567890',
+                password='password123'
+            )
+
+    def run_view(self, view):
+        """Run a view through the middleware"""
+        request = self.factory.get('/api/test/')
+        response = QueryCountMiddleware(view)(request)
+        return request, response
+
+    def test_query_stats(self):
+        """Test statements are counted, grouped and ranked"""
+        stats = QueryStats(slowest_count=2)
+
+        def execute(sql, params, many, context):
+            return None
+
+        for sql in ['SELECT 1', 'SELECT 2', 'SELECT 1', 'SELECT 3']:
+            stats(execute, sql, (), False, {})
+
+        self.assertEqual(stats.count, 4)
+        self.assertEqual(stats.duplicates(), [('SELECT 1', 2)])
+        self.assertEqual(len(stats.slowest()), 2)
+
+    @override_settings(DEBUG=True)
+    def test_counts_request_queries(self):
+        """Test queries issued by the view are counted and exposed as headers"""
+        def view(request):
+            list(RegisteredUser.objects.all())
+            RegisteredUser.objects.count()
+            return HttpResponse('ok')
+
+        request, response = self.run_view(view)
+
+        self.assertEqual(request.query_stats.count, 2)
+        self.assertEqual(response['X-Query-Count'], '2')
+        self.assertEqual(response['X-Query-Duplicates'], '0')
+        self.assertIn('X-Query-Time-Ms', response)
+
+    @override_settings(DEBUG=False)
+    def test_no_headers_without_debug(self):
+        """Test headers are only added in debug mode"""
+        _, response = self.run_view(lambda request: HttpResponse('ok'))
+
+        self.assertNotIn('X-Query-Count', response)
+
+    @override_settings(QUERY_DUPLICATE_THRESHOLD=5)
+    def test_n_plus_one_is_flagged(self):
+        """Test a statement repeated per row is logged as a warning"""
+        def view(request):
+            for user_id in RegisteredUser.objects.values_list('id', flat=True):
+                RegisteredUser.objects.get(id=user_id)
+            return HttpResponse('ok')
+
+        with self.assertLogs('core.queries', level='WARNING') as logs:
+            request, _ = self.run_view(view)
+
+        self.assertEqual(request.query_stats.count, 7)
+        record = logs.records[0]
+        self.assertEqual(record.query_stats['duplicate_queries'][0]['count'], 6)
+        self.assertEqual(record.query_stats['endpoint'], '/api/test/')
+
+    @override_settings(QUERY_COUNT_WARNING_THRESHOLD=1, QUERY_DUPLICATE_THRESHOLD=100)
+    def test_query_count_threshold(self):
+        """Test requests over the query count threshold are logged as warnings"""
+        def view(request):
+            RegisteredUser.objects.count()
+            RegisteredUser.objects.exists()
+            return HttpResponse('ok')
+
+        with self.assertLogs('core.queries', level='WARNING') as logs:
+            self.run_view(view)
+
+        self.assertEqual(logs.records[0].query_stats['query_count'], 2)
+
+    @override_settings(QUERY_INSTRUMENTATION_ENABLED=False)
+    def test_disabled(self):
+        """Test instrumentation can be switched off"""
+        request, _ = self.run_view(lambda request: HttpResponse('ok'))
+
+        self.assertFalse(hasattr(request, 'query_stats'))
+
+    def test_async_chain_stays_async(self):
+        """Test the middlewares don't adapt an async view to a worker thread"""
+        async def view(request):
+            return HttpResponse('ok')
+
+        chain = MetricsMiddleware(QueryCountMiddleware(ReplicaRoutingMiddleware(view)))
+        self.assertTrue(iscoroutinefunction(chain))
+
+        request = self.factory.get('/api/test/')
+        response = async_to_sync(chain)(request)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(request.query_stats.count, 0)
+
+    @override_settings(ASYNC_PARALLEL_QUERIES=True)
+    def test_counts_parallel_piece_queries(self):
+        """Test queries run by async view pieces on their own connections are counted"""
+        def piece():
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+            return connections['default']
+
+        async def view(request):
+            await sync_to_async(RegisteredUser.objects.count)()
+            request.piece_connections = await async_views.gather(piece, piece)
+            return HttpResponse('ok')
+
+        request = self.factory.get('/api/test/')
+        async_to_sync(QueryCountMiddleware(view))(request)
+
+        self.assertNotIn(connections['default'], request.piece_connections)
+        self.assertEqual(request.query_stats.count, 3)
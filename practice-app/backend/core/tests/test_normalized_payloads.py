@@ -0,0 +1,121 @@
+from django.test import TestCase, override_settings
+from django.utils import timezone
+import datetime
+from rest_framework.test import APIClient
+from core.api.serializers.task_serializers import build_included
+from core.models import RegisteredUser, Task, TaskCategory, Comment, Notification, NotificationType
+
+
+# Worker threads use their own connections, which don't see the test's transaction
+@override_settings(ASYNC_PARALLEL_QUERIES=False)
+class NormalizedPayloadTests(TestCase):
+    """Test cases for list payloads referring to tasks and users by id"""
+
+    def setUp(self):
+        """Set up two users and a task with comments and notifications"""
+        self.client = APIClient()
+        self.user = self.create_user('user')
+        self.creator = self.create_user('creator')
+        self.task = Task.objects.create(
+            title='Task',
+            description='Description',
+            category=TaskCategory.OTHER,
+            location='Location',
+            deadline=timezone.now() + datetime.timedelta(days=2),
+            creator=self.creator,
+            assignee=self.user
+        )
+        for i in range(5):
+            Comment.objects.create(user=self.user, task=self.task, content=f'Comment {i}')
+            Notification.objects.create(
+                user=self.user, type=NotificationType.TASK_ASSIGNED, content=f'Notification {i}',
+                related_task=self.task
+            )
+        Notification.objects.create(
+            user=self.user, type=NotificationType.SYSTEM_NOTIFICATION, content='No task'
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def create_user(self, name):
+        """Create a user"""
+        return RegisteredUser.objects.create_user(
+            email=f'{name}@example.com',
+            name=name.title(),
+            surname='User',
+            username=name,
+            phone_number='1234567890',
+            password='password123'
+        )
+
+    def assert_included(self, included):
+        """Assert the task and both its users are side-loaded exactly once"""
+        self.assertEqual(list(included['tasks']), [self.task.id])
+        task = included['tasks'][self.task.id]
+        self.assertEqual(task['creator_id'], self.creator.id)
+        self.assertEqual(task['assignee_id'], self.user.id)
+        self.assertNotIn('creator', task)
+        self.assertEqual(set(included['users']), {self.user.id, self.creator.id})
+        self.assertEqual(included['users'][self.creator.id]['username'], 'creator')
+
+    def test_build_included(self):
+        """Test referenced tasks and users are fetched with one query each"""
+        with self.assertNumQueries(2):
+            included = build_included(task_ids=[self.task.id, self.task.id, None], user_ids=[None])
+        self.assert_included(included)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(build_included(), {'tasks': {}, 'users': {}})
+
+    def test_notification_list(self):
+        """Test normalized notifications carry ids and an included map"""
+        response = self.client.get('/api/notifications/', {'normalize': 'true'})
+        self.assertEqual(response.status_code, 200)
+        data = response.data['data']
+        self.assertEqual(len(data['notifications']), 6)
+        notification = data['notifications'][1]
+        self.assertEqual(notification['related_task_id'], self.task.id)
+        self.assertEqual(notification['user_id'], self.user.id)
+        self.assertNotIn('related_task', notification)
+        self.assertIsNone(data['notifications'][0]['related_task_id'])
+        self.assertEqual(data['unread_count'], 6)
+        self.assert_included(data['included'])
+
+    def test_default_payload_unchanged(self):
+        """Test payloads embed full objects unless normalization is asked for"""
+        response = self.client.get('/api/notifications/')
+        data = response.data['data']
+        self.assertNotIn('included', data)
+        self.assertEqual(data['notifications'][1]['related_task']['creator']['id'], self.creator.id)
+
+    def test_normalized_payload_is_smaller(self):
+        """Test the normalized notification page is smaller than the embedded one"""
+        embedded = self.client.get('/api/notifications/').content
+        normalized = self.client.get('/api/notifications/', {'normalize': 'true'}).content
+        self.assertLess(len(normalized), len(embedded) / 2)
+
+    def test_comment_list(self):
+        """Test normalized comments carry ids and an included map"""
+        response = self.client.get('/api/comments/', {'normalize': 'true'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 5)
+        comment = response.data['results'][0]
+        self.assertEqual(comment['task_id'], self.task.id)
+        self.assertEqual(comment['user_id'], self.user.id)
+        self.assertNotIn('task', comment)
+        self.assert_included(response.data['included'])
+
+    def test_async_task_page(self):
+        """Test the async task page normalizes its comments"""
+        response = self.client.get(f'/api/async/tasks/{self.task.id}/', {'normalize': 'true'})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()['data']
+        self.assertEqual([c['task_id'] for c in data['comments']], [self.task.id] * 5)
+        self.assertEqual(list(data['included']['tasks']), [str(self.task.id)])
+        self.assertEqual(len(data['included']['users']), 2)
+
+    def test_async_notifications(self):
+        """Test the async notification page normalizes its notifications"""
+        response = self.client.get('/api/async/notifications/', {'normalize': 'true'})
+        data = response.json()['data']
+        self.assertEqual(data['notifications'][1]['related_task_id'], self.task.id)
+        self.assertEqual(list(data['included']['tasks']), [str(self.task.id)])
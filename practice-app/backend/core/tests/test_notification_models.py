@@ -1,9 +1,14 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.utils import timezone
 import datetime
-from core.models import RegisteredUser, Task, Volunteer, Notification, NotificationType
+from core.models import (
+    RegisteredUser, Task, Volunteer, Notification, NotificationType, ArchivedNotification
+)
+from core.models.notification import UNION_FIELDS
 
 
+# Notifications are checked right after the actions that send them
+@override_settings(NOTIFICATION_DISPATCH_MODE='sync')
 class NotificationModelTests(TestCase):
     """Test cases for the Notification model"""
 
@@ -181,6 +186,165 @@ class NotificationModelTests(TestCase):
         
         self.assertIsNotNone(assignee_notification)
         self.assertIn("completed", assignee_notification.content.lower())
+    
+    def create_volunteers(self, count):
+        """Create volunteers for the test task"""
+        volunteers = []
+        for i in range(count):
+            user = RegisteredUser.objects.create_user(
+                email=f'volunteer{i}@example.com',
+                name='Volunteer',
+                surname=str(i),
+                username=f'volunteer{i}',
+                phone_number='5555555555',
+                password='password789'
+            )
+            volunteers.append(Volunteer.objects.create(user=user, task=self.task, status='PENDING'))
+        return volunteers
+    
+    def test_volunteer_applied_notifications_coalesce(self):
+        """Test volunteer applications within the window merge into one notification"""
+        volunteers = self.create_volunteers(3)
+        
+        for volunteer in volunteers:
+            notification = Notification.send_volunteer_applied_notification(volunteer)
+        
+        notifications = Notification.objects.filter(
+            user=self.user1,
+            type=NotificationType.VOLUNTEER_APPLIED
+        )
+        self.assertEqual(notifications.count(), 1)
+        self.assertEqual(notification.count, 3)
+        self.assertEqual(
+            notification.content,
+            f"volunteer2 and 2 others have volunteered for your task: {self.task.title}"
+        )
+    
+    def test_coalescing_skips_read_and_old_notifications(self):
+        """Test read notifications and notifications outside the window are not merged"""
+        first, second, third = self.create_volunteers(3)
+        
+        notification = Notification.send_volunteer_applied_notification(first)
+        notification.mark_as_read()
+        
+        unread = Notification.send_volunteer_applied_notification(second)
+        self.assertNotEqual(unread.id, notification.id)
+        
+        Notification.objects.filter(id=unread.id).update(
+            timestamp=timezone.now() - datetime.timedelta(hours=2)
+        )
+        latest = Notification.send_volunteer_applied_notification(third)
+        self.assertNotEqual(latest.id, unread.id)
+        self.assertEqual(latest.count, 1)
+        self.assertEqual(Notification.objects.filter(type=NotificationType.VOLUNTEER_APPLIED).count(), 3)
+    
+    def test_digest_users_use_digest_window(self):
+        """Test users opted into digests merge notifications over the digest window"""
+        self.user1.notification_digest = True
+        self.user1.save()
+        first, second = self.create_volunteers(2)
+        
+        notification = Notification.send_volunteer_applied_notification(first)
+        Notification.objects.filter(id=notification.id).update(
+            timestamp=timezone.now() - datetime.timedelta(hours=2)
+        )
+        merged = Notification.send_volunteer_applied_notification(second)
+        
+        self.assertEqual(merged.id, notification.id)
+        self.assertEqual(merged.count, 2)
+    
+    def test_get_digest(self):
+        """Test unread notifications are summarized per task and type"""
+        for volunteer in self.create_volunteers(2):
+            Notification.send_volunteer_applied_notification(volunteer)
+        Notification.send_notification(
+            user=self.user1,
+            content='Read notification',
+            notification_type=NotificationType.SYSTEM_NOTIFICATION
+        ).mark_as_read()
+        
+        digest = Notification.get_digest(self.user1)
+        totals = {(entry['type'], entry['related_task_id']): entry['total'] for entry in digest}
+        
+        self.assertEqual(totals, {
+            (NotificationType.VOLUNTEER_APPLIED, self.task.id): 2,
+            (NotificationType.TASK_CREATED, self.task.id): 1,
+        })
+        self.assertEqual(digest[0]['related_task_title'], self.task.title)
+        
+        self.assertEqual(Notification.get_digest(self.user1, since=timezone.now()), [])
+    
+    def create_aged_notification(self, days, is_read=True):
+        """Create a notification for user1 with a timestamp in the past"""
+        notification = Notification.send_notification(
+            user=self.user1,
+            content=f'{days} days old',
+            notification_type=NotificationType.SYSTEM_NOTIFICATION
+        )
+        Notification.objects.filter(id=notification.id).update(
+            is_read=is_read,
+            timestamp=timezone.now() - datetime.timedelta(days=days)
+        )
+        return notification
+    
+    def test_archive_read(self):
+        """Test only read notifications past the retention period are archived"""
+        old_read = [self.create_aged_notification(days) for days in (100, 120, 150)]
+        old_unread = self.create_aged_notification(200, is_read=False)
+        recent_read = self.create_aged_notification(10)
+        
+        archived = Notification.archive_read(datetime.timedelta(days=90), batch_size=2)
+        
+        self.assertEqual(archived, 3)
+        self.assertEqual(
+            set(ArchivedNotification.objects.values_list('id', flat=True)),
+            {notification.id for notification in old_read}
+        )
+        self.assertTrue(Notification.objects.filter(id=old_unread.id).exists())
+        self.assertTrue(Notification.objects.filter(id=recent_read.id).exists())
+        self.assertFalse(Notification.objects.filter(id__in=[n.id for n in old_read]).exists())
+        
+        archived_notification = ArchivedNotification.objects.get(id=old_read[0].id)
+        self.assertEqual(archived_notification.content, '100 days old')
+        self.assertEqual(archived_notification.user, self.user1)
+        
+        # Nothing left to archive
+        self.assertEqual(Notification.archive_read(datetime.timedelta(days=90)), 0)
+    
+    def test_with_archive(self):
+        """Test hot and archived notifications are listed together"""
+        old = self.create_aged_notification(100)
+        self.create_aged_notification(5)
+        Notification.archive_read(datetime.timedelta(days=90))
+        
+        notifications = list(Notification.with_archive(self.user1).order_by('-timestamp', '-id'))
+        
+        self.assertEqual(len(notifications), 3)
+        self.assertEqual(notifications[0].id, self.notification.id)
+        self.assertEqual(notifications[-1].id, old.id)
+        self.assertEqual(notifications[-1].content, '100 days old')
+        self.assertTrue(all(isinstance(n, Notification) for n in notifications))
+        
+        # Other users' notifications are excluded
+        self.assertEqual(Notification.with_archive(self.user2).count(), 0)
+
+    def test_union_columns_match(self):
+        """Test both sides of the archive union select the same columns in the same order"""
+        def columns(model):
+            names = [field.name for field in model._meta.concrete_fields]
+            return [name for name in names if name in UNION_FIELDS]
+        
+        self.assertEqual(columns(Notification), list(UNION_FIELDS))
+        self.assertEqual(columns(ArchivedNotification), list(UNION_FIELDS))
+    
+    def test_purge_archive(self):
+        """Test archived notifications past the archive retention are deleted"""
+        self.create_aged_notification(400)
+        kept = self.create_aged_notification(100)
+        Notification.archive_read(datetime.timedelta(days=90))
+        
+        self.assertEqual(ArchivedNotification.purge(datetime.timedelta(days=365), batch_size=1), 1)
+        self.assertEqual(list(ArchivedNotification.objects.values_list('id', flat=True)), [kept.id])
 
 
 class NotificationTypeEnumTests(TestCase):
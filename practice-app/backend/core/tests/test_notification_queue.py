@@ -0,0 +1,179 @@
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from unittest import mock
+import datetime
+import queue
+from core import notification_queue
+from core.models import (
+    RegisteredUser, Task, Notification, NotificationType,
+    NotificationOutbox, OutboxStatus
+)
+
+
+class NotificationQueueTests(TestCase):
+    """Test cases for notification dispatch and the outbox"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.user = RegisteredUser.objects.create_user(
+            email='user@example.com',
+            name='Test',
+            surname='User',
+            username='testuser',
+            phone_number='1234567890',
+            password='password123'
+        )
+        self.assignee = RegisteredUser.objects.create_user(
+            email='assignee@example.com',
+            name='Task',
+            surname='Assignee',
+            username='assignee',
+            phone_number='0987654321',
+            password='password456'
+        )
+        self.task = Task.objects.create(
+            title='Test Task',
+            description='Test Description',
+            category='GENERAL',
+            location='Test Location',
+            deadline=timezone.now() + datetime.timedelta(days=3),
+            creator=self.user,
+            assignee=self.assignee
+        )
+
+    def tearDown(self):
+        """Reset the in-process queue"""
+        notification_queue._queue = None
+
+    def rows(self, count):
+        """Build notification rows for the test user"""
+        return [
+            {
+                'user_id': self.user.id,
+                'content': f'Notification {i}',
+                'type': NotificationType.SYSTEM_NOTIFICATION,
+                'related_task_id': None,
+            }
+            for i in range(count)
+        ]
+
+    @override_settings(NOTIFICATION_DISPATCH_MODE='sync')
+    def test_sync_dispatch(self):
+        """Test notifications are created immediately in sync mode"""
+        notification = Notification.enqueue_notification(
+            user=self.user,
+            content='Hello',
+            notification_type=NotificationType.SYSTEM_NOTIFICATION,
+            related_task=self.task
+        )[0]
+
+        self.assertEqual(notification.user, self.user)
+        self.assertEqual(notification.related_task, self.task)
+        self.assertEqual(Notification.objects.count(), 1)
+
+    @override_settings(NOTIFICATION_DISPATCH_MODE='sync')
+    def test_task_completed_notifications_single_insert(self):
+        """Test both completion notifications are created with one query"""
+        with self.assertNumQueries(1):
+            notifications = Notification.send_task_completed_notification(self.task)
+
+        self.assertEqual(
+            {n.user_id for n in notifications},
+            {self.user.id, self.assignee.id}
+        )
+
+    @override_settings(NOTIFICATION_DISPATCH_MODE='outbox')
+    def test_outbox_dispatch_and_drain(self):
+        """Test outbox entries are written on commit and drained in a batch"""
+        with self.captureOnCommitCallbacks(execute=True):
+            result = Notification.send_task_completed_notification(self.task)
+
+        self.assertEqual(result, [])
+        self.assertEqual(Notification.objects.count(), 0)
+        self.assertEqual(NotificationOutbox.objects.count(), 2)
+
+        delivered = []
+        self.assertEqual(NotificationOutbox.drain(deliver=delivered.extend), 2)
+        self.assertEqual(len(delivered), 2)
+        self.assertEqual(Notification.objects.filter(related_task=self.task).count(), 2)
+        self.assertFalse(NotificationOutbox.objects.exists())
+
+    @override_settings(NOTIFICATION_DISPATCH_MODE='outbox')
+    def test_outbox_skipped_without_commit(self):
+        """Test nothing is written when the transaction doesn't commit"""
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            Notification.enqueue_notifications(self.rows(3))
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertFalse(NotificationOutbox.objects.exists())
+
+    def test_drain_failure_backoff(self):
+        """Test failed batches are retried later and eventually marked failed"""
+        notification_queue.write_outbox(self.rows(2))
+
+        def failing_push(notifications):
+            raise RuntimeError('push service unavailable')
+
+        self.assertEqual(NotificationOutbox.drain(max_attempts=2, deliver=failing_push), 0)
+        self.assertFalse(Notification.objects.exists())
+        for entry in NotificationOutbox.objects.all():
+            self.assertEqual(entry.attempts, 1)
+            self.assertEqual(entry.status, OutboxStatus.PENDING)
+            self.assertGreater(entry.available_at, timezone.now())
+            self.assertIn('push service unavailable', entry.last_error)
+
+        # Backed off entries are not picked up yet
+        self.assertEqual(NotificationOutbox.drain(max_attempts=2), 0)
+
+        NotificationOutbox.objects.update(available_at=timezone.now())
+        NotificationOutbox.drain(max_attempts=2, deliver=failing_push)
+        self.assertEqual(
+            NotificationOutbox.objects.filter(status=OutboxStatus.FAILED).count(), 2
+        )
+
+        # Failed entries are not retried
+        self.assertEqual(NotificationOutbox.drain(), 0)
+
+    @override_settings(NOTIFICATION_DISPATCH_MODE='memory')
+    def test_memory_queue_backpressure(self):
+        """Test rows beyond the queue size spill to the outbox"""
+        notification_queue._queue = queue.Queue(maxsize=2)
+
+        with mock.patch.object(notification_queue, '_ensure_worker'):
+            with self.captureOnCommitCallbacks(execute=True):
+                Notification.enqueue_notifications(self.rows(5))
+
+        self.assertEqual(notification_queue._queue.qsize(), 2)
+        self.assertEqual(NotificationOutbox.objects.count(), 3)
+
+        notification_queue.drain_queue()
+        self.assertEqual(Notification.objects.count(), 2)
+        self.assertTrue(notification_queue._queue.empty())
+
+    @override_settings(NOTIFICATION_MAX_ATTEMPTS=2)
+    def test_flush_failure_falls_back_to_outbox(self):
+        """Test batches that keep failing to flush are written to the outbox"""
+        with mock.patch.object(notification_queue, 'deliver_now', side_effect=RuntimeError), \
+                mock.patch.object(notification_queue.time, 'sleep') as sleep:
+            self.assertFalse(notification_queue.flush(self.rows(3)))
+
+        self.assertEqual(sleep.call_count, 1)
+        self.assertEqual(NotificationOutbox.objects.count(), 3)
+        self.assertFalse(Notification.objects.exists())
+
+    def test_spill_queue_at_exit(self):
+        """Test rows still queued when the process exits are written to the outbox"""
+        with mock.patch.object(notification_queue, '_queue', None), \
+                mock.patch.object(notification_queue, '_worker', None), \
+                mock.patch.object(notification_queue.threading, 'Thread'), \
+                mock.patch.object(notification_queue.atexit, 'register') as register:
+            notification_queue._ensure_worker()
+            register.assert_called_once_with(notification_queue.spill_queue)
+
+            for row in self.rows(3):
+                notification_queue._queue.put_nowait(row)
+            notification_queue.spill_queue()
+
+            self.assertTrue(notification_queue._queue.empty())
+        self.assertEqual(NotificationOutbox.objects.count(), 3)
+        self.assertFalse(Notification.objects.exists())
@@ -0,0 +1,125 @@
+from django.contrib.auth.models import AnonymousUser
+from django.test import TestCase
+from django.utils import timezone
+import datetime
+from types import SimpleNamespace
+from core.models import (
+    RegisteredUser, Administrator, Task, TaskCategory, Notification, NotificationType, Review, Photo
+)
+from core.permissions import IsOwner, IsTaskCreator, IsTaskParticipant, IsAdministrator, get_roles
+
+
+class PermissionTests(TestCase):
+    """Test cases for object permissions and per-request roles"""
+
+    def setUp(self):
+        """Set up users and a task"""
+        self.creator = self.create_user('creator')
+        self.assignee = self.create_user('assignee')
+        self.other = self.create_user('other')
+        task = Task.objects.create(
+            title='Task',
+            description='Description',
+            category=TaskCategory.OTHER,
+            location='Location',
+            deadline=timezone.now() + datetime.timedelta(days=2),
+            creator=self.creator,
+            assignee=self.assignee
+        )
+        # Load the task without its users, like a view's queryset may
+        self.task = Task.objects.get(id=task.id)
+
+    def create_user(self, name):
+        """Create a user"""
+        return RegisteredUser.objects.create_user(
+            email=f'{name}@example.com',
+            name=name.title(),
+            surname='User',
+            username=name,
+            phone_number='1234567890',
+            password='password123'
+        )
+
+    def allowed(self, permission, user, obj):
+        """Evaluate an object permission for a user"""
+        return permission.has_object_permission(SimpleNamespace(user=user), None, obj)
+
+    def test_is_owner_uses_foreign_key_ids(self):
+        """Test ownership is checked without loading the owner"""
+        notification = Notification.objects.create(
+            user=self.creator, type=NotificationType.SYSTEM_NOTIFICATION, content='Hello'
+        )
+        notification = Notification.objects.get(id=notification.id)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(self.allowed(IsOwner(), self.creator, notification))
+            self.assertFalse(self.allowed(IsOwner(), self.other, notification))
+            self.assertTrue(self.allowed(IsOwner(), self.creator, self.task))
+            self.assertTrue(self.allowed(IsOwner(), self.other, self.other))
+            self.assertFalse(self.allowed(IsOwner(), AnonymousUser(), notification))
+
+    def test_review_owner_is_reviewer(self):
+        """Test a review is owned by its reviewer"""
+        review = Review.objects.create(
+            reviewer=self.creator, reviewee=self.assignee, task=self.task, score=5, comment='Great'
+        )
+        review = Review.objects.get(id=review.id)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(self.allowed(IsOwner(), self.creator, review))
+            self.assertFalse(self.allowed(IsOwner(), self.assignee, review))
+
+    def test_task_roles(self):
+        """Test task creator and participant checks without loading users"""
+        with self.assertNumQueries(0):
+            self.assertTrue(self.allowed(IsTaskCreator(), self.creator, self.task))
+            self.assertFalse(self.allowed(IsTaskCreator(), self.assignee, self.task))
+            self.assertTrue(self.allowed(IsTaskParticipant(), self.assignee, self.task))
+            self.assertFalse(self.allowed(IsTaskParticipant(), self.other, self.task))
+            self.assertFalse(self.allowed(IsTaskParticipant(), AnonymousUser(), self.task))
+
+    def test_task_creator_of_photo(self):
+        """Test a photo is managed by the creator of its task"""
+        photo = Photo.objects.create(task=self.task, url='task_photos/photo.jpg')
+        photo = Photo.objects.select_related('task').get(id=photo.id)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(self.allowed(IsTaskCreator(), self.creator, photo))
+            self.assertFalse(self.allowed(IsTaskCreator(), self.other, photo))
+
+    def test_administrator_role_is_queried_once_per_request(self):
+        """Test role membership is queried once and kept on the request's user"""
+        Administrator.objects.create(user=self.creator)
+        permission = IsAdministrator()
+
+        # Each request authenticates a new user instance
+        user = RegisteredUser.objects.get(id=self.creator.id)
+        with self.assertNumQueries(1):
+            self.assertTrue(permission.has_permission(SimpleNamespace(user=user), None))
+            self.assertTrue(permission.has_object_permission(SimpleNamespace(user=user), None, self.task))
+
+        with self.assertNumQueries(0):
+            self.assertTrue(permission.has_permission(SimpleNamespace(user=user), None))
+            self.assertFalse(permission.has_permission(SimpleNamespace(user=AnonymousUser()), None))
+
+    def test_revoked_role_takes_effect_on_next_request(self):
+        """Test a revoked administrator is refused on the next request"""
+        admin = Administrator.objects.create(user=self.creator)
+        permission = IsAdministrator()
+        user = RegisteredUser.objects.get(id=self.creator.id)
+        self.assertTrue(permission.has_permission(SimpleNamespace(user=user), None))
+
+        # Revoked elsewhere, e.g. by another worker process
+        Administrator.objects.filter(id=admin.id).delete()
+        user = RegisteredUser.objects.get(id=self.creator.id)
+        self.assertFalse(permission.has_permission(SimpleNamespace(user=user), None))
+
+    def test_role_changes_update_loaded_user(self):
+        """Test granting and revoking a role updates the loaded user's roles"""
+        self.assertEqual(get_roles(self.other), frozenset())
+
+        admin = Administrator.objects.create(user=self.other)
+        self.assertEqual(get_roles(self.other), {'administrator'})
+
+        admin.delete()
+        self.assertEqual(get_roles(RegisteredUser.objects.get(id=self.other.id)), frozenset())
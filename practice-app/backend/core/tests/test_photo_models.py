@@ -135,6 +135,16 @@ class PhotoModelTests(TestCase):
         # Verify task has no photos now
         self.assertEqual(self.task.photos.count(), 0)
 
+    def test_delete_photo_twice_counts_once(self):
+        """Test deleting an already deleted photo leaves the task's count alone"""
+        before = Task.objects.get(id=self.task.id).photo_count
+        stale = Photo.objects.get(id=self.photo.id)
+
+        self.photo.delete_photo()
+        stale.delete_photo()
+
+        self.assertEqual(Task.objects.get(id=self.task.id).photo_count, before - 1)
+
     def test_multiple_photos_per_task(self):
         """Test adding multiple photos to a task"""
         # Create several more photos
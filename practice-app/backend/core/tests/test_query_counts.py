@@ -0,0 +1,206 @@
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from collections import Counter
+import datetime
+import json
+import os
+from rest_framework.test import APIClient
+from core.api import urls as api_urls
+from core.models import (
+    RegisteredUser, Administrator, Task, TaskCategory, TaskStatus, Volunteer, Review, Notification,
+    NotificationType, Bookmark, Tag, Comment, Photo, RecurrenceRule
+)
+
+
+BUDGETS_PATH = os.path.join(os.path.dirname(__file__), 'query_budgets.json')
+
+# Result sizes the query counts are compared at
+SMALL_SIZE = 2
+LARGE_SIZE = 7
+
+def get_routes():
+    """Get the names of all API routes that answer GET requests"""
+    names = set()
+    for pattern in api_urls.router.urls + api_urls.urlpatterns:
+        callback = getattr(pattern, 'callback', None)
+        if callback is None or not pattern.name:
+            continue
+        actions = getattr(callback, 'actions', None)
+        view_class = getattr(callback, 'cls', getattr(callback, 'view_class', None))
+        if actions is not None:
+            if 'get' in actions:
+                names.add(pattern.name)
+        elif view_class is None or hasattr(view_class, 'get'):
+            # Function views are assumed to answer GET
+            names.add(pattern.name)
+    return names
+
+
+def describe_queries(queries):
+    """Format captured queries, repeated statements first"""
+    counts = Counter(query['sql'] for query in queries)
+    lines = [f'{count}x {sql}' for sql, count in counts.most_common()]
+    return '\n'.join(lines)
+
+
+# Count the queries behind cached endpoints rather than cache hits, on the
+# test's connection (parallel pieces would use connections of their own)
+@override_settings(TAG_SUGGESTION_CACHE_SECONDS=0, ASYNC_PARALLEL_QUERIES=False)
+class QueryCountRegressionTests(TestCase):
+    """Query counts of every GET endpoint must not grow with the result size"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the users and objects every endpoint needs"""
+        cls.user = cls.create_user('owner')
+        Administrator.objects.create(user=cls.user)
+        cls.user.reset_token = 'budget-token'
+        cls.user.reset_token_expiry = timezone.now() + datetime.timedelta(hours=1)
+        cls.user.save()
+
+        cls.task = cls.create_task(cls.user)
+        RecurrenceRule.objects.create(task=cls.task)
+        cls.tag = Tag.objects.create(name='budget')
+        cls.size = 0
+
+    @classmethod
+    def create_user(cls, name):
+        """Create a user"""
+        return RegisteredUser.objects.create_user(
+            email=f'{name}@example.com',
+            name=name.title(),
+            surname='User',
+            username=name,
+            phone_number='1234567890',
+            password='password123'
+        )
+
+    @classmethod
+    def create_task(cls, creator, **kwargs):
+        """Create a task"""
+        return Task.objects.create(
+            title='Budget Task',
+            description='Description',
+            category=TaskCategory.OTHER,
+            location='Location',
+            deadline=timezone.now() + datetime.timedelta(days=3),
+            creator=creator,
+            **kwargs
+        )
+
+    def setUp(self):
+        """Authenticate as the owner"""
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def grow(self, size):
+        """Add rows to every listed collection until each holds size rows"""
+        for i in range(self.size, size):
+            other = self.create_user(f'member{i}')
+            task = self.create_task(self.user, assignee=other, status=TaskStatus.ASSIGNED)
+            self.create_task(other)
+            Volunteer.objects.create(user=other, task=self.task)
+            Review.objects.create(
+                reviewer=other, reviewee=self.user, task=self.task,
+                score=4, comment='Review'
+            )
+            Notification.objects.create(
+                user=self.user, related_task=task,
+                type=NotificationType.TASK_ASSIGNED, content='Notification'
+            )
+            bookmark = Bookmark.objects.create(user=self.user, task=task)
+            bookmark.add_tag(self.tag)
+            comment = Comment.add_comment(user=other, task=self.task, content='Comment')
+            Comment.add_comment(user=self.user, task=self.task, content='Reply', parent=comment)
+            Photo.objects.create(task=self.task, url=f'task_photos/{i}.jpg')
+            Tag.objects.create(name=f'budget{i}')
+            other.report_user(self.user, 'Spam')
+            self.user.report_user(other, 'Spam')
+            self.task.report_task(other, 'Spam')
+            comment.report_comment(self.user, 'Spam')
+        self.size = size
+
+    def endpoints(self):
+        """Map route names to the URL requested for them"""
+        return {
+            'api-root': '/api/',
+            'registereduser-list': '/api/users/',
+            'registereduser-detail': f'/api/users/{self.user.id}/',
+            'task-list': '/api/tasks/',
+            'task-detail': f'/api/tasks/{self.task.id}/',
+            'task-recurrence': f'/api/tasks/{self.task.id}/recurrence/',
+            'volunteer-list': '/api/volunteers/',
+            'volunteer-detail': f'/api/volunteers/{Volunteer.objects.first().id}/',
+            'review-list': '/api/reviews/',
+            'review-detail': f'/api/reviews/{Review.objects.first().id}/',
+            'bookmark-list': '/api/bookmarks/',
+            'bookmark-detail': f'/api/bookmarks/{Bookmark.objects.first().id}/',
+            'notification-list': '/api/notifications/',
+            'notification-detail': f'/api/notifications/{Notification.objects.first().id}/',
+            'notification-digest': '/api/notifications/digest/',
+            'comment-list': '/api/comments/',
+            'comment-detail': f'/api/comments/{Comment.objects.first().id}/',
+            'task-comments': f'/api/tasks/{self.task.id}/comments/',
+            'verify-token': '/api/auth/verify-token/budget-token/',
+            'check-availability': '/api/auth/check-availability/?email=new@example.com',
+            'task-volunteers': f'/api/tasks/{self.task.id}/volunteers/',
+            'task-reviews': f'/api/tasks/{self.task.id}/reviews/',
+            'task-photo': f'/api/tasks/{self.task.id}/photo/',
+            'user-tasks': f'/api/users/{self.user.id}/tasks/',
+            'user-reviews': f'/api/users/{self.user.id}/reviews/',
+            'export-tasks': '/api/export/tasks/',
+            'export-notifications': '/api/export/notifications/',
+            'export-user-reviews': f'/api/export/users/{self.user.id}/reviews/',
+            'async-feed': '/api/async/feed/',
+            'async-notifications': '/api/async/notifications/',
+            'async-task-page': f'/api/async/tasks/{self.task.id}/',
+            'tag-suggestions': '/api/tags/suggest/?q=budget',
+            'reported-users': '/api/admin/reported-users/',
+            'report-queue': '/api/admin/reports/?type=comment',
+            'admin-user-detail': f'/api/admin/users/{self.user.id}/',
+        }
+
+    def measure(self, url):
+        """Request a URL, returning the response and the captured queries"""
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+            if response.streaming:
+                b''.join(response.streaming_content)
+        return response, context.captured_queries
+
+    def test_every_route_is_measured(self):
+        """Test every GET route has an endpoint and a query budget"""
+        with open(BUDGETS_PATH) as f:
+            budgets = json.load(f)
+
+        routes = get_routes()
+        self.grow(1)
+        self.assertEqual(routes - set(self.endpoints()), set(), 'Routes without an endpoint in this test')
+        self.assertEqual(routes - set(budgets), set(), f'Routes without a budget in {BUDGETS_PATH}')
+
+    def test_query_counts_do_not_grow(self):
+        """Test query counts are within budget and independent of the result size"""
+        with open(BUDGETS_PATH) as f:
+            budgets = json.load(f)
+
+        results = {}
+        for size in (SMALL_SIZE, LARGE_SIZE):
+            self.grow(size)
+            for name, url in self.endpoints().items():
+                response, queries = self.measure(url)
+                self.assertLess(response.status_code, 400, f'{name} returned {response.status_code}')
+                results.setdefault(name, []).append(queries)
+
+        for name, (small, large) in results.items():
+            with self.subTest(route=name):
+                self.assertEqual(
+                    len(large), len(small),
+                    f'{name}: {len(small)} queries for {SMALL_SIZE} rows but {len(large)} for '
+                    f'{LARGE_SIZE} rows:\n{describe_queries(large)}'
+                )
+                self.assertLessEqual(
+                    len(large), budgets[name],
+                    f'{name}: {len(large)} queries, budget is {budgets[name]}:\n{describe_queries(large)}'
+                )
@@ -0,0 +1,190 @@
+from django.test import TestCase
+from django.utils import timezone
+import datetime
+from rest_framework.test import APIClient
+from core.models import (
+    RegisteredUser, Task, Tag, RecurrenceRule, RecurrenceFrequency
+)
+from core.models.recurrence import add_months
+
+
+class RecurrenceRuleModelTests(TestCase):
+    """Test cases for the RecurrenceRule model and scheduler"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.user = RegisteredUser.objects.create_user(
+            email='creator@example.com',
+            name='Creator',
+            surname='User',
+            username='creatoruser',
+            phone_number='1234567890',
+            password='password123'
+        )
+
+        self.task = Task.objects.create(
+            title='Weekly Groceries',
+            description='Buy groceries every week',
+            category='GROCERY_SHOPPING',
+            location='Test Location',
+            deadline=timezone.now() + datetime.timedelta(days=1),
+            creator=self.user
+        )
+        Tag.create_tag('weekly').add_to_task(self.task)
+
+    def test_set_recurrence(self):
+        """Test making a task recurring"""
+        rule = self.task.set_recurrence(RecurrenceFrequency.WEEKLY)
+
+        self.task.refresh_from_db()
+        self.assertTrue(self.task.is_recurring)
+        self.assertTrue(rule.is_active)
+        self.assertEqual(rule.next_occurrence_at, self.task.deadline + datetime.timedelta(weeks=1))
+
+    def test_occurrence_deadlines(self):
+        """Test deadlines for each frequency"""
+        base = self.task.deadline
+        rule = RecurrenceRule(task=self.task, frequency=RecurrenceFrequency.DAILY, interval=2)
+        self.assertEqual(rule.occurrence_deadline(3), base + datetime.timedelta(days=6))
+
+        rule.frequency = RecurrenceFrequency.MONTHLY
+        rule.interval = 1
+        self.assertEqual(rule.occurrence_deadline(2), add_months(base, 2))
+
+    def test_add_months_clamps_day(self):
+        """Test monthly recurrence keeps the last day of short months"""
+        jan_31 = datetime.datetime(2025, 1, 31, 12, 0, tzinfo=datetime.timezone.utc)
+        self.assertEqual(add_months(jan_31, 1).day, 28)
+        self.assertEqual(add_months(jan_31, 2).day, 31)
+        self.assertEqual(add_months(jan_31, 12).year, 2026)
+
+    def test_materialize_due(self):
+        """Test occurrences within the horizon are created with the template's tags"""
+        self.task.set_recurrence(RecurrenceFrequency.WEEKLY)
+
+        created = RecurrenceRule.materialize_due(horizon=datetime.timedelta(days=22))
+
+        self.assertEqual(created, 3)
+        occurrences = Task.objects.filter(parent_task=self.task).order_by('deadline')
+        self.assertEqual(occurrences.count(), 3)
+        self.assertEqual(occurrences[0].deadline, self.task.deadline + datetime.timedelta(weeks=1))
+        self.assertEqual(occurrences[0].title, 'Weekly Groceries')
+        self.assertEqual([tag.name for tag in occurrences[2].tags.all()], ['weekly'])
+
+        rule = RecurrenceRule.objects.get(task=self.task)
+        self.assertEqual(rule.generated_count, 3)
+        self.assertEqual(rule.next_occurrence_at, self.task.deadline + datetime.timedelta(weeks=4))
+
+    def test_materialize_is_idempotent(self):
+        """Test rerunning the scheduler does not duplicate occurrences"""
+        self.task.set_recurrence(RecurrenceFrequency.DAILY)
+        RecurrenceRule.materialize_due(horizon=datetime.timedelta(days=5))
+
+        # Simulate a crash after inserting but before the rule was updated
+        RecurrenceRule.objects.filter(task=self.task).update(
+            generated_count=0, next_occurrence_at=self.task.deadline + datetime.timedelta(days=1)
+        )
+        RecurrenceRule.materialize_due(horizon=datetime.timedelta(days=5))
+
+        self.assertEqual(Task.objects.filter(parent_task=self.task).count(), 4)
+
+    def test_end_conditions(self):
+        """Test max_occurrences and end_date stop the series"""
+        self.task.set_recurrence(RecurrenceFrequency.DAILY, max_occurrences=2)
+        RecurrenceRule.materialize_due(horizon=datetime.timedelta(days=30))
+
+        rule = RecurrenceRule.objects.get(task=self.task)
+        self.assertEqual(Task.objects.filter(parent_task=self.task).count(), 2)
+        self.assertFalse(rule.is_active)
+        self.assertIsNone(rule.next_occurrence_at)
+
+        other = Task.objects.create(
+            title='Tutoring',
+            description='Math',
+            location='Library',
+            deadline=timezone.now() + datetime.timedelta(days=1),
+            creator=self.user
+        )
+        other.set_recurrence(RecurrenceFrequency.WEEKLY, end_date=other.deadline + datetime.timedelta(days=15))
+        RecurrenceRule.materialize_due(horizon=datetime.timedelta(days=60))
+        self.assertEqual(Task.objects.filter(parent_task=other).count(), 2)
+
+    def test_stop_recurrence(self):
+        """Test switching recurrence off stops materialization"""
+        self.task.set_recurrence(RecurrenceFrequency.DAILY)
+        self.task.set_recurring(False)
+
+        self.assertEqual(RecurrenceRule.materialize_due(horizon=datetime.timedelta(days=10)), 0)
+        self.assertFalse(RecurrenceRule.objects.get(task=self.task).is_active)
+
+    def test_closing_first_occurrence_keeps_series(self):
+        """Test completing or cancelling the template only closes the first occurrence"""
+        self.task.set_recurrence(RecurrenceFrequency.WEEKLY)
+        self.assertEqual(RecurrenceRule.materialize_due(horizon=datetime.timedelta(days=8)), 1)
+
+        self.task.confirm_completion()
+        self.assertTrue(RecurrenceRule.objects.get(task=self.task).is_active)
+        self.assertEqual(RecurrenceRule.materialize_due(horizon=datetime.timedelta(days=60)), 7)
+
+        other = Task.objects.create(
+            title='Dog Walking',
+            description='Walk the dog',
+            location='Park',
+            deadline=timezone.now() + datetime.timedelta(days=1),
+            creator=self.user
+        )
+        other.set_recurrence(RecurrenceFrequency.DAILY)
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+
+        response = client.delete(f'/api/tasks/{other.id}/')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(RecurrenceRule.objects.get(task=other).is_active)
+        self.assertGreater(RecurrenceRule.materialize_due(horizon=datetime.timedelta(days=3)), 0)
+        self.assertTrue(Task.objects.filter(parent_task=other).exists())
+
+    def test_tags_copied_only_to_new_occurrences(self):
+        """Test older occurrences sharing a deadline with another series keep their tags"""
+        other = Task.objects.create(
+            title='Tutoring',
+            description='Math',
+            location='Library',
+            deadline=self.task.deadline,
+            creator=self.user
+        )
+        Tag.create_tag('tutoring').add_to_task(other)
+        self.task.set_recurrence(RecurrenceFrequency.DAILY)
+        RecurrenceRule.materialize_due(horizon=datetime.timedelta(days=3))
+
+        # The first series' occurrence had its tag removed after it was created
+        old = Task.objects.get(parent_task=self.task, deadline=self.task.deadline + datetime.timedelta(days=2))
+        old.tags.clear()
+
+        # Both series get new occurrences in the same batch
+        other.set_recurrence(RecurrenceFrequency.DAILY)
+        RecurrenceRule.materialize_due(horizon=datetime.timedelta(days=4))
+
+        self.assertFalse(old.tags.exists())
+        new = Task.objects.get(parent_task=other, deadline=old.deadline)
+        self.assertEqual([tag.name for tag in new.tags.all()], ['tutoring'])
+
+    def test_recurrence_endpoint(self):
+        """Test setting and reading a recurrence rule through the API"""
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+
+        response = client.put(
+            f'/api/tasks/{self.task.id}/recurrence/',
+            {'frequency': 'MONTHLY', 'interval': 1},
+            format='json'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['data']['frequency'], 'MONTHLY')
+
+        response = client.get(f'/api/tasks/{self.task.id}/recurrence/')
+        self.assertEqual(response.data['data']['interval'], 1)
+
+        response = client.delete(f'/api/tasks/{self.task.id}/recurrence/')
+        self.assertEqual(response.status_code, 200)
+        self.task.refresh_from_db()
+        self.assertFalse(self.task.is_recurring)
@@ -0,0 +1,97 @@
+from django.test import TestCase
+from django.utils import timezone
+import datetime
+import json
+from io import BytesIO
+from rest_framework.renderers import JSONRenderer
+from core.models import RegisteredUser, Task
+from core.api.renderers import FastJSONRenderer
+from core.api.parsers import FastJSONParser
+from core.api.serializers.task_serializers import TaskSerializer
+from core.utils import format_response, stream_format_response
+
+
+class JSONRendererTests(TestCase):
+    """Test cases for the fast JSON renderer, parser and streamed responses"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.user = RegisteredUser.objects.create_user(
+            email='user@example.com',
+            name='Regular',
+            surname='Üser',
+            username='regularuser',
+            phone_number='1234567890',
+            password='password123'
+        )
+
+        for i in range(5):
+            Task.objects.create(
+                title=f'Task {i}',
+                description='Task Description',
+                category='GROCERY_SHOPPING',
+                location='Test Location',
+                deadline=timezone.now() + datetime.timedelta(days=3),
+                creator=self.user
+            )
+
+    def test_render_matches_stdlib(self):
+        """Test fast renderer produces the same document as DRF's renderer"""
+        payload = format_response(
+            status='success',
+            data={
+                'tasks': TaskSerializer(Task.objects.all(), many=True).data,
+                'now': timezone.now()
+            }
+        )
+
+        fast = json.loads(FastJSONRenderer().render(payload))
+        stdlib = json.loads(JSONRenderer().render(payload))
+        self.assertEqual(fast, stdlib)
+
+    def test_render_with_indent(self):
+        """Test indented output is still supported"""
+        rendered = FastJSONRenderer().render(
+            {'status': 'success'},
+            'application/json; indent=4'
+        )
+        self.assertIn(b'\n    "status"', rendered)
+
+    def test_parse(self):
+        """Test parser decodes request bodies"""
+        data = FastJSONParser().parse(BytesIO(b'{"title": "Task", "tags": ["a", "b"]}'))
+        self.assertEqual(data, {'title': 'Task', 'tags': ['a', 'b']})
+
+    def test_stream_format_response(self):
+        """Test streamed list responses match format_response output"""
+        tasks = Task.objects.order_by('id')
+        response = stream_format_response(
+            status='success',
+            key='tasks',
+            queryset=tasks,
+            serializer_class=TaskSerializer,
+            extra={'pagination': {'current_page': 1}},
+            chunk_size=2
+        )
+
+        body = json.loads(b''.join(response.streaming_content))
+        expected = json.loads(JSONRenderer().render(format_response(
+            status='success',
+            data={
+                'tasks': TaskSerializer(tasks, many=True).data,
+                'pagination': {'current_page': 1}
+            }
+        )))
+        self.assertEqual(body, expected)
+
+    def test_stream_format_response_empty(self):
+        """Test streaming an empty queryset produces an empty list"""
+        response = stream_format_response(
+            status='success',
+            key='tasks',
+            queryset=Task.objects.none(),
+            serializer_class=TaskSerializer
+        )
+
+        body = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(body, {'status': 'success', 'data': {'tasks': []}})
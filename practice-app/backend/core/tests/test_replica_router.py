@@ -0,0 +1,247 @@
+from asgiref.sync import async_to_sync, sync_to_async
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+import datetime
+import time
+from rest_framework.test import APIClient
+from core import metrics
+from core.db import routers
+from core.db.routers import ReplicaRouter, replica_reads
+from core.middleware import ReplicaRoutingMiddleware
+from core.models import RegisteredUser, Task, TaskCategory, Search
+
+
+REPLICA_ALIAS = 'replica_1'
+
+
+def add_test_replica():
+    """
+    Add a replica alias mirroring the default database when none is configured
+
+    Runs when the module is imported, before the test databases are created, so
+    the alias gets its own connection to the test database (a second SQLite
+    connection, or a second PostgreSQL connection).
+    """
+    if REPLICA_ALIAS not in connections.settings:
+        connections.settings[REPLICA_ALIAS] = {
+            **connections.settings[DEFAULT_DB_ALIAS],
+            'TEST': {'MIRROR': DEFAULT_DB_ALIAS},
+        }
+        connections.configure_settings(connections.settings)
+
+
+add_test_replica()
+
+
+@override_settings(
+    DATABASE_REPLICAS=['replica_1'],
+    REPLICA_STICKY_SECONDS=5,
+    REPLICA_MAX_LAG_SECONDS=5.0,
+    REPLICA_LAG_CHECK_INTERVAL=60.0
+)
+class ReplicaRouterTests(TestCase):
+    """Test cases for routing reads to read replicas"""
+
+    def setUp(self):
+        """Set up a healthy replica and a user"""
+        routers.reset()
+        routers._health.clear()
+        # Only the routing decision is tested; replica_1 is never connected to
+        routers._health['replica_1'] = (time.monotonic(), True)
+        caches[routers.STICKY_CACHE].clear()
+        metrics.REGISTRY.clear()
+        self.router = ReplicaRouter()
+        self.user = RegisteredUser.objects.create_user(
+            email='user@example.com',
+            name='Test',
+            surname='User',
+            username='testuser',
+            phone_number='1234567890',
+            password='password123'
+        )
+        # Creating the user wrote; start each test like a fresh request
+        routers.reset()
+
+    def tearDown(self):
+        """Forget routing state"""
+        routers.reset()
+        routers._health.clear()
+
+    def test_reads_use_primary_unless_opted_in(self):
+        """Test reads outside a replica block go to the primary"""
+        self.assertEqual(self.router.db_for_read(Task), DEFAULT_DB_ALIAS)
+
+        with replica_reads() as alias:
+            self.assertEqual(alias, 'replica_1')
+            self.assertEqual(self.router.db_for_read(Task), 'replica_1')
+
+        self.assertEqual(self.router.db_for_read(Task), DEFAULT_DB_ALIAS)
+        self.assertEqual(self.router.db_for_write(Task), DEFAULT_DB_ALIAS)
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_no_replicas(self):
+        """Test reads stay on the primary without configured replicas"""
+        with replica_reads() as alias:
+            self.assertEqual(alias, DEFAULT_DB_ALIAS)
+            self.assertEqual(self.router.db_for_read(Task), DEFAULT_DB_ALIAS)
+
+    def test_write_pins_reads_to_primary(self):
+        """Test reads after a write in the same request see the primary"""
+        with replica_reads():
+            self.router.db_for_write(Task)
+            self.assertEqual(self.router.db_for_read(Task), DEFAULT_DB_ALIAS)
+
+        routers.reset()
+        with replica_reads():
+            self.assertEqual(self.router.db_for_read(Task), 'replica_1')
+
+    def test_sticky_user_reads_primary(self):
+        """Test a user who wrote recently reads from the primary"""
+        routers.mark_sticky(self.user)
+
+        with replica_reads(self.user) as alias:
+            self.assertEqual(alias, DEFAULT_DB_ALIAS)
+
+        caches[routers.STICKY_CACHE].delete(routers.sticky_key(self.user.pk))
+        routers.reset()
+        with replica_reads(self.user) as alias:
+            self.assertEqual(alias, 'replica_1')
+
+    def test_unhealthy_replica_falls_back(self):
+        """Test a replica failing its health check is not used"""
+        routers._health['replica_1'] = (time.monotonic(), False)
+
+        with replica_reads() as alias:
+            self.assertEqual(alias, DEFAULT_DB_ALIAS)
+
+    @override_settings(REPLICA_MAX_LAG_SECONDS=-1.0)
+    def test_lag_check(self):
+        """Test a replica over the lag limit is reported unhealthy and counted"""
+        self.assertFalse(routers.is_healthy(DEFAULT_DB_ALIAS))
+        self.assertEqual(
+            metrics.db_replica_fallbacks.get(database=DEFAULT_DB_ALIAS, reason='lag'), 1
+        )
+        # The result is cached for the check interval
+        self.assertFalse(routers.is_healthy(DEFAULT_DB_ALIAS))
+        self.assertEqual(
+            metrics.db_replica_fallbacks.get(database=DEFAULT_DB_ALIAS, reason='lag'), 1
+        )
+
+    def test_search_querysets_use_replica(self):
+        """Test querysets returned by Search are bound to the replica"""
+        self.assertEqual(Search.search_by_keyword('help').db, 'replica_1')
+
+        routers.pin()
+        self.assertEqual(Search.search_by_keyword('help').db, DEFAULT_DB_ALIAS)
+
+    def test_write_request_makes_user_sticky(self):
+        """Test a write request pins the user's following reads to the primary"""
+        task = Task.objects.create(
+            title='Task',
+            description='Description',
+            category=TaskCategory.OTHER,
+            location='Location',
+            deadline=timezone.now() + datetime.timedelta(days=1),
+            creator=self.user
+        )
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+
+        response = client.post('/api/bookmarks/', {'task_id': task.id}, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(routers.is_sticky(self.user))
+
+        # Served from the primary; replica_1 does not exist here
+        response = client.get('/api/bookmarks/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['data']['pagination']['total_records'], 1)
+
+    def test_async_write_request_makes_user_sticky(self):
+        """Test the middleware makes a user sticky when it handles an async view"""
+        async def view(request):
+            await sync_to_async(routers.pin)()
+            return HttpResponse('ok')
+
+        request = RequestFactory().post('/api/test/')
+        request.user = self.user
+        async_to_sync(ReplicaRoutingMiddleware(view))(request)
+
+        self.assertTrue(routers.is_sticky(self.user))
+
+
+@override_settings(
+    DATABASE_REPLICAS=[REPLICA_ALIAS],
+    REPLICA_STICKY_SECONDS=5,
+    REPLICA_MAX_LAG_SECONDS=5.0,
+    REPLICA_LAG_CHECK_INTERVAL=60.0
+)
+class ReplicaDatabaseTests(TransactionTestCase):
+    """Test cases routing requests to a second database connection"""
+
+    # Committed rows are visible to the replica connection
+    databases = {DEFAULT_DB_ALIAS, REPLICA_ALIAS}
+
+    def setUp(self):
+        """Set up a user with a task"""
+        routers.reset()
+        routers._health.clear()
+        caches[routers.STICKY_CACHE].clear()
+        self.user = RegisteredUser.objects.create_user(
+            email='user@example.com',
+            name='Test',
+            surname='User',
+            username='testuser',
+            phone_number='1234567890',
+            password='password123'
+        )
+        self.task = Task.objects.create(
+            title='Task',
+            description='Description',
+            category=TaskCategory.OTHER,
+            location='Location',
+            deadline=timezone.now() + datetime.timedelta(days=1),
+            creator=self.user
+        )
+        routers.reset()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def tearDown(self):
+        """Forget routing state"""
+        routers.reset()
+        routers._health.clear()
+
+    def request(self, method, path, data=None):
+        """Make a request, returning the response and the queries of each database"""
+        with CaptureQueriesContext(connections[DEFAULT_DB_ALIAS]) as primary, \
+                CaptureQueriesContext(connections[REPLICA_ALIAS]) as replica:
+            response = getattr(self.client, method)(path, data, format='json')
+        return response, primary.captured_queries, replica.captured_queries
+
+    def test_reads_go_to_replica(self):
+        """Test list and retrieve actions read from the replica connection"""
+        response, _, replica = self.request('get', '/api/tasks/')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(any('core_task' in query['sql'] for query in replica))
+
+        response, _, replica = self.request('get', f'/api/tasks/{self.task.id}/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['id'], self.task.id)
+        self.assertTrue(any('core_task' in query['sql'] for query in replica))
+
+    def test_writes_stay_on_primary(self):
+        """Test a write goes to the primary and pins the user's next reads there"""
+        response, primary, replica = self.request('post', '/api/bookmarks/', {'task_id': self.task.id})
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(any(query['sql'].startswith('INSERT') for query in primary))
+        self.assertEqual(replica, [])
+
+        # The sticky marker is in the shared cache, so any worker would honor it
+        response, primary, replica = self.request('get', '/api/bookmarks/')
+        self.assertEqual(response.data['data']['pagination']['total_records'], 1)
+        self.assertTrue(any('core_bookmark' in query['sql'] for query in primary))
+        self.assertEqual(replica, [])
@@ -0,0 +1,158 @@
+from django.test import TestCase
+from django.utils import timezone
+import datetime
+from rest_framework.test import APIClient
+from core.models import (
+    RegisteredUser, Administrator, Task, TaskCategory, Comment, Review, Report, ReportTarget, ReportTargetType
+)
+
+
+class ReportTests(TestCase):
+    """Test cases for moderation reports and the admin queue"""
+
+    def setUp(self):
+        """Set up an administrator, an author and two reporters"""
+        self.client = APIClient()
+        self.admin = self.create_user('admin')
+        Administrator.objects.create(user=self.admin)
+        self.author = self.create_user('author')
+        self.reporters = [self.create_user(f'reporter{i}') for i in range(2)]
+        self.task = Task.objects.create(
+            title='Task',
+            description='Description',
+            category=TaskCategory.OTHER,
+            location='Location',
+            deadline=timezone.now() + datetime.timedelta(days=2),
+            creator=self.author
+        )
+        self.comment = Comment.add_comment(user=self.author, task=self.task, content='Rude')
+
+    def create_user(self, name):
+        """Create a user"""
+        return RegisteredUser.objects.create_user(
+            email=f'{name}@example.com',
+            name=name.title(),
+            surname='User',
+            username=name,
+            phone_number='1234567890',
+            password='password123'
+        )
+
+    def test_aggregates_maintained_on_write(self):
+        """Test report counts and the latest report are kept on the target"""
+        first, created = self.reporters[0].report_user(self.author, 'Spam')
+        self.assertTrue(created)
+        second, _ = self.reporters[1].report_user(self.author, 'Abuse')
+
+        target = ReportTarget.objects.get(target_type=ReportTargetType.USER, target_id=self.author.id)
+        self.assertEqual(target.report_count, 2)
+        self.assertEqual(target.user, self.author)
+        self.assertEqual(target.last_reason, 'Abuse')
+        self.assertEqual(target.last_reported_at, second.created_at)
+
+        # Reporting the same target again is not counted
+        report, created = self.reporters[0].report_user(self.author, 'Spam again')
+        self.assertFalse(created)
+        self.assertEqual(report, first)
+        target.refresh_from_db()
+        self.assertEqual(target.report_count, 2)
+
+    def test_content_reports_belong_to_author(self):
+        """Test reports of tasks, comments and reviews are attributed to their authors"""
+        review = Review.objects.create(
+            reviewer=self.author, reviewee=self.reporters[0], task=self.task, score=1, comment='Bad'
+        )
+        self.task.report_task(self.reporters[0], 'Scam')
+        self.comment.report_comment(self.reporters[0], 'Rude')
+        review.report_review(self.reporters[1], 'Unfair')
+
+        targets = ReportTarget.objects.filter(user=self.author)
+        self.assertEqual(
+            set(targets.values_list('target_type', 'target_id')),
+            {('TASK', self.task.id), ('COMMENT', self.comment.id), ('REVIEW', review.id)}
+        )
+
+    def test_report_api(self):
+        """Test filing a report through the API"""
+        self.client.force_authenticate(user=self.reporters[0])
+        data = {'target_type': 'COMMENT', 'target_id': self.comment.id, 'reason': 'Rude'}
+        response = self.client.post('/api/reports/', data)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['data']['target_type'], 'COMMENT')
+
+        response = self.client.post('/api/reports/', data)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Report.objects.count(), 1)
+
+        response = self.client.post('/api/reports/', {**data, 'target_id': 999999})
+        self.assertEqual(response.status_code, 400)
+
+    def test_cannot_report_own_content(self):
+        """Test users cannot report themselves or their own content"""
+        self.client.force_authenticate(user=self.author)
+        for target_type, target_id in (('USER', self.author.id), ('COMMENT', self.comment.id)):
+            response = self.client.post('/api/reports/', {
+                'target_type': target_type, 'target_id': target_id, 'reason': 'Test'
+            })
+            self.assertEqual(response.status_code, 400)
+
+    def test_reported_users_queue(self):
+        """Test reported users are listed most reported first with a cursor"""
+        for reporter in self.reporters:
+            reporter.report_user(self.author, 'Spam')
+        self.reporters[0].report_user(self.reporters[1], 'Spam')
+        self.author.report_user(self.admin, 'Spam')
+        self.client.force_authenticate(user=self.admin)
+
+        response = self.client.get('/api/admin/reported-users/', {'limit': 2})
+        self.assertEqual(response.status_code, 200)
+        users = response.data['data']['users']
+        self.assertEqual(users[0]['user_id'], self.author.id)
+        self.assertEqual(users[0]['reports'], 2)
+        self.assertEqual(users[0]['username'], 'author')
+        cursor = response.data['data']['pagination']['next_cursor']
+        self.assertIsNotNone(cursor)
+
+        response = self.client.get('/api/admin/reported-users/', {'limit': 2, 'cursor': cursor})
+        users = response.data['data']['users']
+        self.assertEqual(len(users), 1)
+        self.assertIsNone(response.data['data']['pagination']['next_cursor'])
+        listed = {self.author.id, users[0]['user_id']}
+        self.assertEqual(len(listed), 2)
+
+    def test_report_queue_by_type(self):
+        """Test the queue lists reported objects of one type"""
+        self.comment.report_comment(self.reporters[0], 'Rude')
+        self.client.force_authenticate(user=self.admin)
+
+        response = self.client.get('/api/admin/reports/', {'type': 'comment'})
+        reports = response.data['data']['reports']
+        self.assertEqual([(r['target_id'], r['report_count']) for r in reports], [(self.comment.id, 1)])
+
+        for params in ({'type': 'photo'}, {'limit': '0'}, {'cursor': 'abc'}):
+            response = self.client.get('/api/admin/reports/', params)
+            self.assertEqual(response.status_code, 400)
+
+    def test_queue_requires_administrator(self):
+        """Test only administrators see the queue"""
+        self.client.force_authenticate(user=self.reporters[0])
+        response = self.client.get('/api/admin/reported-users/')
+        self.assertEqual(response.status_code, 403)
+
+    def test_admin_user_detail(self):
+        """Test the user detail lists reports of the user and of their content"""
+        self.reporters[0].report_user(self.author, 'Spam')
+        self.comment.report_comment(self.reporters[1], 'Rude')
+        self.client.force_authenticate(user=self.admin)
+
+        response = self.client.get(f'/api/admin/users/{self.author.id}/')
+        self.assertEqual(response.status_code, 200)
+        data = response.data['data']
+        self.assertEqual(data['reports'], 1)
+        self.assertEqual(data['flagged_posts'], [{
+            'type': 'COMMENT',
+            'id': self.comment.id,
+            'reports': 1,
+            'last_reported_at': ReportTarget.objects.get(target_type='COMMENT').last_reported_at,
+            'reason': 'Rude'
+        }])
@@ -13,7 +13,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 # Import test modules
 from core.tests.test_user_models import RegisteredUserModelTests, AdministratorModelTests, GuestUserTests
-from core.tests.test_task_models import TaskModelTests, TaskEnumTests
+from core.tests.test_task_models import TaskModelTests, TaskEnumTests, TaskCounterTests
 from core.tests.test_volunteer_models import VolunteerModelTests, VolunteerStatusEnumTests
 from core.tests.test_notification_models import NotificationModelTests, NotificationTypeEnumTests
 from core.tests.test_review_models import ReviewModelTests
@@ -23,6 +23,25 @@ from core.tests.test_photo_models import PhotoModelTests
 from core.tests.test_comment_models import CommentModelTests
 from core.tests.test_feed_class import FeedClassTests
 from core.tests.test_search_class import SearchClassTests
+from core.tests.test_renderers import JSONRendererTests
+from core.tests.test_export_views import ExportViewTests
+from core.tests.test_task_import import TaskImportTests
+from core.tests.test_recurrence_models import RecurrenceRuleModelTests
+from core.tests.test_matching_models import VolunteerCandidateModelTests
+from core.tests.test_notification_queue import NotificationQueueTests
+from core.tests.test_middleware import QueryCountMiddlewareTests
+from core.tests.test_metrics import MetricsTests
+from core.tests.test_benchmarks import LoadDataAndBenchmarkTests
+from core.tests.test_query_counts import QueryCountRegressionTests
+from core.tests.test_db_pool import ConnectionPoolTests, PoolRegistryTests
+from core.tests.test_replica_router import ReplicaRouterTests
+from core.tests.test_async_views import AsyncViewTests
+from core.tests.test_normalized_payloads import NormalizedPayloadTests
+from core.tests.test_permissions import PermissionTests
+from core.tests.test_create_serializers import CreateSerializerQueryTests
+from core.tests.test_tag_suggestions import TagSuggestionTests
+from core.tests.test_comment_threads import CommentThreadTests
+from core.tests.test_reports import ReportTests
 from core.tests.test_integration import TaskWorkflowIntegrationTests
 
 
@@ -38,6 +57,7 @@ def create_test_suite():
     # Task model tests
     test_suite.addTest(unittest.makeSuite(TaskModelTests))
     test_suite.addTest(unittest.makeSuite(TaskEnumTests))
+    test_suite.addTest(unittest.makeSuite(TaskCounterTests))
     
     # Volunteer model tests
     test_suite.addTest(unittest.makeSuite(VolunteerModelTests))
@@ -63,9 +83,37 @@ def create_test_suite():
     # Comment model tests
     test_suite.addTest(unittest.makeSuite(CommentModelTests))
     
+    # Recurrence model tests
+    test_suite.addTest(unittest.makeSuite(RecurrenceRuleModelTests))
+    
+    # Matching model tests
+    test_suite.addTest(unittest.makeSuite(VolunteerCandidateModelTests))
+    
+    # NotificationQueue model tests
+    test_suite.addTest(unittest.makeSuite(NotificationQueueTests))
+    
     # Utility class tests
     test_suite.addTest(unittest.makeSuite(FeedClassTests))
     test_suite.addTest(unittest.makeSuite(SearchClassTests))
+    test_suite.addTest(unittest.makeSuite(JSONRendererTests))
+    test_suite.addTest(unittest.makeSuite(PermissionTests))
+    test_suite.addTest(unittest.makeSuite(ReplicaRouterTests))
+    test_suite.addTest(unittest.makeSuite(ConnectionPoolTests))
+    test_suite.addTest(unittest.makeSuite(PoolRegistryTests))
+    test_suite.addTest(unittest.makeSuite(MetricsTests))
+    test_suite.addTest(unittest.makeSuite(QueryCountMiddlewareTests))
+    
+    # API view tests
+    test_suite.addTest(unittest.makeSuite(ExportViewTests))
+    test_suite.addTest(unittest.makeSuite(TaskImportTests))
+    test_suite.addTest(unittest.makeSuite(LoadDataAndBenchmarkTests))
+    test_suite.addTest(unittest.makeSuite(QueryCountRegressionTests))
+    test_suite.addTest(unittest.makeSuite(AsyncViewTests))
+    test_suite.addTest(unittest.makeSuite(NormalizedPayloadTests))
+    test_suite.addTest(unittest.makeSuite(CreateSerializerQueryTests))
+    test_suite.addTest(unittest.makeSuite(TagSuggestionTests))
+    test_suite.addTest(unittest.makeSuite(CommentThreadTests))
+    test_suite.addTest(unittest.makeSuite(ReportTests))
     
     # Integration tests
     test_suite.addTest(unittest.makeSuite(TaskWorkflowIntegrationTests))
@@ -95,6 +143,8 @@ def run_model_tests():
     test_suite.addTest(unittest.makeSuite(TagModelTests))
     test_suite.addTest(unittest.makeSuite(PhotoModelTests))
     test_suite.addTest(unittest.makeSuite(CommentModelTests))
+    test_suite.addTest(unittest.makeSuite(RecurrenceRuleModelTests))
+    test_suite.addTest(unittest.makeSuite(VolunteerCandidateModelTests))
     
     runner = unittest.TextTestRunner(verbosity=2)
     runner.run(test_suite)
@@ -107,6 +157,13 @@ def run_utility_tests():
     # Add utility class tests
     test_suite.addTest(unittest.makeSuite(FeedClassTests))
     test_suite.addTest(unittest.makeSuite(SearchClassTests))
+    test_suite.addTest(unittest.makeSuite(JSONRendererTests))
+    test_suite.addTest(unittest.makeSuite(PermissionTests))
+    test_suite.addTest(unittest.makeSuite(ReplicaRouterTests))
+    test_suite.addTest(unittest.makeSuite(ConnectionPoolTests))
+    test_suite.addTest(unittest.makeSuite(PoolRegistryTests))
+    test_suite.addTest(unittest.makeSuite(MetricsTests))
+    test_suite.addTest(unittest.makeSuite(QueryCountMiddlewareTests))
     
     runner = unittest.TextTestRunner(verbosity=2)
     runner.run(test_suite)
@@ -177,6 +177,34 @@ class SearchClassTests(TestCase):
         results = Search.search_by_tags([])
         self.assertEqual(results.count(), 0)
 
+    def test_search_by_tags_any_and_exclude(self):
+        """Test OR and NOT tag matching"""
+        # Any of the tags (OR logic)
+        results = Search.search_by_tags([], any_tags=['urgent', 'weekend', 'nonexistent'])
+        self.assertEqual(set(results), {self.task1, self.task2, self.task3})
+        
+        # Excluded tags (NOT logic)
+        results = Search.search_by_tags([], any_tags=['urgent', 'weekend'], exclude_tags=['needs_tools'])
+        self.assertEqual(set(results), {self.task1, self.task2})
+        
+        # Names are case insensitive and a task is listed once
+        results = Search.search_by_tags(['Weekend', 'weekend'], any_tags=['WEEKEND'])
+        self.assertEqual(sorted(task.id for task in results), [self.task1.id, self.task2.id])
+
+    def test_search_by_tags_query_count(self):
+        """Test tag names are resolved once and many tags cost one query"""
+        names = [f'tag{i}' for i in range(6)]
+        for name in names:
+            Tag.objects.create(name=name).add_to_task(self.task2)
+        
+        with self.assertNumQueries(2):
+            results = list(Search.search_by_tags(names, exclude_tags=['urgent']))
+        self.assertEqual(results, [self.task2])
+        
+        # A missing required tag needs no task query
+        with self.assertNumQueries(1):
+            self.assertEqual(list(Search.search_by_tags(names + ['nonexistent'])), [])
+
     def test_search_users(self):
         """Test searching users"""
         # Search by name
@@ -278,6 +306,14 @@ class SearchClassTests(TestCase):
         self.assertEqual(results.count(), 1)
         self.assertEqual(results.first(), self.task3)
         
+        # Search combining AND, OR and NOT tag matching
+        results = Search.complex_search(
+            tags=['weekend'],
+            any_tags=['weekend', 'urgent'],
+            exclude_tags=['needs_tools']
+        )
+        self.assertEqual(list(results), [self.task1, self.task2])
+        
         # Search with no matches
         results = Search.complex_search(
             keywords='nonexistent',
@@ -128,4 +128,21 @@ class TagModelTests(TestCase):
         
         # Create a new tag with mixed case
         tag3 = Tag.create_tag('highPriority')
-        self.assertEqual(tag3.name, 'highpriority')  # Should be lowercase
\ No newline at end of file
+        self.assertEqual(tag3.name, 'highpriority')  # Should be lowercase
+
+    def test_ensure_many(self):
+        """Test getting or creating several tags at once"""
+        tags = Tag.ensure_many(['Urgent', 'weekend', 'WEEKEND', ''])
+        
+        # Existing tag is reused and new ones are created once, lowercase
+        self.assertEqual(set(tags), {'urgent', 'weekend'})
+        self.assertEqual(tags['urgent'].id, self.tag.id)
+        self.assertEqual(Tag.objects.count(), 2)
+        
+        # Empty input needs no queries
+        with self.assertNumQueries(0):
+            self.assertEqual(Tag.ensure_many([]), {})
+        
+        # Existing tags are resolved with a single query
+        with self.assertNumQueries(1):
+            Tag.ensure_many(['urgent', 'weekend'])
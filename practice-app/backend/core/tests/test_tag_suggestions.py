@@ -0,0 +1,143 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+import datetime
+from rest_framework.test import APIClient
+from core.models import (
+    RegisteredUser, Task, TaskCategory, Tag, Bookmark, RecurrenceRule, RecurrenceFrequency
+)
+
+
+class TagSuggestionTests(TestCase):
+    """Test cases for tag usage counts and prefix suggestions"""
+
+    def setUp(self):
+        """Set up a user, tasks and tags used a varying number of times"""
+        cache.clear()
+        self.client = APIClient()
+        self.user = RegisteredUser.objects.create_user(
+            email='user@example.com',
+            name='Regular',
+            surname='User',
+            username='regularuser',
+            phone_number='1234567890',
+            password='password123'
+        )
+        self.tasks = [
+            Task.objects.create(
+                title=f'Task {i}',
+                description='Description',
+                category=TaskCategory.OTHER,
+                location='Location',
+                deadline=timezone.now() + datetime.timedelta(days=2),
+                creator=self.user
+            )
+            for i in range(3)
+        ]
+        self.garden = Tag.objects.create(name='garden')
+        self.gardening = Tag.objects.create(name='gardening')
+        self.groceries = Tag.objects.create(name='groceries')
+        self.plumbing = Tag.objects.create(name='plumbing')
+        for task in self.tasks:
+            self.gardening.add_to_task(task)
+        self.garden.add_to_task(self.tasks[0])
+        self.client.force_authenticate(user=self.user)
+
+    def tearDown(self):
+        """Forget cached suggestions of rolled back tags"""
+        cache.clear()
+
+    def test_usage_counts_follow_links(self):
+        """Test adding and removing tasks and bookmarks keeps usage counts current"""
+        self.gardening.refresh_from_db()
+        self.assertEqual(self.gardening.usage_count, 3)
+
+        bookmark = Bookmark.add_bookmark(user=self.user, task=self.tasks[1])
+        bookmark.add_tag(self.garden)
+        self.garden.refresh_from_db()
+        self.assertEqual(self.garden.usage_count, 2)
+
+        bookmark.remove_tag(self.garden)
+        self.garden.remove_from_task(self.tasks[0])
+        self.garden.refresh_from_db()
+        self.assertEqual(self.garden.usage_count, 0)
+
+    def test_refresh_usage_counts(self):
+        """Test usage counts are repaired with one update"""
+        Tag.objects.update(usage_count=99)
+        with self.assertNumQueries(1):
+            self.assertEqual(Tag.refresh_usage_counts(), 4)
+        counts = dict(Tag.objects.values_list('name', 'usage_count'))
+        self.assertEqual(counts, {'garden': 1, 'gardening': 3, 'groceries': 0, 'plumbing': 0})
+
+        with self.assertNumQueries(0):
+            self.assertEqual(Tag.refresh_usage_counts([]), 0)
+
+    def test_bulk_import_counts_usage(self):
+        """Test tags linked by a bulk import are counted"""
+        Task.bulk_import(self.user, [{
+            'title': 'Imported',
+            'description': 'Description',
+            'category': TaskCategory.OTHER,
+            'location': 'Location',
+            'deadline': timezone.now() + datetime.timedelta(days=2),
+            'tags': ['Plumbing', 'repairs'],
+        }])
+        counts = dict(Tag.objects.filter(name__in=['plumbing', 'repairs']).values_list('name', 'usage_count'))
+        self.assertEqual(counts, {'plumbing': 1, 'repairs': 1})
+
+    def test_removed_bookmark_uncounts_tags(self):
+        """Test removing a bookmark recounts the tags it was linked to"""
+        bookmark = Bookmark.add_bookmark(user=self.user, task=self.tasks[1])
+        bookmark.add_tags(['alpha', 'beta'])
+
+        bookmark.remove_bookmark()
+        counts = dict(Tag.objects.filter(name__in=['alpha', 'beta']).values_list('name', 'usage_count'))
+        self.assertEqual(counts, {'alpha': 0, 'beta': 0})
+
+    def test_recurring_occurrences_count_usage(self):
+        """Test tags copied to materialized occurrences are counted"""
+        self.tasks[0].set_recurrence(RecurrenceFrequency.DAILY)
+
+        RecurrenceRule.materialize_due(horizon=datetime.timedelta(days=4))
+        counts = dict(Tag.objects.filter(name__in=['garden', 'gardening']).values_list('name', 'usage_count'))
+        self.assertEqual(counts, {'garden': 3, 'gardening': 5})
+
+    def test_suggest_ranks_by_usage(self):
+        """Test suggestions match the prefix and list the most used tags first"""
+        names = [tag.name for tag in Tag.suggest('G')]
+        self.assertEqual(names, ['gardening', 'garden', 'groceries'])
+        self.assertEqual([tag.name for tag in Tag.suggest('gard', limit=1)], ['gardening'])
+        self.assertEqual(list(Tag.suggest('x')), [])
+
+    def test_suggestion_endpoint(self):
+        """Test the suggestion endpoint returns ranked tags"""
+        response = self.client.get('/api/tags/suggest/', {'q': 'gar'})
+        self.assertEqual(response.status_code, 200)
+        tags = response.data['data']['tags']
+        self.assertEqual([tag['name'] for tag in tags], ['gardening', 'garden'])
+        self.assertEqual(tags[0]['usage_count'], 3)
+
+        response = self.client.get('/api/tags/suggest/', {'limit': 2})
+        self.assertEqual(len(response.data['data']['tags']), 2)
+
+    def test_invalid_limit(self):
+        """Test an invalid limit is rejected"""
+        for limit in ('0', '51', 'many'):
+            response = self.client.get('/api/tags/suggest/', {'q': 'g', 'limit': limit})
+            self.assertEqual(response.status_code, 400)
+
+    def test_requires_authentication(self):
+        """Test anonymous users get no suggestions"""
+        self.client.force_authenticate(user=None)
+        response = self.client.get('/api/tags/suggest/', {'q': 'g'})
+        self.assertEqual(response.status_code, 401)
+
+    @override_settings(TAG_SUGGESTION_CACHE_SECONDS=60)
+    def test_suggestions_are_cached(self):
+        """Test repeated prefixes are answered from the cache"""
+        self.client.get('/api/tags/suggest/', {'q': 'gar'})
+        Tag.objects.create(name='garage')
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/tags/suggest/', {'q': 'Gar'})
+        self.assertNotIn('garage', [tag['name'] for tag in response.data['data']['tags']])
@@ -0,0 +1,121 @@
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+import datetime
+import io
+import json
+import os
+import tempfile
+from rest_framework.test import APIClient
+from core.models import RegisteredUser, Task, Tag
+
+
+class TaskImportTests(TestCase):
+    """Test cases for bulk task import"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.user = RegisteredUser.objects.create_user(
+            email='partner@example.com',
+            name='Community',
+            surname='Partner',
+            username='partner',
+            phone_number='1234567890',
+            password='password123'
+        )
+        self.deadline = (timezone.now() + datetime.timedelta(days=3)).isoformat()
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def make_row(self, title, **kwargs):
+        """Build a valid import row"""
+        row = {
+            'title': title,
+            'description': 'Imported task',
+            'category': 'GROCERY_SHOPPING',
+            'location': 'Test Location',
+            'deadline': self.deadline,
+        }
+        row.update(kwargs)
+        return row
+
+    def test_bulk_import_model_method(self):
+        """Test Task.bulk_import inserts tasks and tag links in chunks"""
+        rows = [
+            {'title': f'Task {i}', 'description': 'Imported', 'location': 'Here',
+             'deadline': timezone.now() + datetime.timedelta(days=1),
+             'tags': ['Urgent', 'weekend']}
+            for i in range(5)
+        ]
+
+        created, failed = Task.bulk_import(self.user, rows, chunk_size=2)
+
+        self.assertEqual(len(created), 5)
+        self.assertEqual(failed, [])
+        self.assertEqual(Task.objects.filter(creator=self.user).count(), 5)
+        self.assertEqual(Tag.objects.count(), 2)
+        self.assertEqual(Tag.objects.get(name='urgent').tasks.count(), 5)
+
+    def test_import_endpoint_reports_row_errors(self):
+        """Test invalid rows are reported without aborting the import"""
+        rows = [
+            self.make_row('First', tags=['urgent']),
+            self.make_row('Bad deadline', deadline=(timezone.now() - datetime.timedelta(days=1)).isoformat()),
+            self.make_row('Third', volunteer_number=0),
+            self.make_row('Fourth'),
+        ]
+
+        response = self.client.post('/api/tasks/import/', {'tasks': rows}, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        data = response.data['data']
+        self.assertEqual(data['created'], 2)
+        self.assertEqual(data['failed'], 2)
+        self.assertEqual([error['row'] for error in data['errors']], [2, 3])
+        self.assertIn('deadline', data['errors'][0]['errors'])
+        self.assertEqual(
+            sorted(Task.objects.values_list('title', flat=True)),
+            ['First', 'Fourth']
+        )
+
+    def test_import_endpoint_all_rows_invalid(self):
+        """Test an import with no valid rows is rejected"""
+        response = self.client.post(
+            '/api/tasks/import/', {'tasks': [{'title': 'Missing fields'}]}, format='json'
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Task.objects.count(), 0)
+
+    def test_import_tasks_command_csv(self):
+        """Test importing tasks from a CSV file"""
+        content = (
+            'title,description,category,location,deadline,urgency_level,tags\n'
+            f'CSV One,Imported,TUTORING,Here,{self.deadline},2,"math, weekend"\n'
+            f'CSV Two,Imported,OTHER,There,{self.deadline},,\n'
+            'CSV Bad,Imported,NOT_A_CATEGORY,There,,,\n'
+        )
+        path = os.path.join(tempfile.mkdtemp(), 'tasks.csv')
+        with open(path, 'w') as f:
+            f.write(content)
+
+        out, err = io.StringIO(), io.StringIO()
+        call_command('import_tasks', path, creator=self.user.email, stdout=out, stderr=err)
+
+        self.assertIn('Imported 2 tasks, 1 rows failed.', out.getvalue())
+        self.assertIn('Row 3', err.getvalue())
+        self.assertEqual(Task.objects.get(title='CSV One').tags.count(), 2)
+        self.assertEqual(Task.objects.get(title='CSV Two').urgency_level, 0)
+
+    def test_import_tasks_command_json(self):
+        """Test importing tasks from a JSON file"""
+        path = os.path.join(tempfile.mkdtemp(), 'tasks.json')
+        with open(path, 'w') as f:
+            json.dump([self.make_row('JSON One'), self.make_row('JSON Two')], f)
+
+        out = io.StringIO()
+        call_command('import_tasks', path, creator=self.user.email, stdout=out)
+
+        self.assertIn('Imported 2 tasks, 0 rows failed.', out.getvalue())
+        self.assertEqual(Task.objects.filter(creator=self.user).count(), 2)
@@ -1,7 +1,15 @@
-from django.test import TestCase
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
 from django.utils import timezone
+from io import StringIO
 import datetime
-from core.models import RegisteredUser, Task, TaskCategory, TaskStatus
+import shutil
+import tempfile
+from core.api.serializers.task_serializers import TaskSerializer
+from core.models import (
+    RegisteredUser, Task, TaskCategory, TaskStatus, Comment, Volunteer, Bookmark, Photo
+)
 
 
 class TaskModelTests(TestCase):
@@ -187,4 +195,135 @@ class TaskEnumTests(TestCase):
         # Test choices format
         choices = TaskCategory.choices
         self.assertTrue(('GROCERY_SHOPPING', 'Grocery Shopping') in choices)
-        self.assertTrue(('HOME_REPAIR', 'Home Repair') in choices)
\ No newline at end of file
+        self.assertTrue(('HOME_REPAIR', 'Home Repair') in choices)
+
+
+class TaskCounterTests(TestCase):
+    """Test cases for the denormalized Task counters"""
+
+    def setUp(self):
+        """Set up a task and a second user"""
+        self.creator = RegisteredUser.objects.create_user(
+            email='creator@example.com',
+            name='Creator',
+            surname='User',
+            username='creatoruser',
+            phone_number='1234567890',
+            password='password123'
+        )
+        self.user = RegisteredUser.objects.create_user(
+            email='user@example.com',
+            name='Other',
+            surname='User',
+            username='otheruser',
+            phone_number='0987654321',
+            password='password456'
+        )
+        self.task = Task.objects.create(
+            title='Test Task',
+            description='Task Description',
+            category=TaskCategory.OTHER,
+            location='Test Location',
+            deadline=timezone.now() + datetime.timedelta(days=3),
+            creator=self.creator
+        )
+
+    def assert_counts(self, comments=0, volunteers=0, bookmarks=0, photos=0):
+        """Assert the stored counters of the task"""
+        task = Task.objects.get(id=self.task.id)
+        self.assertEqual(
+            (task.comment_count, task.volunteer_count, task.bookmark_count, task.photo_count),
+            (comments, volunteers, bookmarks, photos)
+        )
+
+    def test_comment_counter(self):
+        """Test adding and deleting comments updates the count"""
+        comment = Comment.add_comment(user=self.user, task=self.task, content='First')
+        Comment.add_comment(user=self.user, task=self.task, content='Second')
+        # The task passed in is kept in step
+        self.assertEqual(self.task.comment_count, 2)
+        self.assert_counts(comments=2)
+
+        comment.delete_comment()
+        self.assert_counts(comments=1)
+
+    def test_volunteer_counter(self):
+        """Test volunteering and withdrawing updates the count once"""
+        volunteer = Volunteer.volunteer_for_task(user=self.user, task=self.task)
+        Volunteer.volunteer_for_task(user=self.user, task=self.task)
+        self.assert_counts(volunteers=1)
+
+        volunteer.withdraw_volunteer()
+        volunteer.withdraw_volunteer()
+        self.assert_counts(volunteers=0)
+
+    def test_concurrent_withdrawals_count_once(self):
+        """Test two loaded copies of a volunteer withdrawing decrement the count once"""
+        volunteer = Volunteer.volunteer_for_task(user=self.user, task=self.task)
+        copy = Volunteer.objects.get(id=volunteer.id)
+
+        volunteer.withdraw_volunteer()
+        copy.withdraw_volunteer()
+        self.assert_counts(volunteers=0)
+
+    def test_bookmark_counter(self):
+        """Test adding and removing bookmarks updates the count"""
+        bookmark = Bookmark.add_bookmark(user=self.user, task=self.task)
+        Bookmark.add_bookmark(user=self.user, task=self.task)
+        self.assert_counts(bookmarks=1)
+
+        bookmark.remove_bookmark()
+        self.assert_counts(bookmarks=0)
+
+    def test_photo_counter(self):
+        """Test uploading and deleting photos updates the count"""
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        image = SimpleUploadedFile(
+            name='photo.gif',
+            content=b'GIF87a\x01\x00\x01\x00\x80\x01\x00\x00\x00\x00ccc,\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;',
+            content_type='image/gif'
+        )
+        with override_settings(MEDIA_ROOT=media_root):
+            photo = Photo.upload_photo(task=self.task, image_file=image)
+            self.assert_counts(photos=1)
+
+            photo.delete_photo()
+            self.assert_counts(photos=0)
+
+    def test_stale_save_keeps_counters(self):
+        """Test saving an instance loaded earlier does not overwrite newer counts"""
+        stale = Task.objects.get(id=self.task.id)
+        Comment.add_comment(user=self.user, task=self.task, content='Hello')
+
+        stale.title = 'Renamed'
+        stale.save()
+        self.assert_counts(comments=1)
+        self.assertEqual(Task.objects.get(id=self.task.id).title, 'Renamed')
+
+    def test_recount_counters(self):
+        """Test drifted counters are repaired by the recount command"""
+        Comment.add_comment(user=self.user, task=self.task, content='Hello')
+        volunteer = Volunteer.volunteer_for_task(user=self.user, task=self.task)
+        Volunteer.objects.filter(id=volunteer.id).update(status='WITHDRAWN')
+        Comment.objects.all().delete()
+        Bookmark.objects.create(user=self.user, task=self.task)
+        self.assert_counts(comments=1, volunteers=1)
+
+        out = StringIO()
+        call_command('recount_task_counters', stdout=out)
+        self.assertIn('Recounted counters of 1 tasks.', out.getvalue())
+        self.assert_counts(bookmarks=1)
+
+        # Nothing left to fix
+        self.assertEqual(Task.recount_counters(), 0)
+
+    def test_serialized_without_queries(self):
+        """Test the counters are serialized from the task row"""
+        Comment.add_comment(user=self.user, task=self.task, content='Hello')
+        task = Task.objects.select_related('creator', 'assignee').get(id=self.task.id)
+
+        with self.assertNumQueries(0):
+            data = TaskSerializer(task).data
+        self.assertEqual(data['comment_count'], 1)
+        self.assertEqual(data['photo_count'], 0)
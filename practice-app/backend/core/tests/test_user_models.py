@@ -1,5 +1,6 @@
 from django.test import TestCase
 from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
 from core.models import RegisteredUser, Administrator
 
 
@@ -96,6 +97,29 @@ class RegisteredUserModelTests(TestCase):
         updated_user = RegisteredUser.objects.get(id=self.user.id)
         self.assertEqual(updated_user.completed_task_count, initial_count + 1)
 
+    def test_notification_digest_only_shown_to_self(self):
+        """Test the digest preference is only in the user's own profile"""
+        other = RegisteredUser.objects.create_user(
+            email='other@example.com',
+            name='Other',
+            surname='User',
+            username='otheruser',
+            phone_number='1234567890',
+            password='testpassword123'
+        )
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+
+        response = client.get(f'/api/users/{self.user.id}/')
+        self.assertIn('notification_digest', response.data)
+
+        response = client.get(f'/api/users/{other.id}/')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('notification_digest', response.data)
+
+        response = client.patch(f'/api/users/{self.user.id}/', {'notification_digest': True}, format='json')
+        self.assertTrue(response.data['data']['notification_digest'])
+
 
 class AdministratorModelTests(TestCase):
     """Test cases for the Administrator model"""
@@ -23,6 +23,108 @@ def format_response(status, message=None, data=None):
     return response
 
 
+def stream_format_response(status, key, queryset, serializer_class, extra=None,
+                           message=None, chunk_size=500):
+    """
+    Stream a list response with the same structure as format_response
+
+    The list under data[key] is serialized and written chunk by chunk, so
+    the full payload is never held in memory at once.
+
+    Args:
+        status (str): 'success' or 'error'
+        key (str): Key of the streamed list inside 'data'
+        queryset: QuerySet (or sliced QuerySet) of objects to serialize
+        serializer_class: Serializer used for each chunk of objects
+        extra (dict, optional): Additional keys to include in 'data'
+        message (str, optional): Response message
+        chunk_size (int): Number of rows fetched and serialized per chunk
+
+    Returns:
+        StreamingHttpResponse: Response yielding JSON bytes
+    """
+    from django.http import StreamingHttpResponse
+    from core.api.renderers import json_dumps
+
+    def generate():
+        head = {'status': status}
+        if message:
+            head['message'] = message
+        # Drop the closing brace so the streamed 'data' object can follow
+        yield json_dumps(head)[:-1] + b',"data":{'
+
+        for name, value in (extra or {}).items():
+            yield json_dumps(name) + b':' + json_dumps(value) + b','
+
+        yield json_dumps(key) + b':['
+        first = True
+        chunk = []
+        for obj in queryset.iterator(chunk_size=chunk_size):
+            chunk.append(obj)
+            if len(chunk) >= chunk_size:
+                yield (b'' if first else b',') + json_dumps(serializer_class(chunk, many=True).data)[1:-1]
+                first = False
+                chunk = []
+        if chunk:
+            yield (b'' if first else b',') + json_dumps(serializer_class(chunk, many=True).data)[1:-1]
+        yield b']}}'
+
+    return StreamingHttpResponse(generate(), content_type='application/json')
+
+
+EXPORT_FORMATS = ('ndjson', 'csv')
+
+
+def stream_export_response(queryset, fields, file_format, filename, chunk_size=2000):
+    """
+    Stream queryset rows as an NDJSON or CSV file download
+
+    Rows are read with a server-side cursor as plain values, so exports run
+    in constant memory regardless of the number of rows.
+
+    Args:
+        queryset: QuerySet of rows to export
+        fields (list): Field names to export, in column order
+        file_format (str): 'ndjson' or 'csv'
+        filename (str): Download file name without extension
+        chunk_size (int): Number of rows fetched from the cursor at a time
+
+    Returns:
+        StreamingHttpResponse: Response yielding the exported file
+    """
+    import csv
+    from django.http import StreamingHttpResponse
+    from core.api.renderers import json_dumps
+
+    rows = queryset.values(*fields).iterator(chunk_size=chunk_size)
+
+    class Echo:
+        """File-like object that returns written values instead of buffering them"""
+        def write(self, value):
+            return value
+
+    def generate_csv():
+        writer = csv.writer(Echo())
+        yield writer.writerow(fields)
+        for row in rows:
+            yield writer.writerow([
+                value.isoformat() if hasattr(value, 'isoformat') else value
+                for value in (row[field] for field in fields)
+            ])
+
+    def generate_ndjson():
+        for row in rows:
+            yield json_dumps(row) + b'\n'
+
+    if file_format == 'csv':
+        response = StreamingHttpResponse(generate_csv(), content_type='text/csv')
+    else:
+        response = StreamingHttpResponse(generate_ndjson(), content_type='application/x-ndjson')
+
+    response['Content-Disposition'] = f'attachment; filename="{filename}.{file_format}"'
+    return response
+
+
 def custom_exception_handler(exc, context):
     """
     Custom exception handler for consistent error responses.
@@ -143,22 +245,36 @@ def paginate_results(queryset, page=1, items_per_page=20):
     # Get paginated data
     data = queryset[start:end]
     
+    return {
+        'data': data,
+        'pagination': build_pagination(total_count, page, items_per_page)
+    }
+
+
+def build_pagination(total_count, page=1, items_per_page=20):
+    """
+    Build pagination metadata for a page of results
+    
+    Args:
+        total_count (int): Total number of results
+        page (int): Page number (1-based)
+        items_per_page (int): Number of items per page
+        
+    Returns:
+        dict: Pagination metadata
+    """
+    page = max(1, page)
+    
     # Calculate total pages
     total_pages = (total_count + items_per_page - 1) // items_per_page
     
-    # Prepare pagination metadata
-    pagination = {
+    return {
         'total_records': total_count,
         'current_page': page,
         'total_pages': total_pages,
         'next_page': page + 1 if page < total_pages else None,
         'prev_page': page - 1 if page > 1 else None
     }
-    
-    return {
-        'data': data,
-        'pagination': pagination
-    }
 
 
 def generate_token(length=32):
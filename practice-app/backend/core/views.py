@@ -1,3 +1,26 @@
-from django.shortcuts import render
+import hmac
 
-# Create your views here.
+from django.conf import settings
+from django.http import HttpResponse
+from django.views.decorators.http import require_GET
+
+from core.metrics import REGISTRY
+
+
+@require_GET
+def metrics_view(request):
+    """
+    Serve the in-process metrics in the Prometheus text format
+
+    Scrapers authenticate with the METRICS_TOKEN bearer token. Without a
+    token the endpoint is only open when DEBUG is on.
+    """
+    token = settings.METRICS_TOKEN
+    if token:
+        expected = f'Bearer {token}'
+        if not hmac.compare_digest(request.headers.get('Authorization', ''), expected):
+            return HttpResponse('Unauthorized', status=401, content_type='text/plain')
+    elif not settings.DEBUG:
+        return HttpResponse('Forbidden: METRICS_TOKEN is not set', status=403, content_type='text/plain')
+
+    return HttpResponse(REGISTRY.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
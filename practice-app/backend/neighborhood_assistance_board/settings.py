@@ -60,11 +60,103 @@ REST_FRAMEWORK = {
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
+    # Use orjson for JSON bodies when it is installed (falls back to stdlib json)
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.api.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'core.api.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+}
+
+# List responses with a page size above this are streamed instead of rendered at once
+API_STREAMING_THRESHOLD = int(os.environ.get('API_STREAMING_THRESHOLD', 500))
+
+# Rows fetched per server-side cursor round trip by the export endpoints
+EXPORT_CHUNK_SIZE = int(os.environ.get('EXPORT_CHUNK_SIZE', 2000))
+
+# Bulk task import limits (rows per request and rows inserted per transaction)
+TASK_IMPORT_MAX_ROWS = int(os.environ.get('TASK_IMPORT_MAX_ROWS', 5000))
+TASK_IMPORT_CHUNK_SIZE = int(os.environ.get('TASK_IMPORT_CHUNK_SIZE', 500))
+
+# Recurring task occurrences are created this many days ahead, in batches of rules
+RECURRENCE_HORIZON_DAYS = int(os.environ.get('RECURRENCE_HORIZON_DAYS', 14))
+RECURRENCE_BATCH_SIZE = int(os.environ.get('RECURRENCE_BATCH_SIZE', 500))
+
+# Number of best matching volunteers notified when a task is created
+MATCH_NOTIFY_TOP_K = int(os.environ.get('MATCH_NOTIFY_TOP_K', 10))
+
+# Notification dispatch: 'sync' inserts inside the request, 'outbox' writes to the
+# outbox table for process_notification_outbox, 'memory' batches in a background thread
+NOTIFICATION_DISPATCH_MODE = os.environ.get('NOTIFICATION_DISPATCH_MODE', 'sync')
+NOTIFICATION_QUEUE_MAX_SIZE = int(os.environ.get('NOTIFICATION_QUEUE_MAX_SIZE', 10000))
+NOTIFICATION_BATCH_SIZE = int(os.environ.get('NOTIFICATION_BATCH_SIZE', 500))
+NOTIFICATION_FLUSH_INTERVAL = float(os.environ.get('NOTIFICATION_FLUSH_INTERVAL', 1.0))
+NOTIFICATION_MAX_ATTEMPTS = int(os.environ.get('NOTIFICATION_MAX_ATTEMPTS', 5))
+# Seconds to wait at exit for an in-flight flush before spilling the queue to the outbox
+NOTIFICATION_SHUTDOWN_TIMEOUT = float(os.environ.get('NOTIFICATION_SHUTDOWN_TIMEOUT', 10.0))
+# Outbox entries failing this many times are marked FAILED instead of retried
+NOTIFICATION_OUTBOX_MAX_ATTEMPTS = int(os.environ.get('NOTIFICATION_OUTBOX_MAX_ATTEMPTS', 10))
+# Optional dotted path to a callable receiving each delivered batch of notifications
+NOTIFICATION_PUSH_BACKEND = os.environ.get('NOTIFICATION_PUSH_BACKEND') or None
+
+# Seconds an unread notification keeps absorbing same-type events for its task;
+# users who opt into digests use the longer digest window
+NOTIFICATION_COALESCE_WINDOW = int(os.environ.get('NOTIFICATION_COALESCE_WINDOW', 3600))
+NOTIFICATION_DIGEST_WINDOW = int(os.environ.get('NOTIFICATION_DIGEST_WINDOW', 86400))
+
+# Read notifications older than this many days move to the archive table; archived
+# notifications are deleted after NOTIFICATION_ARCHIVE_RETENTION_DAYS (0 keeps them)
+NOTIFICATION_RETENTION_DAYS = int(os.environ.get('NOTIFICATION_RETENTION_DAYS', 90))
+NOTIFICATION_ARCHIVE_RETENTION_DAYS = int(os.environ.get('NOTIFICATION_ARCHIVE_RETENTION_DAYS', 0))
+NOTIFICATION_ARCHIVE_BATCH_SIZE = int(os.environ.get('NOTIFICATION_ARCHIVE_BATCH_SIZE', 1000))
+
+# Per-request query instrumentation (core.middleware.QueryCountMiddleware). Requests
+# over the count/time thresholds, or repeating one statement QUERY_DUPLICATE_THRESHOLD
+# times, are logged as warnings; X-Query-* headers are added when DEBUG is on
+QUERY_INSTRUMENTATION_ENABLED = bool(int(os.environ.get('QUERY_INSTRUMENTATION_ENABLED', 1)))
+QUERY_COUNT_WARNING_THRESHOLD = int(os.environ.get('QUERY_COUNT_WARNING_THRESHOLD', 30))
+QUERY_TIME_WARNING_MS = int(os.environ.get('QUERY_TIME_WARNING_MS', 500))
+QUERY_DUPLICATE_THRESHOLD = int(os.environ.get('QUERY_DUPLICATE_THRESHOLD', 5))
+QUERY_SLOWEST_COUNT = int(os.environ.get('QUERY_SLOWEST_COUNT', 3))
+
+# Async composite endpoints (core.api.views.async_views) load the pieces of a page in
+# parallel worker threads, one database connection each; 0 loads them one by one
+ASYNC_PARALLEL_QUERIES = bool(int(os.environ.get('ASYNC_PARALLEL_QUERIES', 1)))
+
+# Bearer token required to scrape /metrics; when empty the endpoint is only served with DEBUG on
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+
+# Stored results of the run_benchmarks command, compared against with --compare
+BENCHMARK_BASELINE_PATH = os.environ.get(
+    'BENCHMARK_BASELINE_PATH', os.path.join(BASE_DIR, 'benchmarks', 'baseline.json')
+)
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'core': {
+            'handlers': ['console'],
+            'level': os.environ.get('CORE_LOG_LEVEL', 'WARNING'),
+        },
+    },
 }
 
 # Modify middleware to disable CSRF
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.MetricsMiddleware',
+    'core.middleware.QueryCountMiddleware',
+    'core.middleware.ReplicaRoutingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     # Comment out CSRF middleware to disable CSRF protection for API endpoints
@@ -99,17 +191,73 @@ WSGI_APPLICATION = 'neighborhood_assistance_board.wsgi.application'
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
 # Docker için veritabanı yapılandırması
+# Connection reuse: each thread keeps its connection for DATABASE_CONN_MAX_AGE seconds
+# (0 reconnects on every request), checking it is alive before reusing it. With
+# DATABASE_POOL_ENABLED the threads of each worker process share a pool of at most
+# DATABASE_POOL_MAX_SIZE connections instead, waiting up to DATABASE_POOL_TIMEOUT
+# seconds for a free one (see core.db.postgresql)
+DATABASE_CONN_MAX_AGE = int(os.environ.get('DATABASE_CONN_MAX_AGE', 60))
+DATABASE_CONN_HEALTH_CHECKS = bool(int(os.environ.get('DATABASE_CONN_HEALTH_CHECKS', 1)))
+DATABASE_POOL_ENABLED = bool(int(os.environ.get('DATABASE_POOL_ENABLED', 0)))
+DATABASE_POOL_MIN_SIZE = int(os.environ.get('DATABASE_POOL_MIN_SIZE', 0))
+DATABASE_POOL_MAX_SIZE = int(os.environ.get('DATABASE_POOL_MAX_SIZE', 10))
+DATABASE_POOL_TIMEOUT = float(os.environ.get('DATABASE_POOL_TIMEOUT', 10.0))
+DATABASE_POOL_MAX_IDLE = float(os.environ.get('DATABASE_POOL_MAX_IDLE', 300.0))
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql',
+        'ENGINE': 'core.db.postgresql',
         'NAME': os.environ.get('DATABASE_NAME', 'neighborhood_assistance'),
         'USER': os.environ.get('DATABASE_USER', 'postgres'),
         'PASSWORD': os.environ.get('DATABASE_PASSWORD', 'postgres'),
         'HOST': os.environ.get('DATABASE_HOST', 'db'),
         'PORT': os.environ.get('DATABASE_PORT', '5432'),
+        # Pooled connections go back to the pool at the end of each request
+        'CONN_MAX_AGE': 0 if DATABASE_POOL_ENABLED else DATABASE_CONN_MAX_AGE,
+        'CONN_HEALTH_CHECKS': DATABASE_CONN_HEALTH_CHECKS,
+        # Required behind PgBouncer in transaction pooling mode
+        'DISABLE_SERVER_SIDE_CURSORS': bool(int(os.environ.get('DATABASE_DISABLE_SERVER_SIDE_CURSORS', 0))),
+    }
+}
+if DATABASE_POOL_ENABLED:
+    DATABASES['default']['POOL'] = {
+        'MIN_SIZE': DATABASE_POOL_MIN_SIZE,
+        'MAX_SIZE': DATABASE_POOL_MAX_SIZE,
+        'TIMEOUT': DATABASE_POOL_TIMEOUT,
+        'MAX_IDLE': DATABASE_POOL_MAX_IDLE,
     }
+
+# Read replicas: comma-separated hosts of PostgreSQL streaming replicas of 'default'.
+# ViewSet list/retrieve actions, Feed and Search read from them (core.db.routers);
+# users who wrote within REPLICA_STICKY_SECONDS, and replicas lagging more than
+# REPLICA_MAX_LAG_SECONDS (checked every REPLICA_LAG_CHECK_INTERVAL seconds), read
+# from the primary. Stickiness is stored in the 'shared' cache (see CACHES)
+DATABASE_REPLICA_HOSTS = [host for host in os.environ.get('DATABASE_REPLICA_HOSTS', '').split(',') if host]
+for index, host in enumerate(DATABASE_REPLICA_HOSTS, start=1):
+    DATABASES[f'replica_{index}'] = {**DATABASES['default'], 'HOST': host, 'TEST': {'MIRROR': 'default'}}
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != 'default']
+DATABASE_ROUTERS = ['core.db.routers.ReplicaRouter']
+REPLICA_STICKY_SECONDS = int(os.environ.get('REPLICA_STICKY_SECONDS', 5))
+REPLICA_MAX_LAG_SECONDS = float(os.environ.get('REPLICA_MAX_LAG_SECONDS', 5.0))
+REPLICA_LAG_CHECK_INTERVAL = float(os.environ.get('REPLICA_LAG_CHECK_INTERVAL', 5.0))
+
+# 'default' is local to each worker process and only holds values that may be briefly
+# stale. 'shared' is seen by all workers (e.g. replica stickiness); it defaults to a
+# database table created with `manage.py createcachetable`
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'shared': {
+        'BACKEND': os.environ.get('SHARED_CACHE_BACKEND', 'django.core.cache.backends.db.DatabaseCache'),
+        'LOCATION': os.environ.get('SHARED_CACHE_LOCATION', 'core_shared_cache'),
+    },
 }
 
+# Seconds tag suggestions for a prefix are cached; usage counts change slowly
+# and a few stale rankings are harmless while typing
+TAG_SUGGESTION_CACHE_SECONDS = int(os.environ.get('TAG_SUGGESTION_CACHE_SECONDS', 60))
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -16,6 +16,25 @@ python manage.py test \
   core.tests.test_comment_models \
   core.tests.test_feed_class \
   core.tests.test_search_class \
+  core.tests.test_renderers \
+  core.tests.test_export_views \
+  core.tests.test_task_import \
+  core.tests.test_recurrence_models \
+  core.tests.test_matching_models \
+  core.tests.test_notification_queue \
+  core.tests.test_middleware \
+  core.tests.test_metrics \
+  core.tests.test_benchmarks \
+  core.tests.test_query_counts \
+  core.tests.test_db_pool \
+  core.tests.test_replica_router \
+  core.tests.test_async_views \
+  core.tests.test_normalized_payloads \
+  core.tests.test_permissions \
+  core.tests.test_create_serializers \
+  core.tests.test_tag_suggestions \
+  core.tests.test_comment_threads \
+  core.tests.test_reports \
   core.tests.test_integration > "$OUTPUT_FILE" 2>&1
 
 # Test sonuçlarını kontrol et
@@ -0,0 +1,30 @@
+#!/bin/bash
+
+# Start the web server. SERVER_MODE selects how Django is served:
+#   dev  - Django's development server (default)
+#   wsgi - gunicorn with threaded sync workers
+#   asgi - gunicorn with uvicorn workers; async views don't hold a thread while waiting
+
+set -e
+
+mode="${SERVER_MODE:-dev}"
+bind="${BIND:-0.0.0.0:8000}"
+workers="${WEB_CONCURRENCY:-2}"
+
+case "$mode" in
+  dev)
+    exec python manage.py runserver "$bind"
+    ;;
+  wsgi)
+    exec gunicorn neighborhood_assistance_board.wsgi:application \
+      --bind "$bind" --workers "$workers" --threads "${WEB_THREADS:-4}"
+    ;;
+  asgi)
+    exec gunicorn neighborhood_assistance_board.asgi:application \
+      --bind "$bind" --workers "$workers" -k uvicorn.workers.UvicornWorker
+    ;;
+  *)
+    >&2 echo "Unknown SERVER_MODE '$mode' (expected dev, wsgi or asgi)"
+    exit 1
+    ;;
+esac